@@ -5,7 +5,7 @@ LangGraph 기반 Multi-Agent 시스템
 from agents.state import ISPLState, create_initial_state
 from agents.router_agent import router_agent, router_node
 from agents.search_agent import search_agent, search_node
-from agents.answer_agent import answer_agent, answer_node
+from agents.answer_agent import answer_node, get_answer_agent
 from agents.processing_agent import processing_agent, processing_node
 from agents.management_agent import management_agent, management_node
 from agents.graph import get_graph, run_graph, stream_graph
@@ -17,8 +17,8 @@ __all__ = [
     "router_node",
     "search_agent",
     "search_node",
-    "answer_agent",
     "answer_node",
+    "get_answer_agent",
     "processing_agent",
     "processing_node",
     "management_agent",
@@ -2,88 +2,67 @@
 Answer Agent
 검색 결과를 바탕으로 GPT-4를 사용하여 답변을 생성합니다.
 """
+import asyncio
 import logging
-from openai import AsyncOpenAI
+import re
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from langchain_core.runnables import RunnableConfig
 
 from agents.state import ISPLState
-from core.config import settings
 from core.database import AsyncSessionLocal
-from services.answer_validator import AnswerValidator
+from core.tokenizer import get_encoding_for_model
+from models.answer_validation import AnswerValidation
+from services.answer_cache import answer_cache_service
+from services.popular_chunks import popular_chunk_service
+from services.service_container import (
+    get_answer_validator,
+    get_embedding_service,
+    get_openai_batch_service,
+    get_openai_client
+)
 
 logger = logging.getLogger(__name__)
 
+# 불충분 표시 줄의 참조 번호 추출 패턴
+_REFERENCE_NUMBER_RE = re.compile(r'\d+')
+
+
+class _InsufficientContext(Exception):
+    """답변 생성 시도가 컨텍스트 불충분을 표시한 경우 (나머지 시도 중단용)"""
+
 
 class AnswerAgent:
     """검색 결과를 기반으로 답변을 생성하는 Agent"""
     
     MODEL = "gpt-4o"  # gpt-4o: 128K 토큰 컨텍스트 (이전: gpt-4 8K 토큰)
+    # 시도별 모델: 첫 시도는 gpt-4o-mini, 검증 실패 시 gpt-4o로 승격
+    MODELS = ("gpt-4o-mini", "gpt-4o", "gpt-4o")
     TEMPERATURE = 0.1  # 정확한 답변을 위해 낮은 temperature
     MAX_TOKENS = 1000
-    MAX_ATTEMPTS = 3  # 최초 1회 + 재생성 2회
+    MAX_ATTEMPTS = len(MODELS)  # 최초 1회 + 재생성 2회
+    # 답변 캐시 키의 모델 구분값 (시도별 모델 구성이 바뀌면 기존 캐시를 재사용하지 않음)
+    CACHE_MODEL_KEY = "/".join(dict.fromkeys(MODELS))
+    SPECULATIVE_ATTEMPTS = 2  # 동시에 진행할 수 있는 최대 시도 수 (토큰 비용 상한: 1회 시도의 2배)
+    SPECULATIVE_DELAY = 8.0  # 진행 중인 시도가 이 시간(초) 안에 끝나지 않으면 다음 시도를 동시에 시작
+    TEMPERATURE_STEP = 0.05  # 시도별 temperature 증가폭 (답변 다양화)
+    MAX_INPUT_TOKENS = 120000  # 입력 토큰 예산 (128K 컨텍스트 - 여유분)
     
-    def __init__(self):
-        """Answer Agent 초기화"""
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
-        self.validator = AnswerValidator()
-        logger.info(
-            f"AnswerAgent 초기화 완료: model={self.MODEL}, "
-            f"temp={self.TEMPERATURE}, max_attempts={self.MAX_ATTEMPTS}"
-        )
+    # 1차 충분성 판단을 답변 생성에 통합할 때 LLM이 출력하는 불충분 표시
+    INSUFFICIENT_MARKER = "[컨텍스트 불충분]"
     
-    def build_context(self, search_results: list) -> str:
-        """
-        검색 결과를 컨텍스트로 조립합니다.
-        확장된 청크가 있는 경우 included_chunks 정보도 참조문서에 포함합니다.
-        
-        Args:
-            search_results: 검색 결과 리스트
-        
-        Returns:
-            조립된 컨텍스트 문자열
-        """
-        if not search_results:
-            return "검색 결과가 없습니다."
-        
-        context_parts = []
-        for idx, result in enumerate(search_results, 1):
-            similarity = result.get("similarity", 0)
-            content = result.get("content", "")
-            document = result.get("document", {})
-            filename = document.get("filename", "알 수 없음")
-            page_number = result.get("page_number", "N/A")
-            clause_number = result.get("clause_number", "N/A")
-            
-            # ⭐ 확장된 청크 정보 확인
-            metadata = result.get("metadata", {})
-            included_chunks = metadata.get("included_chunks", [])
-            is_expanded = metadata.get("expanded", False)
-            
-            # 청크 ID 정보 구성
-            chunk_id = result.get("chunk_id", "N/A")
-            if is_expanded and included_chunks:
-                # 확장된 경우: 포함된 모든 청크 ID 표시
-                chunk_info = f"청크: {', '.join(map(str, included_chunks))}"
-            else:
-                # 일반 경우: 단일 청크 ID
-                chunk_info = f"청크: {chunk_id}"
-            
-            context_parts.append(
-                f"[참조 {idx}] (유사도: {similarity:.3f})\n"
-                f"문서: {filename}, 페이지: {page_number}, 조항: {clause_number}\n"
-                f"{chunk_info}\n"
-                f"내용:\n{content}\n"
-            )
-        
-        return "\n".join(context_parts)
+    # 충분성 판단 지시문 (프롬프트 캐싱 prefix가 유지되도록 마지막 메시지 끝에 추가)
+    _SUFFICIENCY_INSTRUCTION = (
+        "\n\n답변하기 전에 참조 문서가 충분한지 먼저 판단하세요. "
+        "질문과 관련된 참조 문서의 내용이 중간에 잘려 있어 앞뒤 문맥이 더 필요하면, "
+        "답변하지 말고 다음 한 줄만 출력하세요:\n"
+        "[컨텍스트 불충분]: 확장이 필요한 참조 번호(쉼표로 구분)\n"
+        "충분하면 이 판단은 언급하지 말고 바로 답변하세요."
+    )
     
-    def build_system_prompt(self) -> str:
-        """
-        할루시네이션 방지가 강화된 시스템 프롬프트를 구성합니다.
-        
-        Returns:
-            시스템 프롬프트
-        """
-        return """당신은 보험약관 전문 AI 어시스턴트입니다.
+    # 시스템 프롬프트 (import 시 1회 생성, 모든 호출에서 동일 문자열 재사용)
+    # 정적 프롬프트가 메시지 맨 앞에 오므로 OpenAI 프롬프트 캐싱 대상이 됩니다.
+    _SYSTEM_PROMPT = """당신은 보험약관 전문 AI 어시스턴트입니다.
 
 ## 핵심 원칙 (반드시 준수)
 
@@ -142,13 +121,607 @@ class AnswerAgent:
 참조 문서에 정보가 없거나 불확실하면, **"죄송하지만 제공된 약관 문서에서는 [질문 내용]에 대한 명확한 정보를 찾을 수 없습니다. 보험사에 직접 문의하시는 것을 권장드립니다."** 라고 답변하세요.
 """
     
-    async def generate_answer(self, state: ISPLState) -> dict:
+    # 참조 문서 1건의 컨텍스트 템플릿
+    _CONTEXT_TEMPLATE = (
+        "[참조 {idx}] (유사도: {similarity:.3f})\n"
+        "문서: {filename}, 페이지: {page_number}, 조항: {clause_number}\n"
+        "{chunk_info}\n"
+        "내용:\n{content}\n"
+    )
+    
+    def __init__(self):
+        """Answer Agent 초기화"""
+        # 공유 연결 풀을 사용하는 싱글톤 클라이언트/검증기 사용
+        self.client = get_openai_client()
+        self.validator = get_answer_validator()
+        self.embedding_service = get_embedding_service()  # 의미 캐시용 질의 임베딩
+        self.encoding = get_encoding_for_model(self.MODEL)
+        self._system_prompt_tokens = len(self.encoding.encode_ordinary(self._SYSTEM_PROMPT))
+        logger.info(
+            "AnswerAgent 초기화 완료: model=%s, temp=%s, max_attempts=%d",
+            self.MODEL, self.TEMPERATURE, self.MAX_ATTEMPTS
+        )
+    
+    def build_context(self, search_results: list) -> str:
+        """
+        검색 결과를 컨텍스트로 조립합니다.
+        확장된 청크가 있는 경우 included_chunks 정보도 참조문서에 포함합니다.
+        
+        Args:
+            search_results: 검색 결과 리스트
+        
+        Returns:
+            조립된 컨텍스트 문자열
+        """
+        if not search_results:
+            return "검색 결과가 없습니다."
+        
+        return "\n".join(self._context_blocks(search_results))
+    
+    def _context_blocks(self, search_results: list) -> List[str]:
+        """
+        검색 결과별 참조 문서 블록을 생성합니다.
+        
+        Args:
+            search_results: 검색 결과 리스트
+        
+        Returns:
+            [참조 N] 블록 문자열 리스트 (검색 결과 순서)
+        """
+        template = self._CONTEXT_TEMPLATE
+        chunk_info = self._chunk_info
+        
+        return [
+            template.format(
+                idx=idx,
+                similarity=result.get("similarity", 0),
+                filename=result.get("document", {}).get("filename", "알 수 없음"),
+                page_number=result.get("page_number", "N/A"),
+                clause_number=result.get("clause_number", "N/A"),
+                chunk_info=chunk_info(result),
+                content=result.get("content", "")
+            )
+            for idx, result in enumerate(search_results, 1)
+        ]
+    
+    def fit_context(self, search_results: list) -> Tuple[List[str], list]:
+        """
+        참조 문서 블록을 조립하고, 입력 토큰 예산을 넘으면 유사도가 낮은 결과부터 제외합니다.
+        토큰화는 생성 전에 1회만 수행하며, 재생성 시에는 반환된 블록을 그대로 재사용합니다.
+        
+        Args:
+            search_results: 검색 결과 리스트
+        
+        Returns:
+            ([참조 N] 블록 리스트, 컨텍스트에 포함된 검색 결과 리스트)
+        """
+        if not search_results:
+            return [self.build_context(search_results)], search_results
+        
+        budget = self.MAX_INPUT_TOKENS - self._system_prompt_tokens - self.MAX_TOKENS
+        blocks = self._context_blocks(search_results)
+        block_tokens = self.encoding.encode_ordinary_batch(blocks)
+        total_tokens = sum(len(tokens) for tokens in block_tokens)
+        
+        if total_tokens <= budget:
+            return blocks, search_results
+        
+        # 유사도가 낮은 결과부터 제외 (남은 결과의 원래 순서는 유지)
+        kept = set(range(len(search_results)))
+        for idx in sorted(kept, key=lambda i: search_results[i].get("similarity", 0)):
+            if total_tokens <= budget or len(kept) == 1:
+                break
+            kept.discard(idx)
+            total_tokens -= len(block_tokens[idx])
+        
+        kept_results = [result for idx, result in enumerate(search_results) if idx in kept]
+        
+        logger.warning(
+            "컨텍스트 토큰 예산 초과: %d개 결과 제외 (%d/%d 토큰)",
+            len(search_results) - len(kept_results), total_tokens, budget
+        )
+        
+        if total_tokens > budget:
+            # 단일 결과만으로도 예산을 넘으면 토큰 단위로 절단
+            (idx,) = kept
+            return [self.encoding.decode(block_tokens[idx][:budget])], kept_results
+        
+        return self._context_blocks(kept_results), kept_results
+    
+    def build_messages(
+        self,
+        system_prompt: str,
+        blocks: List[str],
+        popular_count: int,
+        query: str
+    ) -> List[Dict[str, str]]:
+        """
+        Chat Completions 메시지를 구성합니다.
+        
+        정적인 내용을 앞에, 동적인 내용을 뒤에 배치하여 OpenAI 프롬프트 캐싱
+        (1024 토큰 이상의 동일 prefix 재사용) 적중률을 높입니다.
+        자주 검색되는 청크 블록은 별도 메시지로 분리하여 시스템 프롬프트와 함께
+        고정 prefix를 이루도록 합니다.
+        
+        Args:
+            system_prompt: 시스템 프롬프트
+            blocks: [참조 N] 블록 리스트 (인기 청크가 앞쪽)
+            popular_count: 앞쪽 인기 청크 블록 수
+            query: 사용자 질의
+        
+        Returns:
+            메시지 리스트
+        """
+        if not popular_count:
+            context = "\n".join(blocks)
+            return [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": f"참조 문서:\n\n{context}\n\n질문: {query}"}
+            ]
+        
+        popular_context = "\n".join(blocks[:popular_count])
+        remaining_context = "\n".join(blocks[popular_count:])
+        question = (
+            f"추가 참조 문서:\n\n{remaining_context}\n\n질문: {query}"
+            if remaining_context else f"질문: {query}"
+        )
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": f"참조 문서:\n\n{popular_context}"},
+            {"role": "user", "content": question}
+        ]
+    
+    @staticmethod
+    def _chunk_info(result: dict) -> str:
+        """
+        참조 문서에 표시할 청크 ID 정보를 구성합니다.
+        
+        Args:
+            result: 검색 결과
+        
+        Returns:
+            "청크: ..." 문자열 (확장된 경우 포함된 모든 청크 ID)
+        """
+        # ⭐ 확장된 청크 정보 확인
+        metadata = result.get("metadata", {})
+        if metadata.get("expanded", False):
+            included_chunks = metadata.get("included_chunks")
+            if included_chunks:
+                # 확장된 경우: 포함된 모든 청크 ID 표시
+                return "청크: " + ", ".join(map(str, included_chunks))
+        
+        # 일반 경우: 단일 청크 ID
+        return f"청크: {result.get('chunk_id', 'N/A')}"
+    
+    async def _embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        의미 캐시 조회용 질의 임베딩을 생성합니다.
+        임베딩 실패는 답변 생성에 영향을 주지 않도록 None을 반환합니다.
+        
+        Args:
+            query: 사용자 질의
+        
+        Returns:
+            질의 임베딩 (실패 시 None)
+        """
+        try:
+            return await self.embedding_service.create_embedding(query)
+        except Exception as e:
+            logger.warning("의미 캐시용 질의 임베딩 실패: %s", e)
+            return None
+    
+    def build_system_prompt(self) -> str:
+        """
+        할루시네이션 방지가 강화된 시스템 프롬프트를 반환합니다.
+        
+        Returns:
+            시스템 프롬프트
+        """
+        return self._SYSTEM_PROMPT
+    
+    async def _one_attempt(
+        self,
+        attempt: int,
+        temperature: float,
+        messages: List[Dict[str, str]],
+        search_results: list,
+        stream_cb: Optional[Callable[[str], Awaitable[None]]] = None,
+        insufficient_marker: Optional[str] = None
+    ) -> Tuple[str, AnswerValidation, int]:
+        """
+        답변을 1회 생성하고 검증합니다.
+        
+        Args:
+            attempt: 시도 번호 (0부터 시작, 재생성 횟수로 기록)
+            temperature: 이번 시도에 사용할 temperature
+            messages: build_messages()로 구성한 메시지 (모든 시도에서 재사용)
+            search_results: 검색 결과 리스트 (검증용)
+            stream_cb: 답변 토큰을 전달할 비동기 콜백 (있으면 스트리밍 호출)
+            insufficient_marker: 충분성 판단 통합 시 불충분 표시 (답변이 이 표시로 시작하면 중단)
+        
+        Returns:
+            (답변, 검증 결과, 사용 토큰 수)
+        
+        Raises:
+            _InsufficientContext: 답변이 불충분 표시로 시작하는 경우
+        """
+        model = self.MODELS[attempt]
+        logger.info(
+            "답변 생성 시도 %d/%d (model=%s, temp=%.2f)",
+            attempt + 1, self.MAX_ATTEMPTS, model, temperature
+        )
+        
+        if stream_cb:
+            # 스트리밍: 토큰이 도착하는 즉시 클라이언트로 전달 (검증은 전체 답변으로 수행)
+            response = await self.client.chat.completions.create(
+                model=model,
+                temperature=temperature,
+                max_tokens=self.MAX_TOKENS,
+                messages=messages,
+                stream=True,
+                stream_options={"include_usage": True}
+            )
+            
+            chunks = []
+            tokens_used = 0
+            # 충분성 판단 통합 시: 불충분 표시 여부가 확정될 때까지 토큰 전달 보류
+            pending = "" if insufficient_marker else None
+            async for chunk in response:
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        chunks.append(delta)
+                        if pending is None:
+                            await stream_cb(delta)
+                        else:
+                            pending += delta
+                            head = pending.lstrip()
+                            if not head.startswith(insufficient_marker) and not insufficient_marker.startswith(head):
+                                await stream_cb(pending)
+                                pending = None
+                if chunk.usage:
+                    tokens_used = chunk.usage.total_tokens
+            
+            answer = "".join(chunks)
+            # 표시와 같은 접두어로 끝난 짧은 답변은 그대로 전달
+            if pending and not answer.lstrip().startswith(insufficient_marker):
+                await stream_cb(pending)
+        else:
+            # GPT API 호출
+            response = await self.client.chat.completions.create(
+                model=model,
+                temperature=temperature,
+                max_tokens=self.MAX_TOKENS,
+                messages=messages
+            )
+            
+            answer = response.choices[0].message.content
+            tokens_used = response.usage.total_tokens
+        
+        logger.info("답변 생성됨: %d자, %d토큰", len(answer), tokens_used)
+        
+        if insufficient_marker and answer.lstrip().startswith(insufficient_marker):
+            logger.info("답변 생성 시도 %d: 컨텍스트 불충분 표시 (%s)", attempt + 1, answer.strip())
+            raise _InsufficientContext(answer)
+        
+        # AnswerValidator로 검증 (동시 시도 간 세션 공유 불가하므로 시도별 세션 사용)
+        session = AsyncSessionLocal()
+        try:
+            validation = await self.validator.validate(
+                answer=answer,
+                search_results=search_results,
+                session=session
+            )
+        finally:
+            await session.close()
+        
+        # 재생성 횟수 기록
+        validation.regeneration_count = attempt
+        
+        logger.info(
+            "검증 완료 (시도 %d): confidence=%.2f, reliable=%s",
+            attempt + 1, validation.confidence_score, validation.is_reliable
+        )
+        
+        return answer, validation, tokens_used
+    
+    async def _run_attempts(
+        self,
+        messages: List[Dict[str, str]],
+        search_results: list,
+        stream_cb: Optional[Callable[[str], Awaitable[None]]] = None,
+        insufficient_marker: Optional[str] = None
+    ) -> Tuple[Optional[Tuple[str, AnswerValidation, int]], Optional[Exception]]:
+        """
+        답변 생성 시도를 실행합니다.
+        
+        - 첫 시도(gpt-4o-mini)만 먼저 시작합니다.
+        - 시도가 검증에 실패하거나 오류가 나면 다음 시도(gpt-4o)를 시작합니다.
+        - 진행 중인 시도가 SPECULATIVE_DELAY 안에 끝나지 않으면 다음 시도를 동시에
+          시작하여 지연 상한을 둡니다 (동시 진행은 SPECULATIVE_ATTEMPTS개까지).
+        - 먼저 신뢰도를 통과한 답변을 채택하고 나머지 시도는 취소합니다.
+        - 불충분 표시가 나오면 새 시도는 시작하지 않되, 진행 중인 시도는 끝까지 기다려
+          신뢰도를 통과한 답변이 있으면 그 답변을 채택합니다.
+        
+        Args:
+            messages: build_messages()로 구성한 메시지
+            search_results: 검색 결과 리스트
+            stream_cb: 답변 토큰을 전달할 비동기 콜백 (첫 번째 시도만 스트리밍)
+            insufficient_marker: 충분성 판단 통합 시 불충분 표시
+        
+        Returns:
+            (가장 신뢰도가 높은 결과 또는 None, 마지막 오류 또는 None)
+        
+        Raises:
+            _InsufficientContext: 한 시도라도 불충분을 표시했고 신뢰도를 통과한 답변이 없는 경우
+        """
+        loop = asyncio.get_running_loop()
+        running: Dict[asyncio.Task, int] = {}  # task → 시도 번호
+        next_attempt = 0
+        last_launch = 0.0  # 마지막 시도 시작 시각 (지연 기준)
+        best = None
+        last_error = None
+        insufficient = None  # 불충분 표시 (진행 중인 다른 시도가 끝날 때까지 보류)
+        
+        def can_launch() -> bool:
+            """불충분 표시가 없고, 남은 시도가 있고, 동시 진행 상한에 여유가 있는지 여부"""
+            return (
+                insufficient is None
+                and next_attempt < self.MAX_ATTEMPTS
+                and len(running) < self.SPECULATIVE_ATTEMPTS
+            )
+        
+        def launch():
+            """다음 시도 1개 시작"""
+            nonlocal next_attempt, last_launch
+            attempt = next_attempt
+            next_attempt += 1
+            last_launch = loop.time()
+            task = asyncio.create_task(
+                self._one_attempt(
+                    attempt,
+                    self.TEMPERATURE + self.TEMPERATURE_STEP * attempt,
+                    messages,
+                    search_results,
+                    stream_cb=stream_cb if attempt == 0 else None,
+                    insufficient_marker=insufficient_marker
+                )
+            )
+            running[task] = attempt
+        
+        launch()
+        
+        try:
+            while running:
+                # 다음 시도를 시작할 수 있으면 지연 기한까지만 대기
+                timeout = None
+                if can_launch():
+                    timeout = max(0.0, last_launch + self.SPECULATIVE_DELAY - loop.time())
+                
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                
+                if not done:
+                    logger.info(
+                        "답변 생성 지연 (%.1f초 초과): 시도 %d 동시 시작",
+                        self.SPECULATIVE_DELAY, next_attempt + 1
+                    )
+                    launch()
+                    continue
+                
+                for task in done:
+                    attempt = running.pop(task)
+                    try:
+                        result = task.result()
+                    except _InsufficientContext as e:
+                        # 같은 시점에 검증을 통과한 답변이 있을 수 있으므로 바로 중단하지 않음
+                        if insufficient is None:
+                            insufficient = e
+                        continue
+                    except Exception as e:
+                        logger.error("답변 생성 시도 %d 중 오류 발생: %s", attempt + 1, e, exc_info=True)
+                        last_error = e
+                        continue
+                    
+                    if best is None or result[1].confidence_score > best[1].confidence_score:
+                        best = result
+                    
+                    if result[1].is_reliable:
+                        return best, last_error
+                    
+                    logger.warning(
+                        "🔄 신뢰도 낮음 (%.2f), 시도 %d/%d",
+                        result[1].confidence_score, attempt + 1, self.MAX_ATTEMPTS
+                    )
+                
+                # 검증 실패/오류로 끝난 시도만큼 다음 시도 시작
+                if can_launch():
+                    launch()
+        finally:
+            # 채택된 답변 이후 남은 시도 취소 (검증 세션 정리까지 완료되도록 종료 대기)
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+        
+        # 신뢰도를 통과한 답변 없이 불충분 표시가 있었으면 청크 확장으로 전환
+        if insufficient is not None:
+            raise insufficient
+        
+        return best, last_error
+    
+    async def _get_similar(
+        self,
+        context_hash: str,
+        embedding_task: "asyncio.Task[Optional[List[float]]]"
+    ) -> Tuple[Optional[dict], Optional[List[float]]]:
+        """
+        질의 임베딩 완료를 기다려 의미 캐시를 조회합니다.
+        
+        Args:
+            context_hash: 의미 인덱스 버킷 키
+            embedding_task: _embed_query() 태스크
+        
+        Returns:
+            (캐시된 답변 또는 None, 질의 임베딩 또는 None)
+        """
+        query_embedding = await embedding_task
+        if not query_embedding:
+            return None, None
+        return await answer_cache_service.get_similar(context_hash, query_embedding), query_embedding
+    
+    def _cached_result(self, cached: dict, search_results: list) -> dict:
+        """
+        캐시된 답변으로 상태 딕셔너리를 생성합니다.
+        
+        Args:
+            cached: 답변 캐시 항목
+            search_results: 참조 번호 순서의 검색 결과
+        
+        Returns:
+            업데이트할 상태 딕셔너리
+        """
+        logger.info("✅ 캐시된 답변 반환 (GPT 호출 생략)")
+        return {
+            "final_answer": cached["answer"],
+            "search_results": search_results,  # [참조 N] 번호와 일치하는 순서
+            "task_results": {
+                "answer": {
+                    "success": True,
+                    "model": cached.get("model", self.MODEL),
+                    "tokens_used": 0,
+                    "cached": True,
+                    "validation": cached["validation"]
+                }
+            }
+        }
+    
+    @staticmethod
+    async def _replace_streamed(
+        stream_cb: Optional[Callable[..., Awaitable[None]]],
+        streamed: List[str],
+        result: dict
+    ) -> dict:
+        """
+        스트리밍된 답변이 최종 답변과 다르면 클라이언트에 교체 이벤트를 전달합니다.
+        (첫 시도가 검증에 실패해 다른 시도가 채택되었거나, 오류/불충분으로 끝난 경우)
+        
+        Args:
+            stream_cb: 답변 토큰 콜백 (replace=True로 최종 답변 전체 전달)
+            streamed: 지금까지 스트리밍된 토큰 리스트
+            result: 업데이트할 상태 딕셔너리
+        
+        Returns:
+            result 그대로
+        """
+        if streamed:
+            final_answer = result.get("final_answer", "")
+            if "".join(streamed) != final_answer:
+                logger.info("스트리밍된 답변과 최종 답변이 달라 교체 이벤트 전달")
+                await stream_cb(final_answer, replace=True)
+        return result
+    
+    def _insufficient_context_result(self, answer: str, search_results: list) -> dict:
+        """
+        답변 생성 중 컨텍스트 불충분으로 판단된 경우 청크 확장으로 되돌리는 상태를 생성합니다.
+        
+        Args:
+            answer: 불충분 표시 응답 ("[컨텍스트 불충분]: 참조 번호들")
+            search_results: 참조 번호 순서의 검색 결과 (fit_context 결과)
+        
+        Returns:
+            업데이트할 상태 딕셔너리 (context_sufficient=False)
+        """
+        first_line = answer.strip().split('\n', 1)[0]
+        numbers = [int(num) for num in _REFERENCE_NUMBER_RE.findall(first_line)]
+        chunk_ids = list(dict.fromkeys(
+            search_results[num - 1].get("chunk_id")
+            for num in numbers if 1 <= num <= len(search_results)
+        ))
+        
+        logger.info("답변 생성 중 컨텍스트 불충분 판단 → 청크 확장: %s", chunk_ids)
+        
+        return {
+            "context_sufficient": False,
+            "sufficiency_in_answer": False,  # 확장 후에는 기존 LLM 판단 사용
+            "chunks_to_expand": [
+                {"chunk_id": chunk_id, "direction": "both", "reasons": ["답변 생성 중 불충분 판단"]}
+                for chunk_id in chunk_ids
+            ],
+            "task_results": {
+                "answer": {
+                    "success": True,
+                    "insufficient_context": True,
+                    "chunks_to_expand": chunk_ids
+                }
+            },
+            "next_agent": "chunk_expansion_agent"
+        }
+    
+    async def _enqueue_batch(
+        self,
+        request_id: Optional[str],
+        messages: List[Dict[str, str]]
+    ) -> dict:
+        """
+        답변 생성 요청을 OpenAI Batch API 스테이징에 적재합니다.
+        결과는 OpenAIBatchService.collect_results()로 별도 수집합니다.
+        
+        Args:
+            request_id: 배치 요청 식별자 (없으면 자동 생성)
+            messages: build_messages()로 구성한 메시지
+        
+        Returns:
+            업데이트할 상태 딕셔너리 (status=queued)
+        """
+        try:
+            custom_id = await get_openai_batch_service().enqueue(
+                body={
+                    "model": self.MODEL,
+                    "temperature": self.TEMPERATURE,
+                    "max_tokens": self.MAX_TOKENS,
+                    "messages": messages
+                },
+                custom_id=request_id
+            )
+        except Exception as e:
+            logger.error("배치 요청 적재 실패: %s", e, exc_info=True)
+            return {
+                "final_answer": f"죄송합니다. 배치 요청 적재 중 오류가 발생했습니다: {str(e)}",
+                "task_results": {
+                    "answer": {
+                        "success": False,
+                        "error": str(e)
+                    }
+                }
+            }
+        
+        return {
+            "final_answer": "",
+            "task_results": {
+                "answer": {
+                    "success": True,
+                    "model": self.MODEL,
+                    "batch": True,
+                    "request_id": custom_id,
+                    "status": "queued"
+                }
+            }
+        }
+    
+    async def generate_answer(
+        self,
+        state: ISPLState,
+        stream_cb: Optional[Callable[..., Awaitable[None]]] = None
+    ) -> dict:
         """
         검색 결과를 바탕으로 답변을 생성합니다.
-        신뢰도가 낮을 경우 최대 2회까지 재생성합니다.
+        gpt-4o-mini로 먼저 생성하고, 신뢰도가 낮거나 지연되면 gpt-4o로
+        다음 시도를 생성합니다 (최대 MAX_ATTEMPTS회, 동시 SPECULATIVE_ATTEMPTS개).
         
         Args:
             state: 현재 상태
+            stream_cb: 답변 토큰을 전달할 비동기 콜백 (선택)
+                첫 번째 시도의 토큰만 스트리밍되며, 최종 답변이 스트리밍된 내용과
+                다르면 stream_cb(final_answer, replace=True)로 교체를 알립니다.
         
         Returns:
             업데이트할 상태 딕셔너리
@@ -158,19 +731,21 @@ class AnswerAgent:
         error = state.get("error")
         
         # ⭐ 디버그: answer_agent가 받은 search_results 검증
-        logger.info(f"⭐ answer_agent 받은 search_results 개수: {len(search_results)}")
-        for idx, result in enumerate(search_results):
-            metadata = result.get("metadata", {})
-            is_expanded = metadata.get("expanded", False)
-            included = metadata.get("included_chunks", [])
-            logger.info(
-                f"  결과[{idx}]: chunk_id={result.get('chunk_id')}, "
-                f"expanded={is_expanded}, included_chunks={included}"
-            )
+        logger.info("⭐ answer_agent 받은 search_results 개수: %d", len(search_results))
+        if logger.isEnabledFor(logging.DEBUG):
+            for idx, result in enumerate(search_results):
+                metadata = result.get("metadata", {})
+                logger.debug(
+                    "  결과[%d]: chunk_id=%s, expanded=%s, included_chunks=%s",
+                    idx,
+                    result.get("chunk_id"),
+                    metadata.get("expanded", False),
+                    metadata.get("included_chunks", [])
+                )
         
         # 검색 단계에서 오류가 발생한 경우
         if error:
-            logger.warning(f"검색 오류로 인한 답변 생성 실패: {error}")
+            logger.warning("검색 오류로 인한 답변 생성 실패: %s", error)
             return {
                 "final_answer": f"죄송합니다. {error}",
                 "task_results": {
@@ -197,126 +772,168 @@ class AnswerAgent:
                 }
             }
         
-        logger.info(f"답변 생성 시작: {len(search_results)}개 검색 결과 사용")
+        logger.info("답변 생성 시작: %d개 검색 결과 사용", len(search_results))
         
-        # 컨텍스트 구성 (재생성 시에도 동일하게 사용)
-        context = self.build_context(search_results)
+        # 자주 검색되는 청크를 고정 순서로 앞에 배치 (프롬프트 캐싱 prefix)
+        search_results, popular_count = popular_chunk_service.order(search_results)
+        popular_ids = {id(result) for result in search_results[:popular_count]}
         
-        # 재생성 루프
-        for attempt in range(self.MAX_ATTEMPTS):
-            logger.info(f"답변 생성 시도 {attempt + 1}/{self.MAX_ATTEMPTS}")
-            
-            try:
-                # GPT-4 API 호출
-                response = await self.client.chat.completions.create(
-                    model=self.MODEL,
-                    temperature=self.TEMPERATURE,
-                    max_tokens=self.MAX_TOKENS,
-                    messages=[
-                        {"role": "system", "content": self.build_system_prompt()},
-                        {"role": "user", "content": f"참조 문서:\n\n{context}\n\n질문: {query}"}
-                    ]
-                )
-                
-                answer = response.choices[0].message.content
-                tokens_used = response.usage.total_tokens
-                
-                logger.info(f"답변 생성됨: {len(answer)}자, {tokens_used}토큰")
-                
-                # AnswerValidator로 검증
-                session = AsyncSessionLocal()
-                try:
-                    validation = await self.validator.validate(
-                        answer=answer,
-                        search_results=search_results,
-                        session=session
-                    )
-                    # 재생성 횟수 기록
-                    validation.regeneration_count = attempt
-                finally:
-                    await session.close()
-                
-                logger.info(
-                    f"검증 완료: confidence={validation.confidence_score:.2f}, "
-                    f"reliable={validation.is_reliable}"
-                )
-                
-                # 신뢰도가 높거나 마지막 시도인 경우 반환
-                if validation.is_reliable or attempt == self.MAX_ATTEMPTS - 1:
-                    if validation.is_reliable:
-                        logger.info(
-                            f"✅ 답변 생성 성공: 신뢰도 {validation.confidence_score:.2f}, "
-                            f"재생성 {attempt}회"
-                        )
-                    else:
-                        logger.warning(
-                            f"⚠️ 최종 답변 사용: 신뢰도 {validation.confidence_score:.2f}, "
-                            f"재생성 {attempt}회 (최대 시도 도달)"
-                        )
-                    
-                    return {
-                        "final_answer": answer,
-                        "task_results": {
-                            "answer": {
-                                "success": True,
-                                "model": self.MODEL,
-                                "tokens_used": tokens_used,
-                                "validation": validation.dict()
-                            }
-                        }
-                    }
-                
-                # 신뢰도가 낮으면 재생성
-                logger.warning(
-                    f"🔄 신뢰도 낮음 ({validation.confidence_score:.2f}), "
-                    f"재생성 시도 {attempt + 1}/{self.MAX_ATTEMPTS - 1}"
+        # 컨텍스트 구성 (토큰 예산 적용, 재생성 시에도 동일하게 사용)
+        blocks, search_results = self.fit_context(search_results)
+        popular_count = sum(1 for result in search_results if id(result) in popular_ids)
+        context = "\n".join(blocks)
+        system_prompt = self.build_system_prompt()
+        messages = self.build_messages(system_prompt, blocks, popular_count, query)
+        
+        # 1차 충분성 판단 통합: 별도 판단 호출 대신 답변 생성 호출에서 함께 판단
+        sufficiency_in_answer = bool(state.get("sufficiency_in_answer")) and not state.get("batch_mode")
+        if sufficiency_in_answer:
+            messages[-1] = {
+                **messages[-1],
+                "content": messages[-1]["content"] + self._SUFFICIENCY_INSTRUCTION
+            }
+        
+        # 답변 캐시 조회 (1단계: 정확 일치, 2단계: 동일 컨텍스트 내 의미 유사도)
+        # 캐시 키는 시도별 모델 구성과 기본 temperature 기준 (실제 채택된 모델/temperature는 항목에 기록)
+        cache_key = answer_cache_service.get_cache_key(
+            self.CACHE_MODEL_KEY, self.TEMPERATURE, system_prompt, context, query
+        )
+        context_hash = answer_cache_service.get_context_hash(
+            self.CACHE_MODEL_KEY, self.TEMPERATURE, system_prompt, context
+        )
+        cached = await answer_cache_service.get(cache_key)
+        if cached:
+            return self._cached_result(cached, search_results)
+        
+        # 의미 캐시용 질의 임베딩은 답변 생성과 동시에 진행 (정확 일치 MISS마다 직렬 대기하지 않음)
+        embedding_task = asyncio.create_task(self._embed_query(query))
+        
+        # 비실시간 요청: Batch API로 적재 후 즉시 반환 (토큰 비용 50% 절감)
+        if state.get("batch_mode"):
+            cached, _ = await self._get_similar(context_hash, embedding_task)
+            if cached:
+                return self._cached_result(cached, search_results)
+            return await self._enqueue_batch(state.get("request_id"), messages)
+        
+        # 스트리밍된 토큰 기록 (채택된 답변과 다르면 종료 시 교체 이벤트 전달)
+        streamed: List[str] = []
+        
+        async def _forward(delta: str):
+            streamed.append(delta)
+            await stream_cb(delta)
+        
+        # mini 우선 시도 + 검증 실패/지연 시 승격 (먼저 신뢰도를 통과한 답변 채택)
+        attempts_task = asyncio.create_task(self._run_attempts(
+            messages,
+            search_results,
+            stream_cb=_forward if stream_cb else None,
+            insufficient_marker=self.INSUFFICIENT_MARKER if sufficiency_in_answer else None
+        ))
+        try:
+            # 의미 캐시 HIT이면 진행 중인 답변 생성 취소
+            cached, query_embedding = await self._get_similar(context_hash, embedding_task)
+            if cached:
+                attempts_task.cancel()
+                await asyncio.gather(attempts_task, return_exceptions=True)
+                return await self._replace_streamed(
+                    stream_cb, streamed, self._cached_result(cached, search_results)
                 )
-                
-            except Exception as e:
-                logger.error(f"답변 생성 시도 {attempt + 1} 중 오류 발생: {e}", exc_info=True)
-                
-                # 마지막 시도에서도 실패하면 오류 반환
-                if attempt == self.MAX_ATTEMPTS - 1:
-                    return {
-                        "final_answer": f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {str(e)}",
-                        "task_results": {
-                            "answer": {
-                                "success": False,
-                                "error": str(e),
-                                "attempts": attempt + 1
-                            }
-                        }
+            
+            best, last_error = await attempts_task
+        except _InsufficientContext as e:
+            return await self._replace_streamed(
+                stream_cb, streamed, self._insufficient_context_result(str(e), search_results)
+            )
+        finally:
+            # 요청 취소 등으로 빠져나갈 때 남은 시도 정리
+            if not attempts_task.done():
+                attempts_task.cancel()
+        
+        # 모든 시도가 실패한 경우 오류 반환
+        if best is None:
+            error_message = str(last_error) if last_error else "Unexpected code path"
+            return await self._replace_streamed(stream_cb, streamed, {
+                "final_answer": f"죄송합니다. 답변 생성 중 오류가 발생했습니다: {error_message}",
+                "task_results": {
+                    "answer": {
+                        "success": False,
+                        "error": error_message,
+                        "attempts": self.MAX_ATTEMPTS
                     }
-                
-                # 다음 시도 계속
-                logger.info(f"다음 시도 진행 중... ({attempt + 2}/{self.MAX_ATTEMPTS})")
+                }
+            })
         
-        # 이 코드는 도달하지 않아야 함 (안전장치)
-        logger.error("예상치 못한 코드 경로 도달")
-        return {
-            "final_answer": "죄송합니다. 답변 생성 중 문제가 발생했습니다.",
+        answer, validation, tokens_used = best
+        attempt = validation.regeneration_count
+        model = self.MODELS[attempt]  # 채택된 시도의 모델 (모니터링용)
+        
+        if validation.is_reliable:
+            logger.info(
+                "✅ 답변 생성 성공: 신뢰도 %.2f, 재생성 %d회, model=%s",
+                validation.confidence_score, validation.regeneration_count, model
+            )
+            
+            # 신뢰도가 높은 답변만 캐싱
+            await answer_cache_service.set(
+                cache_key,
+                {
+                    "answer": answer,
+                    "model": model,
+                    "temperature": self.TEMPERATURE + self.TEMPERATURE_STEP * attempt,
+                    "validation": validation.dict()
+                },
+                context_hash=context_hash,
+                query_embedding=query_embedding
+            )
+        else:
+            logger.warning(
+                "⚠️ 최종 답변 사용: 신뢰도 %.2f, 재생성 %d회 (최대 시도 도달)",
+                validation.confidence_score, validation.regeneration_count
+            )
+        
+        return await self._replace_streamed(stream_cb, streamed, {
+            "final_answer": answer,
+            "search_results": search_results,  # [참조 N] 번호와 일치하는 순서
             "task_results": {
                 "answer": {
-                    "success": False,
-                    "error": "Unexpected code path"
+                    "success": True,
+                    "model": model,
+                    "tokens_used": tokens_used,
+                    "validation": validation.dict()
                 }
             }
-        }
+        })
+
+@lru_cache(maxsize=1)
+def get_answer_agent() -> AnswerAgent:
+    """
+    전역 Answer Agent 인스턴스를 반환합니다 (첫 사용 시 생성).
+    import 시점에 OpenAI 클라이언트/검증기를 만들지 않도록 지연 생성합니다.
+    
+    Returns:
+        AnswerAgent 싱글톤
+    """
+    return AnswerAgent()
 
 
-# 전역 Answer Agent 인스턴스
-answer_agent = AnswerAgent()
+def __getattr__(name: str):
+    """하위 호환성: 모듈 속성 answer_agent 접근 시 지연 생성"""
+    if name == "answer_agent":
+        return get_answer_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-async def answer_node(state: ISPLState) -> dict:
+async def answer_node(state: ISPLState, config: RunnableConfig) -> dict:
     """
     Answer Agent 노드 함수
     
     Args:
         state: 현재 상태
+        config: 실행 설정 (configurable.stream_cb가 있으면 답변 토큰 스트리밍)
     
     Returns:
         업데이트할 상태 딕셔너리
     """
-    return await answer_agent.generate_answer(state)
+    stream_cb = config.get("configurable", {}).get("stream_cb")
+    return await get_answer_agent().generate_answer(state, stream_cb=stream_cb)
 
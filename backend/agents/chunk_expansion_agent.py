@@ -3,6 +3,7 @@ Chunk Expansion Agent
 컨텍스트 확장을 실행하는 Agent입니다.
 """
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any
 
 from agents.state import ISPLState
@@ -41,10 +42,8 @@ class ChunkExpansionAgent:
         expansion_count = state.get("expansion_count", 0)
         
         logger.info(
-            f"청크 확장 시작: "
-            f"total_chunks={len(search_results)}, "
-            f"to_expand={len(chunks_to_expand)}, "
-            f"count={expansion_count}"
+            "청크 확장 시작: total_chunks=%d, to_expand=%d, count=%d",
+            len(search_results), len(chunks_to_expand), expansion_count
         )
         
         # 확장할 청크가 없는 경우
@@ -67,57 +66,44 @@ class ChunkExpansionAgent:
             session = AsyncSessionLocal()
             
             try:
-                # VectorSearchResult 객체로 변환
-                search_result_objects = []
-                for result in search_results:
-                    search_result_objects.append(
-                        VectorSearchResult(
-                            chunk_id=result["chunk_id"],
-                            document_id=result["document_id"],
-                            content=result["content"],
-                            similarity=result["similarity"],
-                            chunk_type=result["chunk_type"],
-                            page_number=result.get("page_number"),
-                            section_title=result.get("section_title"),
-                            clause_number=result.get("clause_number"),
-                            metadata=result.get("metadata", {}),
-                            document_filename=result.get("document", {}).get("filename"),
-                            document_type=result.get("document", {}).get("type"),
-                            company_name=result.get("document", {}).get("company_name")
-                        )
-                    )
+                # 상태의 검색 결과는 체크포인트 직렬화를 위해 딕셔너리로 유지합니다.
+                # 확장되지 않은 결과는 원본 딕셔너리를 그대로 재사용하고
+                # 새로 생성된(확장된) 결과만 딕셔너리로 변환합니다.
+                search_result_objects = [VectorSearchResult.from_dict(result) for result in search_results]
+                originals = {
+                    id(obj): result
+                    for obj, result in zip(search_result_objects, search_results)
+                }
                 
                 # 청크 확장 실행 (방향 정보 포함)
-                expanded_results = await self.expansion_service.expand_search_results(
+                expanded_results, newly_expanded_ids = await self.expansion_service.expand_search_results(
                     session=session,
                     search_results=search_result_objects,
                     chunks_to_expand=chunks_to_expand,  # ⭐ 딕셔너리 리스트 전달
                     max_tokens=15000  # gpt-4o 변경으로 6000 → 15000 증가
                 )
                 
-                # 딕셔너리로 변환
-                expanded_dicts = [result.to_dict() for result in expanded_results]
+                expanded_dicts = [
+                    originals.get(id(result)) or result.to_dict()
+                    for result in expanded_results
+                ]
                 
-                # 확장된 청크 ID 수집
-                expanded_chunk_ids = []
-                for result in expanded_results:
-                    if result.metadata.get("expanded", False):
-                        expanded_chunk_ids.append(result.chunk_id)
+                # 이전 단계에서 확장된 청크 + 이번에 확장된 청크
+                expanded_chunk_ids = state.get("expanded_chunks", []) + newly_expanded_ids
                 
-                logger.info(
-                    f"청크 확장 완료: "
-                    f"expanded_count={len(expanded_chunk_ids)}"
-                )
+                logger.info("청크 확장 완료: expanded_count=%d", len(expanded_chunk_ids))
                 
                 # ⭐ 디버그: 확장된 결과 검증
-                for idx, result_dict in enumerate(expanded_dicts):
-                    metadata = result_dict.get("metadata", {})
-                    is_expanded = metadata.get("expanded", False)
-                    included = metadata.get("included_chunks", [])
-                    logger.info(
-                        f"  확장 결과[{idx}]: chunk_id={result_dict['chunk_id']}, "
-                        f"expanded={is_expanded}, included_chunks={included}"
-                    )
+                if logger.isEnabledFor(logging.DEBUG):
+                    for idx, result_dict in enumerate(expanded_dicts):
+                        metadata = result_dict.get("metadata", {})
+                        logger.debug(
+                            "  확장 결과[%d]: chunk_id=%s, expanded=%s, included_chunks=%s",
+                            idx,
+                            result_dict["chunk_id"],
+                            metadata.get("expanded", False),
+                            metadata.get("included_chunks", [])
+                        )
                 
                 return_value = {
                     "search_results": expanded_dicts,  # 확장된 결과로 업데이트
@@ -135,12 +121,12 @@ class ChunkExpansionAgent:
                     "next_agent": "context_judgement_agent"  # 다시 판단
                 }
                 
-                logger.info(
-                    f"⭐ 반환값: search_results 개수={len(return_value['search_results'])}"
-                )
-                logger.info(
-                    f"⭐ search_results의 chunk_id들: {[r['chunk_id'] for r in return_value['search_results']]}"
-                )
+                logger.info("⭐ 반환값: search_results 개수=%d", len(return_value["search_results"]))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "⭐ search_results의 chunk_id들: %s",
+                        [r["chunk_id"] for r in return_value["search_results"]]
+                    )
                 
                 return return_value
             
@@ -149,7 +135,7 @@ class ChunkExpansionAgent:
                 await session.close()
         
         except Exception as e:
-            logger.error(f"청크 확장 중 오류 발생: {e}", exc_info=True)
+            logger.error("청크 확장 중 오류 발생: %s", e, exc_info=True)
             return {
                 "error": f"청크 확장 중 오류: {str(e)}",
                 "expansion_count": expansion_count + 1,
@@ -163,8 +149,22 @@ class ChunkExpansionAgent:
             }
 
 
-# 전역 Chunk Expansion Agent 인스턴스
-chunk_expansion_agent = ChunkExpansionAgent()
+@lru_cache(maxsize=1)
+def get_chunk_expansion_agent() -> ChunkExpansionAgent:
+    """
+    전역 Chunk Expansion Agent 인스턴스를 반환합니다 (첫 사용 시 생성).
+    
+    Returns:
+        ChunkExpansionAgent 싱글톤
+    """
+    return ChunkExpansionAgent()
+
+
+def __getattr__(name: str):
+    """하위 호환성: 모듈 속성 chunk_expansion_agent 접근 시 지연 생성"""
+    if name == "chunk_expansion_agent":
+        return get_chunk_expansion_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def chunk_expansion_node(state: ISPLState) -> dict:
@@ -177,5 +177,5 @@ async def chunk_expansion_node(state: ISPLState) -> dict:
     Returns:
         업데이트할 상태 딕셔너리
     """
-    return await chunk_expansion_agent.expand(state)
+    return await get_chunk_expansion_agent().expand(state)
 
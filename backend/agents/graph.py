@@ -2,7 +2,9 @@
 ISPL LangGraph StateGraph 구성
 Multi-Agent 시스템의 워크플로우를 정의합니다.
 """
+import asyncio
 import logging
+from functools import lru_cache
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.memory import MemorySaver
 
@@ -17,6 +19,9 @@ from agents.management_agent import management_node
 
 logger = logging.getLogger(__name__)
 
+# stream_graph 큐 종료 표시
+_STREAM_END = object()
+
 
 def create_graph() -> StateGraph:
     """
@@ -76,8 +81,24 @@ def create_graph() -> StateGraph:
     # chunk_expansion_agent → context_judgement_agent (재판단)
     builder.add_edge("chunk_expansion_agent", "context_judgement_agent")
     
-    # answer_agent → END
-    builder.add_edge("answer_agent", END)
+    # answer_agent에서 조건부 라우팅
+    # - 답변 완료 → END
+    # - 답변 생성 중 컨텍스트 불충분 판단 (context_sufficient=False) → chunk_expansion_agent
+    def route_after_answer(state: ISPLState) -> str:
+        """답변 생성 후 라우팅"""
+        if state.get("context_sufficient") is False:
+            logger.debug("답변 생성 중 컨텍스트 불충분 → chunk_expansion_agent")
+            return "chunk_expansion_agent"
+        return END
+    
+    builder.add_conditional_edges(
+        "answer_agent",
+        route_after_answer,
+        {
+            "chunk_expansion_agent": "chunk_expansion_agent",
+            END: END
+        }
+    )
     
     # processing_agent → END (처리 완료 후 바로 종료)
     builder.add_edge("processing_agent", END)
@@ -96,20 +117,27 @@ def create_graph() -> StateGraph:
     return graph
 
 
-# 전역 그래프 인스턴스 (지연 생성)
-_ispl_graph = None
+@lru_cache(maxsize=1)
+def _get_compiled_graph() -> StateGraph:
+    """
+    컴파일된 그래프를 반환합니다 (최초 1회만 생성).
+    
+    Returns:
+        컴파일된 StateGraph
+    """
+    return create_graph()
 
 
 def get_graph() -> StateGraph:
     """
-    그래프 인스턴스를 반환합니다 (지연 생성).
-    매번 호출 시 새로운 그래프를 반환하여 이벤트 루프 문제를 방지합니다.
+    그래프 인스턴스를 반환합니다.
+    그래프 구성/컴파일은 최초 1회만 수행하고, 호출마다 새 체크포인터를 붙인
+    얕은 복사본을 반환하여 요청 간 상태(task_results 병합 등)가 섞이지 않도록 합니다.
     
     Returns:
-        컴파일된 StateGraph
+        컴파일된 StateGraph (호출 전용 MemorySaver 포함)
     """
-    # 매번 새로 생성하여 이벤트 루프 문제 해결
-    return create_graph()
+    return _get_compiled_graph().copy(update={"checkpointer": MemorySaver()})
 
 
 # 하위 호환성을 위한 별칭
@@ -145,10 +173,12 @@ async def run_graph(query: str, thread_id: str = "default") -> dict:
         "chunks_to_expand": []
     }
     
-    # 설정 (스레드 ID 포함)
-    config = {"configurable": {"thread_id": thread_id}}
-    
     try:
+        # 설정 (스레드 ID 포함)
+        # DB 세션은 공유하지 않음: 각 노드가 DB 작업 단위로 짧은 세션을 열어
+        # LLM 호출 동안 풀 연결을 점유하지 않도록 합니다.
+        config = {"configurable": {"thread_id": thread_id}}
+        
         # 그래프 생성 및 실행
         graph = get_graph()
         final_state = await graph.ainvoke(initial_state, config)
@@ -181,7 +211,8 @@ async def stream_graph(query: str, thread_id: str = "default"):
         thread_id: 대화 스레드 ID
     
     Yields:
-        각 노드의 실행 결과
+        각 노드의 실행 결과, 답변 생성 중에는 {"answer_token": str} 이벤트
+        (스트리밍된 답변이 채택되지 않으면 {"answer_replace": 최종 답변} 이벤트)
     """
     logger.info(f"그래프 스트리밍 시작: query='{query[:50]}...'")
     
@@ -201,15 +232,44 @@ async def stream_graph(query: str, thread_id: str = "default"):
         "chunks_to_expand": []
     }
     
-    # 설정
-    config = {"configurable": {"thread_id": thread_id}}
+    # 노드 이벤트와 답변 토큰을 하나의 큐로 합쳐서 전달
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    async def stream_cb(delta: str, replace: bool = False):
+        """answer_agent의 답변 토큰을 스트림에 추가 (replace=True면 지금까지의 토큰을 delta로 교체)"""
+        await queue.put({"answer_replace": delta} if replace else {"answer_token": delta})
+    
+    async def run():
+        """그래프를 실행하며 노드 이벤트를 큐에 추가"""
+        try:
+            # 설정 (stream_cb는 상태가 아닌 config로 전달하여 체크포인트 직렬화 대상에서 제외)
+            # DB 세션은 공유하지 않음 (노드별 짧은 세션 사용, run_graph와 동일)
+            config = {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "stream_cb": stream_cb
+                }
+            }
+            
+            graph = get_graph()
+            async for event in graph.astream(initial_state, config):
+                logger.debug(f"스트리밍 이벤트: {list(event.keys())}")
+                await queue.put(event)
+        finally:
+            await queue.put(_STREAM_END)
     
     try:
         # 그래프 생성 및 스트리밍 실행
-        graph = get_graph()
-        async for event in graph.astream(initial_state, config):
-            logger.debug(f"스트리밍 이벤트: {list(event.keys())}")
-            yield event
+        task = asyncio.create_task(run())
+        try:
+            while (event := await queue.get()) is not _STREAM_END:
+                yield event
+        finally:
+            if not task.done():
+                task.cancel()
+        
+        # 그래프 실행 중 발생한 예외 전파
+        await task
     
     except Exception as e:
         logger.error(f"그래프 스트리밍 중 오류 발생: {e}", exc_info=True)
@@ -4,9 +4,11 @@ Management Agent
 """
 import logging
 from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from agents.state import ISPLState
-from services.document_management import DocumentManagementService
+from services.document_management import document_management_service
+from services.document_list_cache import document_list_cache
 from core.database import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
@@ -15,9 +17,21 @@ logger = logging.getLogger(__name__)
 class ManagementAgent:
     """문서 관리를 담당하는 Agent"""
     
+    LIST_PREVIEW_SIZE = 5  # 채팅 응답에 표시할 최대 문서 수
+    
+    ACTIONS = ("list", "delete", "view")
+    
+    # management_action이 없을 때 질의에서 작업을 추론하는 키워드 (앞쪽 우선)
+    ACTION_KEYWORDS = (
+        ("목록", "list"),
+        ("삭제", "delete"),
+        ("조회", "view"),
+        ("보기", "view"),
+    )
+    
     def __init__(self):
         """Management Agent 초기화"""
-        self.doc_service = DocumentManagementService()
+        self.doc_service = document_management_service
         logger.info("ManagementAgent 초기화 완료")
     
     async def manage(self, state: ISPLState) -> dict:
@@ -35,44 +49,92 @@ class ManagementAgent:
         Returns:
             업데이트할 상태 딕셔너리
         """
-        query = state.get("query", "")
-        management_action = state.get("management_action", "list")
+        # 작업 1건당 세션 1개 사용
+        async with AsyncSessionLocal() as session:
+            return await self._dispatch(session, state)
+    
+    async def _dispatch(self, session: AsyncSession, state: ISPLState) -> dict:
+        """
+        요청된 관리 작업을 실행합니다.
+        
+        Args:
+            session: DB 세션
+            state: 현재 상태
+        
+        Returns:
+            업데이트할 상태 딕셔너리
+        """
+        management_action = state.get("management_action")
+        
+        # 명시적 작업이 없을 때만 질의 키워드로 판단
+        if management_action not in self.ACTIONS:
+            query = state.get("query", "")
+            management_action = next(
+                (action for keyword, action in self.ACTION_KEYWORDS if keyword in query),
+                "list"  # 기본값: 목록 조회
+            )
+        
+        if management_action == "delete":
+            return await self._delete_or_require_id(session, state)
+        
+        if management_action == "view" and state.get("document_id"):
+            return await self._view_document(session, state["document_id"])
+        
+        # 목록 조회 (view에 document_id가 없는 경우 포함)
+        return await self._list_documents(session, state)
+    
+    async def _delete_or_require_id(self, session, state: ISPLState) -> dict:
+        """
+        document_id가 있으면 문서를 삭제하고, 없으면 오류를 반환합니다.
+        
+        Args:
+            session: DB 세션
+            state: 현재 상태
+        
+        Returns:
+            업데이트할 상태 딕셔너리
+        """
         document_id = state.get("document_id")
+        if document_id:
+            return await self._delete_document(session, document_id)
         
-        session = AsyncSessionLocal()
+        return self._error_result(
+            "delete",
+            "삭제할 문서 ID가 필요합니다",
+            "삭제할 문서를 지정해주세요.",
+            task_error="document_id 필요"
+        )
+    
+    @staticmethod
+    def _error_result(
+        action: str,
+        error: str,
+        final_answer: str,
+        task_error: Optional[str] = None
+    ) -> dict:
+        """
+        관리 작업 실패 시 반환할 상태 딕셔너리를 생성합니다.
         
-        try:
-            if management_action == "list" or "목록" in query:
-                return await self._list_documents(session, state)
-            
-            elif management_action == "delete" or "삭제" in query:
-                if document_id:
-                    return await self._delete_document(session, document_id)
-                else:
-                    return {
-                        "error": "삭제할 문서 ID가 필요합니다",
-                        "final_answer": "삭제할 문서를 지정해주세요.",
-                        "task_results": {
-                            "management": {
-                                "success": False,
-                                "error": "document_id 필요"
-                            }
-                        }
-                    }
-            
-            elif management_action == "view" or "조회" in query or "보기" in query:
-                if document_id:
-                    return await self._view_document(session, document_id)
-                else:
-                    # document_id가 없으면 목록 조회
-                    return await self._list_documents(session, state)
-            
-            else:
-                # 기본값: 목록 조회
-                return await self._list_documents(session, state)
+        Args:
+            action: 관리 작업 타입 (delete/view)
+            error: 상태의 error 메시지
+            final_answer: 사용자에게 보여줄 응답
+            task_error: task_results에 기록할 오류 (없으면 error와 동일)
         
-        finally:
-            await session.close()
+        Returns:
+            업데이트할 상태 딕셔너리
+        """
+        return {
+            "error": error,
+            "final_answer": final_answer,
+            "task_results": {
+                "management": {
+                    "success": False,
+                    "action": action,
+                    "error": task_error or error
+                }
+            }
+        }
     
     async def _list_documents(
         self,
@@ -98,10 +160,11 @@ class ManagementAgent:
         sort_by = state.get("sort_by", "created_at")
         sort_order = state.get("sort_order", "desc")
         offset = state.get("offset", 0)
-        limit = state.get("limit", 20)
+        # 채팅 응답은 미리보기만 렌더링하므로 그만큼만 조회 (총 개수는 COUNT로 별도 반환)
+        limit = state.get("detailed_limit") or self.LIST_PREVIEW_SIZE
         
-        result = await self.doc_service.list_documents(
-            session=session,
+        # 목록은 업로드/삭제 시에만 바뀌므로 짧은 TTL 캐시 우선 조회
+        cache_key = document_list_cache.get_cache_key(
             filename=filename,
             document_type=document_type,
             company_name=company_name,
@@ -110,6 +173,20 @@ class ManagementAgent:
             offset=offset,
             limit=limit
         )
+        result = await document_list_cache.get(cache_key)
+        
+        if result is None:
+            result = await self.doc_service.list_documents(
+                session=session,
+                filename=filename,
+                document_type=document_type,
+                company_name=company_name,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                offset=offset,
+                limit=limit
+            )
+            await document_list_cache.set(cache_key, result)
         
         documents = result['documents']
         total = result['total']
@@ -118,18 +195,20 @@ class ManagementAgent:
         if total == 0:
             answer = "등록된 약관이 없습니다."
         else:
-            answer = f"**📋 등록된 약관 목록** (총 {total}개)\n\n"
+            parts = [f"**📋 등록된 약관 목록** (총 {total}개)\n\n"]
             
-            for idx, doc in enumerate(documents[:5], 1):  # 최대 5개만 표시
-                answer += f"**{idx}. {doc['filename']}**\n"
+            for idx, doc in enumerate(documents[:self.LIST_PREVIEW_SIZE], 1):  # 미리보기 개수만 표시
+                parts.append(f"**{idx}. {doc['filename']}**\n")
                 if doc['company_name']:
-                    answer += f"   - 회사: {doc['company_name']}\n"
-                answer += f"   - 페이지: {doc['total_pages'] or 'N/A'}, 청크: {doc['total_chunks']}개\n"
-                answer += f"   - 등록일: {doc['created_at'][:10] if doc['created_at'] else 'N/A'}\n"
-                answer += "\n"
+                    parts.append(f"   - 회사: {doc['company_name']}\n")
+                parts.append(f"   - 페이지: {doc['total_pages'] or 'N/A'}, 청크: {doc['total_chunks']}개\n")
+                parts.append(f"   - 등록일: {doc['created_at'][:10] if doc['created_at'] else 'N/A'}\n")
+                parts.append("\n")
+            
+            if total > self.LIST_PREVIEW_SIZE:
+                parts.append(f"\n...외 {total - self.LIST_PREVIEW_SIZE}개 문서")
             
-            if total > 5:
-                answer += f"\n...외 {total - 5}개 문서"
+            answer = "".join(parts)
         
         return {
             "management_result": result,
@@ -168,6 +247,8 @@ class ManagementAgent:
             )
             
             if result['success']:
+                await document_list_cache.invalidate()
+                
                 answer = (
                     f"✅ 문서가 삭제되었습니다.\n\n"
                     f"**파일명**: {result.get('filename', 'N/A')}\n"
@@ -189,32 +270,12 @@ class ManagementAgent:
             else:
                 error_msg = result.get('error', '알 수 없는 오류')
                 
-                return {
-                    "error": error_msg,
-                    "final_answer": f"❌ 문서 삭제 실패: {error_msg}",
-                    "task_results": {
-                        "management": {
-                            "success": False,
-                            "action": "delete",
-                            "error": error_msg
-                        }
-                    }
-                }
+                return self._error_result("delete", error_msg, f"❌ 문서 삭제 실패: {error_msg}")
         
         except Exception as e:
             logger.error(f"문서 삭제 중 오류: {e}", exc_info=True)
             
-            return {
-                "error": str(e),
-                "final_answer": f"❌ 문서 삭제 중 오류가 발생했습니다: {str(e)}",
-                "task_results": {
-                    "management": {
-                        "success": False,
-                        "action": "delete",
-                        "error": str(e)
-                    }
-                }
-            }
+            return self._error_result("delete", str(e), f"❌ 문서 삭제 중 오류가 발생했습니다: {str(e)}")
     
     async def _view_document(
         self,
@@ -268,32 +329,12 @@ class ManagementAgent:
             else:
                 error_msg = result.get('error', '문서를 찾을 수 없습니다')
                 
-                return {
-                    "error": error_msg,
-                    "final_answer": f"❌ {error_msg}",
-                    "task_results": {
-                        "management": {
-                            "success": False,
-                            "action": "view",
-                            "error": error_msg
-                        }
-                    }
-                }
+                return self._error_result("view", error_msg, f"❌ {error_msg}")
         
         except Exception as e:
             logger.error(f"문서 조회 중 오류: {e}", exc_info=True)
             
-            return {
-                "error": str(e),
-                "final_answer": f"❌ 문서 조회 중 오류가 발생했습니다: {str(e)}",
-                "task_results": {
-                    "management": {
-                        "success": False,
-                        "action": "view",
-                        "error": str(e)
-                    }
-                }
-            }
+            return self._error_result("view", str(e), f"❌ 문서 조회 중 오류가 발생했습니다: {str(e)}")
 
 
 # 전역 Management Agent 인스턴스
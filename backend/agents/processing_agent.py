@@ -2,14 +2,19 @@
 Processing Agent
 PDF 업로드 및 전처리를 담당하는 Agent
 """
+import asyncio
 import logging
 from pathlib import Path
 from datetime import datetime
 import shutil
-from typing import Optional
+import uuid
+from typing import AsyncIterator, Optional
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from agents.state import ISPLState
 from services.service_container import get_pdf_processor
+from services.document_list_cache import document_list_cache
 from core.config import settings
 from core.database import AsyncSessionLocal
 from models.document import Document
@@ -17,6 +22,12 @@ from models.document import Document
 logger = logging.getLogger(__name__)
 
 
+def _write_file(path: Path, data: bytes):
+    """파일을 동기적으로 저장합니다 (스레드 실행용)"""
+    with path.open("wb") as f:
+        f.write(data)
+
+
 class ProcessingAgent:
     """PDF 업로드 및 전처리를 담당하는 Agent"""
     
@@ -24,60 +35,89 @@ class ProcessingAgent:
         """Processing Agent 초기화 (서비스 컨테이너에서 싱글톤 인스턴스 사용)"""
         # 서비스 컨테이너에서 싱글톤 인스턴스 가져오기
         self.pdf_processor = get_pdf_processor()
+        
+        # 업로드 디렉토리는 프로세스 전역이므로 초기화 시 한 번만 생성
+        self.upload_dir = Path(settings.UPLOAD_DIR) / "documents"
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
         logger.info("ProcessingAgent 초기화 완료 (싱글톤 서비스 사용)")
     
-    async def _save_file(
-        self,
-        file_data: bytes,
-        filename: str,
-        document_id: Optional[int] = None
-    ) -> Path:
+    def _build_file_path(self, filename: str) -> Path:
         """
-        파일을 저장합니다.
+        저장할 파일 경로를 생성합니다.
+        
+        파일명에 UUID를 붙여 document_id 없이도 최종 경로가 정해지므로
+        파일 저장과 Document INSERT를 동시에 진행할 수 있습니다.
         
         Args:
-            file_data: 파일 바이너리 데이터
             filename: 원본 파일명
-            document_id: 문서 ID (선택)
         
         Returns:
-            저장된 파일 경로
+            저장할 파일 경로
         """
-        upload_dir = Path(settings.UPLOAD_DIR) / "documents"
-        upload_dir.mkdir(parents=True, exist_ok=True)
-        
-        # 파일명 생성
-        timestamp = int(datetime.now().timestamp())
         original_name = Path(filename).stem
+        return self.upload_dir / f"{original_name}_{uuid.uuid4().hex[:12]}.pdf"
+    
+    async def _save_file(self, pdf_path: Path, file_data: bytes):
+        """
+        파일을 저장합니다.
         
-        if document_id:
-            pdf_filename = f"{original_name}_{document_id}.pdf"
-        else:
-            pdf_filename = f"{original_name}_{timestamp}.pdf"
-        
-        pdf_path = upload_dir / pdf_filename
+        디스크 쓰기는 스레드에서 실행하여 이벤트 루프를 막지 않습니다.
         
-        # 파일 저장
-        with pdf_path.open("wb") as f:
-            f.write(file_data)
+        Args:
+            pdf_path: 저장할 파일 경로
+            file_data: 파일 바이너리 데이터
+        """
+        await asyncio.to_thread(_write_file, pdf_path, file_data)
         
         logger.info(f"파일 저장 완료: {pdf_path}")
+    
+    async def _save_stream(self, pdf_path: Path, file_stream: AsyncIterator[bytes]) -> int:
+        """
+        청크 스트림을 파일로 저장합니다.
         
-        return pdf_path
+        전체 파일을 메모리에 올리지 않고 청크 단위로 기록합니다.
+        (실패 시 일부만 기록된 파일은 삭제)
+        
+        Args:
+            pdf_path: 저장할 파일 경로
+            file_stream: 파일 바이트 청크 비동기 이터레이터
+        
+        Returns:
+            저장된 파일 크기 (bytes)
+        """
+        file_size = 0
+        f = await asyncio.to_thread(pdf_path.open, "wb")
+        try:
+            async for chunk in file_stream:
+                await asyncio.to_thread(f.write, chunk)
+                file_size += len(chunk)
+        except BaseException:
+            await asyncio.to_thread(f.close)
+            await asyncio.to_thread(pdf_path.unlink, missing_ok=True)
+            raise
+        await asyncio.to_thread(f.close)
+        
+        logger.info(f"파일 저장 완료 (스트리밍): {pdf_path}, {file_size} bytes")
+        
+        return file_size
     
     async def _create_document(
         self,
+        session: AsyncSession,
         pdf_path: Path,
+        file_size: int,
         original_filename: str,
         document_type: str = "policy",
         insurance_type: Optional[str] = None,
         company_name: Optional[str] = None
     ) -> int:
         """
-        Document 레코드를 생성합니다.
+        Document 레코드를 생성합니다 (INSERT 1회 + commit 1회).
         
         Args:
-            pdf_path: PDF 파일 경로
+            session: DB 세션
+            pdf_path: PDF 파일 경로 (최종 경로)
+            file_size: 파일 크기 (bytes)
             original_filename: 원본 파일명
             document_type: 문서 타입
             insurance_type: 보험 타입
@@ -86,37 +126,29 @@ class ProcessingAgent:
         Returns:
             생성된 문서 ID
         """
-        session = AsyncSessionLocal()
+        document = Document(
+            filename=pdf_path.name,
+            original_filename=original_filename,
+            file_path=str(pdf_path),
+            file_size=file_size,
+            document_type=document_type,
+            insurance_type=insurance_type,
+            company_name=company_name,
+            processing_status="processing"
+        )
         
-        try:
-            file_size = pdf_path.stat().st_size
-            
-            document = Document(
-                filename=pdf_path.name,
-                original_filename=original_filename,
-                file_path=str(pdf_path),
-                file_size=file_size,
-                document_type=document_type,
-                insurance_type=insurance_type,
-                company_name=company_name,
-                processing_status="processing"
-            )
-            
-            session.add(document)
-            await session.flush()  # ID 생성
-            
-            document_id = document.id
-            await session.commit()
-            
-            logger.info(f"Document 레코드 생성: ID={document_id}")
-            
-            return document_id
+        session.add(document)
+        await session.commit()
+        await document_list_cache.invalidate()
+        
+        document_id = document.id
+        logger.info(f"Document 레코드 생성: ID={document_id}")
         
-        finally:
-            await session.close()
+        return document_id
     
     async def _update_document_status(
         self,
+        session: AsyncSession,
         document_id: int,
         status: str,
         total_pages: Optional[int] = None
@@ -124,65 +156,27 @@ class ProcessingAgent:
         """
         Document 상태를 업데이트합니다.
         
+        조회(SELECT) 없이 UPDATE 문 하나로 반영합니다.
+        
         Args:
+            session: DB 세션
             document_id: 문서 ID
             status: 처리 상태
             total_pages: 총 페이지 수
         """
-        session = AsyncSessionLocal()
+        values = {"processing_status": status}
+        if status == "completed":
+            values["processed_timestamp"] = datetime.now()
+        if total_pages:
+            values["total_pages"] = total_pages
         
-        try:
-            from sqlalchemy import select
-            
-            stmt = select(Document).where(Document.id == document_id)
-            result = await session.execute(stmt)
-            document = result.scalar_one_or_none()
-            
-            if document:
-                document.processing_status = status
-                if status == "completed":
-                    document.processed_timestamp = datetime.now()
-                if total_pages:
-                    document.total_pages = total_pages
-                
-                await session.commit()
-                
-                logger.info(f"Document 상태 업데이트: ID={document_id}, status={status}")
+        await session.execute(
+            update(Document).where(Document.id == document_id).values(**values)
+        )
+        await session.commit()
+        await document_list_cache.invalidate()
         
-        finally:
-            await session.close()
-    
-    async def _update_document_file_info(
-        self,
-        document_id: int,
-        file_path: Path
-    ):
-        """
-        Document의 파일 정보를 업데이트합니다.
-        
-        Args:
-            document_id: 문서 ID
-            file_path: 새로운 파일 경로
-        """
-        session = AsyncSessionLocal()
-        
-        try:
-            from sqlalchemy import select
-            
-            stmt = select(Document).where(Document.id == document_id)
-            result = await session.execute(stmt)
-            document = result.scalar_one_or_none()
-            
-            if document:
-                document.filename = file_path.name
-                document.file_path = str(file_path)
-                
-                await session.commit()
-                
-                logger.info(f"Document 파일 정보 업데이트: ID={document_id}, filename={file_path.name}")
-        
-        finally:
-            await session.close()
+        logger.info(f"Document 상태 업데이트: ID={document_id}, status={status}")
     
     async def process(self, state: ISPLState) -> dict:
         """
@@ -198,18 +192,34 @@ class ProcessingAgent:
         Args:
             state: 현재 상태
         
+        Returns:
+            업데이트할 상태 딕셔너리
+        """
+        # 문서 생성/파일 정보/청크 저장/상태 갱신 전체에서 업로드 1건당 세션 1개 사용
+        async with AsyncSessionLocal() as session:
+            return await self._process(state, session)
+    
+    async def _process(self, state: ISPLState, session: AsyncSession) -> dict:
+        """
+        하나의 DB 세션으로 PDF 파일을 처리합니다.
+        
+        Args:
+            state: 현재 상태
+            session: DB 세션
+        
         Returns:
             업데이트할 상태 딕셔너리
         """
         # state에서 파일 정보 추출
         file_data = state.get("file_data")
+        file_stream = state.get("file_stream")
         filename = state.get("filename", "upload.pdf")
         processing_method = state.get("processing_method", "pymupdf")
         document_type = state.get("document_type", "policy")
         insurance_type = state.get("insurance_type")
         company_name = state.get("company_name")
         
-        if not file_data:
+        if not file_data and file_stream is None:
             logger.error("파일 데이터가 없습니다")
             return {
                 "error": "파일 데이터가 없습니다",
@@ -228,110 +238,122 @@ class ProcessingAgent:
                 f"method={processing_method}"
             )
             
-            # 1. 파일 임시 저장 (document_id 없이)
-            pdf_path = await self._save_file(file_data, filename)
+            # 1. 최종 파일 경로 결정
+            pdf_path = self._build_file_path(filename)
             
-            # 2. Document 레코드 생성
-            document_id = await self._create_document(
-                pdf_path,
-                filename,
-                document_type,
-                insurance_type,
-                company_name
-            )
+            if file_stream is not None:
+                # 2. 스트림 저장 후 Document 레코드 생성 (저장이 끝나야 파일 크기를 알 수 있음)
+                file_size = await self._save_stream(pdf_path, file_stream)
+                try:
+                    document_id = await self._create_document(
+                        session,
+                        pdf_path,
+                        file_size,
+                        filename,
+                        document_type,
+                        insurance_type,
+                        company_name
+                    )
+                except Exception:
+                    await asyncio.to_thread(pdf_path.unlink, missing_ok=True)
+                    raise
+            else:
+                # 2. 파일 저장 + Document 레코드 생성 (서로 독립적이므로 동시 실행)
+                save_result, document_id = await asyncio.gather(
+                    self._save_file(pdf_path, file_data),
+                    self._create_document(
+                        session,
+                        pdf_path,
+                        len(file_data),
+                        filename,
+                        document_type,
+                        insurance_type,
+                        company_name
+                    ),
+                    return_exceptions=True
+                )
+                
+                if isinstance(document_id, BaseException):
+                    # 레코드 생성 실패 시 저장된 파일 정리
+                    if not isinstance(save_result, BaseException):
+                        await asyncio.to_thread(pdf_path.unlink, missing_ok=True)
+                    raise document_id
+                
+                if isinstance(save_result, BaseException):
+                    # 파일 저장 실패 시 이미 생성된 레코드는 실패 상태로 표시
+                    await self._update_document_status(session, document_id, "failed")
+                    raise save_result
             
-            # 3. 파일명 업데이트 (document_id 포함)
-            final_pdf_path = await self._save_file(
-                file_data,
-                filename,
-                document_id
+            # 3. PDF 처리 (청킹 및 임베딩 포함)
+            result = await self.pdf_processor.process_pdf(
+                str(pdf_path),
+                document_id,
+                save_markdown=True,
+                method=processing_method,
+                enable_chunking=True,  # 항상 활성화
+                db_session=session
             )
             
-            # 기존 파일 삭제
-            if pdf_path != final_pdf_path and pdf_path.exists():
-                pdf_path.unlink()
-                logger.info(f"임시 파일 삭제: {pdf_path}")
-            
-            pdf_path = final_pdf_path
-            
-            # Document 레코드의 파일 정보 업데이트
-            await self._update_document_file_info(document_id, pdf_path)
-            
-            # 4. PDF 처리 (청킹 및 임베딩 포함)
-            session = AsyncSessionLocal()
-            
-            try:
-                result = await self.pdf_processor.process_pdf(
-                    str(pdf_path),
+            if result['status'] == 'success':
+                # 4. Document 상태 업데이트
+                total_pages = result['data']['metadata'].get('total_pages')
+                await self._update_document_status(
+                    session,
                     document_id,
-                    save_markdown=True,
-                    method=processing_method,
-                    enable_chunking=True,  # 항상 활성화
-                    db_session=session
+                    "completed",
+                    total_pages
                 )
                 
-                if result['status'] == 'success':
-                    # 5. Document 상태 업데이트
-                    total_pages = result['data']['metadata'].get('total_pages')
-                    await self._update_document_status(
-                        document_id,
-                        "completed",
-                        total_pages
-                    )
-                    
-                    total_chunks = result['data'].get('chunks', {}).get('total_chunks', 0)
-                    
-                    logger.info(
-                        f"PDF 처리 완료: document_id={document_id}, "
-                        f"pages={total_pages}, chunks={total_chunks}"
-                    )
-                    
-                    return {
-                        "processing_result": {
+                total_chunks = result['data'].get('chunks', {}).get('total_chunks', 0)
+                
+                logger.info(
+                    f"PDF 처리 완료: document_id={document_id}, "
+                    f"pages={total_pages}, chunks={total_chunks}"
+                )
+                
+                return {
+                    "processing_result": {
+                        "document_id": document_id,
+                        "filename": filename,
+                        "total_pages": total_pages,
+                        "total_chunks": total_chunks,
+                        "processing_time": result.get('processing_time_ms', 0)
+                    },
+                    "task_results": {
+                        "processing": {
+                            "success": True,
                             "document_id": document_id,
-                            "filename": filename,
-                            "total_pages": total_pages,
-                            "total_chunks": total_chunks,
-                            "processing_time": result.get('processing_time_ms', 0)
-                        },
-                        "task_results": {
-                            "processing": {
-                                "success": True,
-                                "document_id": document_id,
-                                "total_chunks": total_chunks
-                            }
-                        },
-                        "final_answer": (
-                            f"✅ 약관 등록 완료!\n\n"
-                            f"**문서 정보**\n"
-                            f"- 파일명: {filename}\n"
-                            f"- 페이지: {total_pages}페이지\n"
-                            f"- 청크: {total_chunks}개\n\n"
-                            f"이제 이 약관에 대해 질문하실 수 있습니다."
-                        ),
-                        "error": None
-                    }
-                else:
-                    # 처리 실패
-                    await self._update_document_status(document_id, "failed")
-                    
-                    error_msg = result.get('error', '알 수 없는 오류')
-                    logger.error(f"PDF 처리 실패: {error_msg}")
-                    
-                    return {
-                        "error": f"PDF 처리 실패: {error_msg}",
-                        "processing_result": None,
-                        "task_results": {
-                            "processing": {
-                                "success": False,
-                                "error": error_msg
-                            }
-                        },
-                        "final_answer": f"죄송합니다. 파일 처리 중 오류가 발생했습니다: {error_msg}"
-                    }
-            
-            finally:
-                await session.close()
+                            "total_chunks": total_chunks
+                        }
+                    },
+                    "final_answer": (
+                        f"✅ 약관 등록 완료!\n\n"
+                        f"**문서 정보**\n"
+                        f"- 파일명: {filename}\n"
+                        f"- 페이지: {total_pages}페이지\n"
+                        f"- 청크: {total_chunks}개\n\n"
+                        f"이제 이 약관에 대해 질문하실 수 있습니다."
+                    ),
+                    "error": None
+                }
+            else:
+                # 처리 실패
+                await self._update_document_status(session, document_id, "failed")
+                
+                error_msg = result.get('error', '알 수 없는 오류')
+                logger.error(f"PDF 처리 실패: {error_msg}")
+                
+                return {
+                    "error": f"PDF 처리 실패: {error_msg}",
+                    "processing_result": None,
+                    "task_results": {
+                        "processing": {
+                            "success": False,
+                            "error": error_msg
+                        }
+                    },
+                    "final_answer": f"죄송합니다. 파일 처리 중 오류가 발생했습니다: {error_msg}"
+                }
         
         except Exception as e:
             logger.error(f"Processing Agent 오류: {e}", exc_info=True)
@@ -4,7 +4,11 @@ Search Agent
 질의 전처리를 통해 검색 정확도를 향상시킵니다.
 Re-ranking을 통해 정확한 매칭을 상위로 올립니다.
 """
+import copy
 import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agents.state import ISPLState
@@ -12,6 +16,8 @@ from services.vector_search import VectorSearchService
 from services.hybrid_search import HybridSearchService
 from services.query_preprocessor import QueryPreprocessor
 from services.reranker import reranker_service  # ⭐ Re-ranker 추가
+from services.popular_chunks import popular_chunk_service
+from services.document_list_cache import document_list_cache
 from models.preprocessed_query import PreprocessedQuery
 from core.database import AsyncSessionLocal
 
@@ -21,11 +27,16 @@ logger = logging.getLogger(__name__)
 class SearchAgent:
     """하이브리드 검색(벡터 + 키워드)을 수행하는 Agent"""
     
+    RESULT_CACHE_SIZE = 1024  # 검색 결과 캐시 최대 질의 수
+    RESULT_CACHE_TTL = 60.0  # 검색 결과 캐시 유지 시간 (초)
+    
     def __init__(self):
         """Search Agent 초기화"""
         self.vector_search_service = VectorSearchService()  # fallback 용도로 유지
         self.hybrid_search_service = HybridSearchService()  # 기본 검색
         self.query_preprocessor = QueryPreprocessor()  # 질의 전처리
+        # 질의 → (만료 시각, 문서 버전, 반환값) - 후속 질문 등 반복 질의의 검색 생략
+        self._result_cache: OrderedDict[str, Tuple[float, int, dict]] = OrderedDict()
         logger.info("SearchAgent 초기화 완료 (HybridSearchService + QueryPreprocessor)")
     
     async def search(self, state: ISPLState) -> dict:
@@ -38,6 +49,109 @@ class SearchAgent:
         Args:
             state: 현재 상태
         
+        Returns:
+            업데이트할 상태 딕셔너리
+        """
+        query = state.get("query", "")
+        start_time = time.time()
+        
+        # 문서 변경 버전 (워커 간 공유, 검색 도중 문서가 변경될 수 있으므로 검색 시작 시점 기준)
+        version = await document_list_cache.get_version()
+        
+        # 검색 1건당 세션 1개 사용
+        # 세션은 첫 쿼리 실행 시점에 엔진 풀에서 연결을 가져오고 종료 시 반납합니다.
+        async with AsyncSessionLocal() as session:
+            # 같은 질의를 최근에 검색했고 그 사이 문서 변경이 없으면 결과 재사용
+            cached = self._get_cached_result(query, version)
+            if cached is not None:
+                await self._log_cached_search(session, cached, start_time)
+                return cached
+            
+            result = await self._search(state, session)
+        
+        if version is not None and result.get("task_results", {}).get("search", {}).get("success"):
+            self._cache_result(query, version, result)
+        
+        return result
+    
+    def _get_cached_result(self, query: str, version: Optional[int]) -> Optional[dict]:
+        """
+        캐시된 검색 결과를 조회합니다 (만료되었거나 문서가 변경되었으면 None).
+        
+        Args:
+            query: 사용자 질의
+            version: 현재 문서 변경 버전 (조회 실패 시 None이며 캐시를 사용하지 않음)
+        
+        Returns:
+            업데이트할 상태 딕셔너리 복사본 (없으면 None)
+        """
+        entry = self._result_cache.get(query)
+        if entry is None or version is None:
+            return None
+        
+        expires_at, cached_version, result = entry
+        if time.monotonic() > expires_at or cached_version != version:
+            del self._result_cache[query]
+            return None
+        
+        self._result_cache.move_to_end(query)
+        logger.info("검색 결과 캐시 HIT: '%s...'", query[:50])
+        
+        # 캐시 HIT도 검색 빈도에 반영 (답변 프롬프트 캐싱 prefix 구성용)
+        popular_chunk_service.record([item["chunk_id"] for item in result["search_results"]])
+        
+        # 이후 Agent가 결과 딕셔너리를 수정해도 캐시가 오염되지 않도록 복사본 반환
+        return copy.deepcopy(result)
+    
+    async def _log_cached_search(self, session: AsyncSession, result: dict, start_time: float):
+        """
+        캐시 HIT 검색도 검색 로그에 기록합니다 (검색 통계 유지).
+        
+        Args:
+            session: DB 세션
+            result: 캐시된 상태 딕셔너리
+            start_time: 검색 시작 시각
+        """
+        search = result["task_results"]["search"]
+        await self.hybrid_search_service.vector_search_service._log_search(
+            session=session,
+            query=search["preprocessing"]["standardized_query"],  # 검색 시 기록한 질의와 동일
+            search_type="hybrid",
+            results_count=search["count"],
+            top_similarity=max(
+                (item.get("similarity", 0.0) for item in result["search_results"]),
+                default=0.0
+            ),
+            response_time_ms=int((time.time() - start_time) * 1000),
+            user_id=None  # 추후 사용자 인증 추가 시 사용
+        )
+    
+    def _cache_result(self, query: str, version: int, result: dict):
+        """
+        성공한 검색 결과를 캐시에 저장합니다 (LRU + TTL).
+        
+        Args:
+            query: 사용자 질의
+            version: 검색 시작 시점의 문서 변경 버전
+            result: 업데이트할 상태 딕셔너리
+        """
+        self._result_cache[query] = (
+            time.monotonic() + self.RESULT_CACHE_TTL,
+            version,
+            copy.deepcopy(result)
+        )
+        self._result_cache.move_to_end(query)
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+    
+    async def _search(self, state: ISPLState, session: AsyncSession) -> dict:
+        """
+        하나의 DB 세션으로 하이브리드 검색을 수행합니다.
+        
+        Args:
+            state: 현재 상태
+            session: DB 세션
+        
         Returns:
             업데이트할 상태 딕셔너리
         """
@@ -83,66 +197,60 @@ class SearchAgent:
             )
         
         try:
-            # 데이터베이스 세션 생성
-            logger.debug("AsyncSessionLocal 생성 중...")
-            session = AsyncSessionLocal()
+            # 표준화된 쿼리로 하이브리드 검색 수행 (벡터 + 키워드)
+            logger.debug("하이브리드 검색 서비스 호출 중...")
+            results, total_tokens = await self.hybrid_search_service.hybrid_search(
+                session=session,
+                query=preprocessed.standardized,  # 표준화된 쿼리 사용
+                limit=5,
+                max_tokens=20000,  # gpt-4o 변경으로 8000 → 20000 증가
+                threshold=threshold,  # 동적 threshold
+                clause_number=preprocessed.clause_number,  # 추출된 조항 번호
+                user_id=None  # 추후 사용자 인증 추가 시 사용
+            )
             
-            try:
-                # 표준화된 쿼리로 하이브리드 검색 수행 (벡터 + 키워드)
-                logger.debug("하이브리드 검색 서비스 호출 중...")
-                results, total_tokens = await self.hybrid_search_service.hybrid_search(
-                    session=session,
-                    query=preprocessed.standardized,  # 표준화된 쿼리 사용
-                    limit=5,
-                    max_tokens=20000,  # gpt-4o 변경으로 8000 → 20000 증가
-                    threshold=threshold,  # 동적 threshold
-                    clause_number=preprocessed.clause_number,  # 추출된 조항 번호
-                    user_id=None  # 추후 사용자 인증 추가 시 사용
+            # ⭐ Re-ranking 적용 (정확한 매칭을 상위로)
+            # 결과 객체로 바로 재정렬하고 딕셔너리 변환은 정렬 후 한 번만 수행
+            if len(results) > 1:
+                logger.info(f"Re-ranking 적용 전: {len(results)}개 결과")
+                search_results = reranker_service.rerank_results(
+                    query=query,  # 원본 질의 사용
+                    results=results,
+                    keywords=preprocessed.expanded_terms  # 전처리된 키워드 사용
                 )
-                
-                # 검색 결과를 딕셔너리로 변환
+                logger.info(f"Re-ranking 적용 완료: {len(search_results)}개 결과 재정렬")
+            else:
                 search_results = [result.to_dict() for result in results]
-                
-                # ⭐ Re-ranking 적용 (정확한 매칭을 상위로)
-                if search_results and len(search_results) > 1:
-                    logger.info(f"Re-ranking 적용 전: {len(search_results)}개 결과")
-                    search_results = reranker_service.rerank(
-                        query=query,  # 원본 질의 사용
-                        search_results=search_results,
-                        keywords=preprocessed.expanded_terms  # 전처리된 키워드 사용
-                    )
-                    logger.info(f"Re-ranking 적용 완료: {len(search_results)}개 결과 재정렬")
-                
-                logger.info(
-                    f"하이브리드 검색 완료: {len(results)}개 결과, "
-                    f"{total_tokens}토큰"
-                )
-                
-                return {
-                    "search_results": search_results,
-                    "task_results": {
-                        "search": {
-                            "success": True,
-                            "count": len(results),
-                            "query": query,
-                            "total_tokens": total_tokens,
-                            "search_type": "hybrid",
-                            "preprocessing": {
-                                "original_query": preprocessed.original,
-                                "standardized_query": preprocessed.standardized,
-                                "clause_number": preprocessed.clause_number,
-                                "expanded_terms": preprocessed.expanded_terms  # ⭐ 리스트 전체 저장
-                            }
-                        }
-                    },
-                    "next_agent": "answer_agent",
-                    "error": None
-                }
             
-            finally:
-                # 세션 정리
-                await session.close()
-                logger.debug("세션 종료 완료")
+            # 자주 검색되는 청크 집계 (답변 프롬프트 캐싱 prefix 구성용)
+            popular_chunk_service.record([result["chunk_id"] for result in search_results])
+            
+            logger.info(
+                f"하이브리드 검색 완료: {len(results)}개 결과, "
+                f"{total_tokens}토큰"
+            )
+            
+            result = {
+                "search_results": search_results,
+                "task_results": {
+                    "search": {
+                        "success": True,
+                        "count": len(results),
+                        "query": query,
+                        "total_tokens": total_tokens,
+                        "search_type": "hybrid",
+                        "preprocessing": {
+                            "original_query": preprocessed.original,
+                            "standardized_query": preprocessed.standardized,
+                            "clause_number": preprocessed.clause_number,
+                            "expanded_terms": preprocessed.expanded_terms  # ⭐ 리스트 전체 저장
+                        }
+                    }
+                },
+                "next_agent": "answer_agent",
+                "error": None
+            }
+            return result
         
         except Exception as e:
             logger.error(f"하이브리드 검색 중 오류 발생: {e}", exc_info=True)
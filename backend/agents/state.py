@@ -2,7 +2,7 @@
 ISPL Agent State 정의
 LangGraph에서 사용하는 전역 상태를 정의합니다.
 """
-from typing import TypedDict, Annotated, Literal, Optional
+from typing import TypedDict, Annotated, AsyncIterator, Literal, Optional
 from langgraph.graph import MessagesState
 
 
@@ -16,11 +16,15 @@ def merge_dicts(left: dict, right: dict) -> dict:
     
     Returns:
         병합된 딕셔너리
+    
+    한쪽이 비어 있으면 복사 없이 다른 쪽을 그대로 반환합니다.
+    left는 이전 체크포인트/호출자 상태와 공유될 수 있으므로 제자리 수정하지 않습니다.
     """
-    result = left.copy() if left else {}
-    if right:
-        result.update(right)
-    return result
+    if not right:
+        return left if left is not None else {}
+    if not left:
+        return right
+    return {**left, **right}
 
 
 class ISPLState(MessagesState):
@@ -51,6 +55,13 @@ class ISPLState(MessagesState):
     # 오류 정보
     error: str | None
     
+    # ===== Batch 처리 관련 필드 =====
+    # True면 실시간 호출 대신 OpenAI Batch API로 답변 요청 적재 (비실시간 작업용)
+    batch_mode: Optional[bool]
+    
+    # 배치 요청 식별자 (Batch API custom_id)
+    request_id: Optional[str]
+    
     # ===== Context Judgement Agent 관련 필드 =====
     # 컨텍스트 충분성 플래그
     context_sufficient: Optional[bool]
@@ -64,10 +75,17 @@ class ISPLState(MessagesState):
     # 확장이 필요한 청크 ID 목록
     chunks_to_expand: list
     
+    # True면 1차 LLM 충분성 판단을 별도로 호출하지 않고 answer_agent가 답변 생성과 함께 판단
+    sufficiency_in_answer: Optional[bool]
+    
     # ===== Processing Agent 관련 필드 =====
     # 업로드할 파일 데이터
     file_data: Optional[bytes]
     
+    # 업로드 파일 청크 스트림 (있으면 file_data 대신 사용, 전체 파일을 메모리에 올리지 않음)
+    # 직렬화할 수 없으므로 그래프 체크포인트를 거치지 않는 직접 호출에서만 사용
+    file_stream: Optional[AsyncIterator[bytes]]
+    
     # 파일명
     filename: Optional[str]
     
@@ -108,6 +126,9 @@ class ISPLState(MessagesState):
     # 페이지네이션
     offset: Optional[int]
     limit: Optional[int]
+    
+    # 전체 목록 페이지 크기 (API 페이징용, 없으면 채팅 응답용 미리보기 개수만 조회)
+    detailed_limit: Optional[int]
 
 
 def create_initial_state(query: str, task_type: str = "search") -> ISPLState:
@@ -130,6 +151,8 @@ def create_initial_state(query: str, task_type: str = "search") -> ISPLState:
         search_results=[],
         final_answer="",
         error=None,
+        batch_mode=False,
+        request_id=None,
         # Context Judgement Agent 필드 초기화
         context_sufficient=None,
         expanded_chunks=[],
@@ -137,6 +160,7 @@ def create_initial_state(query: str, task_type: str = "search") -> ISPLState:
         chunks_to_expand=[],
         # Processing Agent 필드 초기화
         file_data=None,
+        file_stream=None,
         filename=None,
         processing_method="pymupdf",
         document_type="policy",
@@ -153,6 +177,7 @@ def create_initial_state(query: str, task_type: str = "search") -> ISPLState:
         sort_by="created_at",
         sort_order="desc",
         offset=0,
-        limit=20
+        limit=20,
+        detailed_limit=None
     )
 
@@ -2,12 +2,13 @@
 채팅 API 엔드포인트
 LangGraph Agent 시스템과 통합된 채팅 기능을 제공합니다.
 """
+import asyncio
 import logging
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
-import json
+from pydantic import BaseModel, ConfigDict, Field
+import orjson
 
 from agents.graph import run_graph, stream_graph
 
@@ -15,9 +16,14 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 
+SSE_PING_INTERVAL = 15.0  # 이벤트가 없을 때 keep-alive 주석을 보내는 간격 (초)
+SSE_PING = b": ping\n\n"  # SSE 주석 라인 (클라이언트 EventSource는 무시)
+
 
 class ChatRequest(BaseModel):
     """채팅 요청 모델"""
+    model_config = ConfigDict(frozen=True)
+    
     query: str = Field(..., min_length=1, description="사용자 질의")
     thread_id: Optional[str] = Field("default", description="대화 스레드 ID")
     stream: bool = Field(False, description="스트리밍 여부")
@@ -25,6 +31,8 @@ class ChatRequest(BaseModel):
 
 class ChatResponse(BaseModel):
     """채팅 응답 모델"""
+    model_config = ConfigDict(frozen=True)
+    
     query: str
     answer: str
     search_results: list = []
@@ -82,6 +90,46 @@ async def chat(request: ChatRequest):
         )
 
 
+async def _with_heartbeat(
+    events: AsyncIterator[Any],
+    interval: float = SSE_PING_INTERVAL
+) -> AsyncIterator[Optional[Any]]:
+    """
+    이벤트 사이 대기가 interval을 넘으면 None을 끼워 넣습니다 (keep-alive용).
+    
+    대기 중인 다음 이벤트는 취소하지 않고 계속 기다리므로 원본 스트림은 그대로 유지됩니다.
+    
+    Args:
+        events: 원본 이벤트 스트림
+        interval: keep-alive 간격 (초)
+    
+    Yields:
+        원본 이벤트 또는 None (keep-alive 시점)
+    """
+    iterator = events.__aiter__()
+    pending = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            
+            done, _ = await asyncio.wait({pending}, timeout=interval)
+            if not done:
+                yield None
+                continue
+            
+            try:
+                event = pending.result()
+            except StopAsyncIteration:
+                pending = None
+                return
+            pending = None
+            yield event
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
 @router.post("/stream")
 async def chat_stream(request: ChatRequest):
     """
@@ -98,18 +146,22 @@ async def chat_stream(request: ChatRequest):
     async def event_generator():
         """SSE 이벤트 생성기"""
         try:
-            async for event in stream_graph(request.query, request.thread_id):
+            async for event in _with_heartbeat(stream_graph(request.query, request.thread_id)):
+                if event is None:
+                    # LLM 응답 대기 등으로 이벤트가 없으면 프록시/클라이언트 유휴 타임아웃 방지
+                    yield SSE_PING
+                    continue
+                
                 # 각 노드의 실행 결과를 SSE 형식으로 전송
-                data = json.dumps(event, ensure_ascii=False)
-                yield f"data: {data}\n\n"
+                # (orjson 결과 bytes를 그대로 전송하여 str 디코딩/재인코딩 생략)
+                yield b"data: " + orjson.dumps(event, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
             
             # 완료 신호
-            yield "data: [DONE]\n\n"
+            yield b"data: [DONE]\n\n"
         
         except Exception as e:
             logger.error(f"스트리밍 중 오류: {e}", exc_info=True)
-            error_data = json.dumps({"error": str(e)}, ensure_ascii=False)
-            yield f"data: {error_data}\n\n"
+            yield b"data: " + orjson.dumps({"error": str(e)}) + b"\n\n"
     
     return StreamingResponse(
         event_generator(),
@@ -117,6 +169,7 @@ async def chat_stream(request: ChatRequest):
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # nginx 프록시 버퍼링 비활성화 (토큰 즉시 전달)
         }
     )
 
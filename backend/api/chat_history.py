@@ -1,13 +1,14 @@
 """
 대화 이력 API
 """
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 import logging
 
 from core.database import SessionDep
-from services.chat_history import ChatHistoryService
+from services.chat_history import chat_history_service
 
 router = APIRouter(prefix="/api/chat/history", tags=["Chat History"])
 logger = logging.getLogger(__name__)
@@ -16,6 +17,8 @@ logger = logging.getLogger(__name__)
 # Request/Response 모델
 class MessageSaveRequest(BaseModel):
     """메시지 저장 요청"""
+    model_config = ConfigDict(frozen=True)
+    
     thread_id: str = Field(..., description="스레드 ID")
     role: str = Field(..., description="역할 (user/assistant/system)")
     content: str = Field(..., description="메시지 내용")
@@ -24,26 +27,48 @@ class MessageSaveRequest(BaseModel):
 
 class SessionUpdateRequest(BaseModel):
     """세션 업데이트 요청"""
+    model_config = ConfigDict(frozen=True)
+    
     title: str = Field(..., description="새 제목")
 
 
 class MessageResponse(BaseModel):
     """메시지 응답"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+    
     id: int
     role: str
     content: str
     message_metadata: Optional[Dict[str, Any]]
-    created_at: str
+    created_at: datetime  # ORJSONResponse가 ISO 8601 문자열로 직렬화
 
 
 class SessionResponse(BaseModel):
     """세션 응답"""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+    
     id: int
     thread_id: str
-    title: str
+    title: Optional[str]
     message_count: int
-    created_at: str
-    updated_at: str
+    created_at: Optional[datetime]  # ORJSONResponse가 ISO 8601 문자열로 직렬화
+    updated_at: Optional[datetime]
+
+
+# 목록 응답 (ORM 객체 목록을 response_model이 검증/직렬화 1회로 처리)
+class MessageListResponse(BaseModel):
+    """메시지 목록 응답"""
+    success: bool
+    messages: List[MessageResponse]
+
+
+class SessionListResponse(BaseModel):
+    """세션 목록 응답"""
+    success: bool
+    sessions: List[SessionResponse]
+    total: int
+    offset: int
+    limit: int
 
 
 @router.post("/messages", status_code=201)
@@ -62,8 +87,7 @@ async def save_message(
         저장된 메시지 정보
     """
     try:
-        service = ChatHistoryService()
-        message = await service.save_message(
+        message = await chat_history_service.save_message(
             session=session,
             thread_id=request.thread_id,
             role=request.role,
@@ -73,13 +97,7 @@ async def save_message(
         
         return {
             "success": True,
-            "message": {
-                "id": message.id,
-                "role": message.role,
-                "content": message.content,
-                "message_metadata": message.message_metadata,
-                "created_at": message.created_at.isoformat()
-            }
+            "message": MessageResponse.model_validate(message).model_dump()
         }
     
     except Exception as e:
@@ -87,7 +105,7 @@ async def save_message(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/sessions/{thread_id}/messages")
+@router.get("/sessions/{thread_id}/messages", response_model=MessageListResponse)
 async def get_messages(
     thread_id: str,
     session: SessionDep,
@@ -105,33 +123,20 @@ async def get_messages(
         메시지 목록
     """
     try:
-        service = ChatHistoryService()
-        messages = await service.get_session_messages(
+        messages = await chat_history_service.get_session_messages(
             session=session,
             thread_id=thread_id,
             limit=limit
         )
         
-        return {
-            "success": True,
-            "messages": [
-                {
-                    "id": msg.id,
-                    "role": msg.role,
-                    "content": msg.content,
-                    "message_metadata": msg.message_metadata,
-                    "created_at": msg.created_at.isoformat()
-                }
-                for msg in messages
-            ]
-        }
+        return {"success": True, "messages": messages}
     
     except Exception as e:
         logger.error(f"메시지 조회 오류: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/sessions")
+@router.get("/sessions", response_model=SessionListResponse)
 async def list_sessions(
     session: SessionDep,
     user_id: Optional[int] = Query(None, description="사용자 ID"),
@@ -151,8 +156,7 @@ async def list_sessions(
         세션 목록
     """
     try:
-        service = ChatHistoryService()
-        result = await service.list_sessions(
+        result = await chat_history_service.list_sessions(
             session=session,
             user_id=user_id,
             limit=limit,
@@ -187,8 +191,7 @@ async def update_session(
         성공 여부
     """
     try:
-        service = ChatHistoryService()
-        success = await service.update_session_title(
+        success = await chat_history_service.update_session_title(
             session=session,
             thread_id=thread_id,
             title=request.title
@@ -222,8 +225,7 @@ async def delete_session(
         성공 여부
     """
     try:
-        service = ChatHistoryService()
-        success = await service.delete_session(
+        success = await chat_history_service.delete_session(
             session=session,
             thread_id=thread_id
         )
@@ -3,19 +3,34 @@
 Management Agent 기반으로 리팩토링
 """
 from fastapi import APIRouter, HTTPException, status, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from typing import Optional
 import logging
 
 from core.database import SessionDep
 from agents.management_agent import management_agent
 from agents.state import create_initial_state
-from services.document_management import DocumentManagementService
+from services.document_management import document_management_service
 
 router = APIRouter(prefix="/api/documents", tags=["Documents"])
 logger = logging.getLogger(__name__)
 
 
+def _error_response(status_code: int, detail: str) -> ORJSONResponse:
+    """
+    HTTPException과 같은 형식({"detail": ...})의 오류 응답을 반환합니다.
+    (예상된 실패는 예외를 발생/포착하지 않고 바로 응답)
+    
+    Args:
+        status_code: HTTP 상태 코드
+        detail: 오류 메시지
+    
+    Returns:
+        오류 응답
+    """
+    return ORJSONResponse(status_code=status_code, content={"detail": detail})
+
+
 @router.get("/")
 async def list_documents(
     session: SessionDep,
@@ -56,20 +71,16 @@ async def list_documents(
         state["sort_order"] = sort_order
         state["offset"] = offset
         state["limit"] = limit
+        state["detailed_limit"] = limit
         
         # Management Agent 호출
         result = await management_agent.manage(state)
         
         if result.get("error"):
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=result.get("error")
-            )
+            return _error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, result["error"])
         
         return result.get("management_result", {})
     
-    except HTTPException:
-        raise
     except Exception as e:
         logger.error(f"문서 목록 조회 오류: {e}", exc_info=True)
         raise HTTPException(
@@ -99,24 +110,16 @@ async def get_document(document_id: int, session: SessionDep):
         # Management Agent 호출
         result = await management_agent.manage(state)
         
-        if result.get("error"):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=result.get("error")
-            )
-        
         # management_result에서 document 정보 추출
         management_result = result.get("management_result", {})
-        if management_result.get("success"):
-            return management_result.get("document", {})
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"문서를 찾을 수 없습니다: ID={document_id}"
+        if result.get("error") or not management_result.get("success"):
+            return _error_response(
+                status.HTTP_404_NOT_FOUND,
+                result.get("error") or f"문서를 찾을 수 없습니다: ID={document_id}"
             )
+        
+        return management_result.get("document", {})
     
-    except HTTPException:
-        raise
     except Exception as e:
         logger.error(f"문서 조회 오류: {e}", exc_info=True)
         raise HTTPException(
@@ -147,15 +150,10 @@ async def delete_document(document_id: int, session: SessionDep):
         result = await management_agent.manage(state)
         
         if result.get("error"):
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=result.get("error")
-            )
+            return _error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, result["error"])
         
         return result.get("management_result", {})
     
-    except HTTPException:
-        raise
     except Exception as e:
         logger.error(f"문서 삭제 오류: {e}", exc_info=True)
         raise HTTPException(
@@ -185,8 +183,7 @@ async def download_document(
     try:
         from urllib.parse import quote
         
-        service = DocumentManagementService()
-        file_path = await service.get_document_file_path(
+        file_path = await document_management_service.get_document_file_path(
             session=session,
             document_id=document_id,
             file_type=file_type
@@ -235,8 +232,7 @@ async def view_document(
         Markdown의 경우 텍스트 내용, PDF의 경우 다운로드 URL
     """
     try:
-        service = DocumentManagementService()
-        content = await service.get_document_content(
+        content = await document_management_service.get_document_content(
             session=session,
             document_id=document_id,
             file_type=file_type
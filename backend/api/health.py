@@ -1,13 +1,24 @@
 """
 헬스 체크 API
 """
+import time
+from typing import Optional
+
 from fastapi import APIRouter, status
 from sqlalchemy import text
 
-from core.database import SessionDep
+from core.database import SessionDep, get_pool_status
 
 router = APIRouter()
 
+HEALTH_CACHE_TTL = 1.0  # 프로브 폭주 시 DB 조회 없이 재사용할 응답 유지 시간 (초)
+
+# pgvector는 한 번 설치되면 런타임에 제거되지 않으므로 설치 확인 후에는 재조회하지 않음
+_has_pgvector: Optional[bool] = None
+
+# 최근 정상 응답 (monotonic 시각, 응답)
+_last_healthy: Optional[tuple] = None
+
 
 @router.get("/health", status_code=status.HTTP_200_OK)
 async def health_check(db: SessionDep):
@@ -15,22 +26,31 @@ async def health_check(db: SessionDep):
     헬스 체크 엔드포인트
     데이터베이스 연결 상태 확인
     """
+    global _has_pgvector, _last_healthy
+    
+    # 직전 정상 응답이 TTL 이내면 DB 연결을 점유하지 않고 재사용
+    if _last_healthy and time.monotonic() - _last_healthy[0] < HEALTH_CACHE_TTL:
+        return _last_healthy[1]
+    
     try:
         # 데이터베이스 연결 테스트
         result = await db.execute(text("SELECT 1"))
         result.fetchone()
         
-        # pgvector extension 확인
-        pgvector_check = await db.execute(
-            text("SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname = 'vector')")
-        )
-        has_pgvector = pgvector_check.scalar()
+        # pgvector extension 확인 (설치 확인 전까지만)
+        if not _has_pgvector:
+            pgvector_check = await db.execute(
+                text("SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname = 'vector')")
+            )
+            _has_pgvector = bool(pgvector_check.scalar())
         
-        return {
+        response = {
             "status": "healthy",
             "database": "connected",
-            "pgvector": "enabled" if has_pgvector else "disabled"
+            "pgvector": "enabled" if _has_pgvector else "disabled"
         }
+        _last_healthy = (time.monotonic(), response)
+        return response
     except Exception as e:
         return {
             "status": "unhealthy",
@@ -38,3 +58,11 @@ async def health_check(db: SessionDep):
             "error": str(e)
         }
 
+
+@router.get("/health/db-pool", status_code=status.HTTP_200_OK)
+async def db_pool_status():
+    """
+    DB 연결 풀 상태 확인
+    사용 중(checked_out)/유휴(checked_in) 연결 수로 풀 크기 튜닝 여부 판단
+    """
+    return get_pool_status()
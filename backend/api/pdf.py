@@ -10,6 +10,7 @@ Processing Agent 기반으로 리팩토링
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status
 from fastapi.responses import JSONResponse
 import logging
+from typing import AsyncIterator
 
 from agents.processing_agent import processing_agent
 from agents.state import create_initial_state
@@ -19,6 +20,56 @@ from core.database import SessionDep
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 업로드 파일 스트리밍 단위 (1MB)
+PDF_HEADER_SIZE = 1024  # 본문 스트리밍 전에 검증용으로 먼저 읽는 크기 (1KB)
+PDF_MAGIC = b"%PDF-"  # PDF 파일 시그니처
+# 허용하는 Content-Type (일부 클라이언트는 PDF도 octet-stream으로 전송, 실제 검증은 시그니처로 수행)
+PDF_CONTENT_TYPES = ("application/pdf", "application/octet-stream")
+
+
+class _UploadReader:
+    """업로드 파일을 청크 단위로 읽으면서 크기 제한을 확인"""
+    
+    def __init__(self, file: UploadFile, max_size: int, header: bytes = b""):
+        self.file = file
+        self.max_size = max_size
+        self.header = header  # 검증을 위해 미리 읽은 앞부분 (스트리밍 시 가장 먼저 전달)
+        self.received = len(header)
+        self.too_large = False
+    
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        """
+        업로드 파일을 청크 단위로 읽는 비동기 이터레이터
+        
+        Content-Length가 없거나 실제 크기와 다른 경우에도 제한을 넘는 즉시 중단합니다.
+        (저장 중이던 파일은 Processing Agent에서 삭제)
+        """
+        if self.header:
+            yield self.header
+        
+        while chunk := await self.file.read(UPLOAD_CHUNK_SIZE):
+            self.received += len(chunk)
+            if self.received > self.max_size:
+                self.too_large = True
+                raise ValueError(f"파일 크기 제한 초과: {self.received} bytes 이상")
+            yield chunk
+
+
+def _not_pdf_error() -> HTTPException:
+    """PDF가 아닌 파일 업로드 오류 (400)"""
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="PDF 파일만 업로드 가능합니다."
+    )
+
+
+def _too_large_error() -> HTTPException:
+    """파일 크기 제한 초과 오류 (413)"""
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"파일 크기는 {settings.MAX_FILE_SIZE / 1024 / 1024}MB 이하여야 합니다."
+    )
+
 
 @router.post("/upload", status_code=status.HTTP_200_OK)
 async def upload_pdf(
@@ -55,28 +106,29 @@ async def upload_pdf(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"유효하지 않은 method: {method}. 'pymupdf', 'vision', 'both' 중 선택하세요."
         )
-    # 파일 검증
-    if not file.filename.endswith('.pdf'):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="PDF 파일만 업로드 가능합니다."
-        )
+    # 파일 검증 (본문을 읽기 전에 확장자/Content-Type/크기부터 확인)
+    if not file.filename or not file.filename.lower().endswith('.pdf'):
+        raise _not_pdf_error()
+    
+    if file.content_type and file.content_type not in PDF_CONTENT_TYPES:
+        raise _not_pdf_error()
     
     if file.size and file.size > settings.MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"파일 크기는 {settings.MAX_FILE_SIZE / 1024 / 1024}MB 이하여야 합니다."
-        )
+        raise _too_large_error()
+    
+    # 앞부분만 읽어 PDF 시그니처 확인 (확장자만 바꾼 파일은 디스크에 저장하기 전에 거부)
+    header = await file.read(PDF_HEADER_SIZE)
+    if not header.startswith(PDF_MAGIC):
+        raise _not_pdf_error()
+    
+    upload = _UploadReader(file, settings.MAX_FILE_SIZE, header=header)
     
     try:
-        # 파일 데이터 읽기
-        file_data = await file.read()
-        logger.info(f"파일 읽기 완료: {len(file_data)} bytes")
-        
         # State 생성
         state = create_initial_state("")
         state["task_type"] = "upload"
-        state["file_data"] = file_data
+        # 전체 파일을 메모리에 올리지 않고 청크 단위로 디스크에 기록
+        state["file_stream"] = upload.iter_chunks()
         state["filename"] = file.filename
         state["processing_method"] = method
         state["document_type"] = document_type
@@ -89,6 +141,10 @@ async def upload_pdf(
         
         # 결과 처리
         if result.get("error"):
+            # 스트리밍 중 크기 제한 초과
+            if upload.too_large:
+                raise _too_large_error()
+            
             # 오류 발생
             error_msg = result.get("error")
             logger.error(f"Processing Agent 오류: {error_msg}")
@@ -42,6 +42,21 @@ class SearchResultItem(BaseModel):
     document: dict = {}
 
 
+def _to_result_items(results: List[VectorSearchResult]) -> List[SearchResultItem]:
+    """
+    검색 결과를 응답 모델로 변환합니다.
+    
+    DB 조회 결과로 타입이 이미 보장되므로 필드 검증 없이 생성합니다 (model_construct).
+    
+    Args:
+        results: 검색 결과 리스트
+    
+    Returns:
+        응답 항목 리스트
+    """
+    return [SearchResultItem.model_construct(**result.to_dict()) for result in results]
+
+
 class SearchResponse(BaseModel):
     """검색 응답 모델"""
     query: str
@@ -83,10 +98,7 @@ async def vector_search(
         )
         
         # 응답 생성
-        result_items = [
-            SearchResultItem(**result.to_dict())
-            for result in results
-        ]
+        result_items = _to_result_items(results)
         
         response = SearchResponse(
             query=request.query,
@@ -136,10 +148,7 @@ async def get_similar_chunks(
                 detail=f"청크 ID {chunk_id}를 찾을 수 없습니다."
             )
         
-        result_items = [
-            SearchResultItem(**result.to_dict())
-            for result in results
-        ]
+        result_items = _to_result_items(results)
         
         return result_items
     
@@ -190,10 +199,7 @@ async def hybrid_search(
         )
         
         # 응답 생성
-        result_items = [
-            SearchResultItem(**result.to_dict())
-            for result in results
-        ]
+        result_items = _to_result_items(results)
         
         response = SearchResponse(
             query=request.query,
@@ -3,94 +3,124 @@
 Windows 환경에서 Redis를 사용할 수 없을 때 사용
 """
 import asyncio
-import json
 import time
 import logging
-from typing import Optional, Dict, Any
-from collections import OrderedDict
-from threading import Lock
+from typing import Optional, Dict, Any, Iterator, List, Set, Tuple
+from collections import OrderedDict, defaultdict
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# orjson 직렬화 옵션 (numpy 값, 정수 키 허용)
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
 
 class MemoryCache:
-    """메모리 기반 캐시 (Redis 대체)"""
+    """
+    메모리 기반 캐시 (Redis 대체)
+    
+    이벤트 루프 스레드에서만 사용하므로 락 없이 동작합니다.
+    (각 메서드는 await 지점이 없어 코루틴 간에도 원자적으로 실행됨)
+    """
     
     def __init__(self, max_size: int = 10000):
         """
         Args:
             max_size: 최대 캐시 크기 (LRU 방식)
         """
-        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        # 키 → (값, 만료 시각)
+        self._cache: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        # ':' 구분 접두사 → 키 집합 (clear_pattern("prefix:*")을 전체 스캔 없이 처리)
+        self._prefix_index: Dict[str, Set[str]] = defaultdict(set)
         self._max_size = max_size
-        self._lock = Lock()
         logger.info(f"MemoryCache 초기화 (max_size={max_size})")
     
-    def _is_expired(self, entry: Dict[str, Any]) -> bool:
-        """만료 여부 확인"""
-        if 'expires_at' not in entry:
-            return False
-        return time.time() > entry['expires_at']
+    @staticmethod
+    def _prefixes(key: str) -> Iterator[str]:
+        """키의 ':' 구분 접두사 (예: "a:b:c" → "a", "a:b")"""
+        end = key.find(':')
+        while end != -1:
+            yield key[:end]
+            end = key.find(':', end + 1)
+    
+    def _remove(self, key: str):
+        """캐시와 접두사 인덱스에서 키 삭제"""
+        if self._cache.pop(key, None) is None:
+            return
+        
+        for prefix in self._prefixes(key):
+            keys = self._prefix_index.get(prefix)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._prefix_index[prefix]
     
     def _evict_if_needed(self):
         """LRU 방식으로 오래된 항목 제거"""
-        while len(self._cache) >= self._max_size:
-            self._cache.popitem(last=False)
+        while len(self._cache) > self._max_size:
+            self._remove(next(iter(self._cache)))
+    
+    def _get_live(self, key: str) -> Optional[str]:
+        """만료되지 않은 값 반환 (만료된 항목은 삭제)"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        value, expires_at = entry
+        if time.time() > expires_at:
+            self._remove(key)
+            return None
+        
+        return value
     
     async def get(self, key: str) -> Optional[str]:
         """캐시에서 값 가져오기"""
-        with self._lock:
-            if key not in self._cache:
-                return None
-            
-            entry = self._cache[key]
-            
-            # 만료 확인
-            if self._is_expired(entry):
-                del self._cache[key]
-                return None
-            
+        value = self._get_live(key)
+        if value is not None:
             # LRU 업데이트 (최근 사용)
             self._cache.move_to_end(key)
-            
-            return entry['value']
+        return value
     
     async def set(self, key: str, value: str, ttl: int = 3600):
         """캐시에 값 저장"""
-        with self._lock:
-            expires_at = time.time() + ttl
-            self._cache[key] = {
-                'value': value,
-                'expires_at': expires_at
-            }
-            self._cache.move_to_end(key)
-            self._evict_if_needed()
+        if key not in self._cache:
+            for prefix in self._prefixes(key):
+                self._prefix_index[prefix].add(key)
+        self._cache[key] = (value, time.time() + ttl)
+        self._cache.move_to_end(key)
+        self._evict_if_needed()
     
     async def delete(self, key: str):
         """캐시에서 삭제"""
-        with self._lock:
-            self._cache.pop(key, None)
+        self._remove(key)
+    
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """여러 키의 값 가져오기 (키 순서대로, 없으면 None)"""
+        return [await self.get(key) for key in keys]
+    
+    async def set_many(self, items: Dict[str, str], ttl: int = 3600):
+        """여러 키-값 저장"""
+        for key, value in items.items():
+            await self.set(key, value, ttl)
     
     async def exists(self, key: str) -> bool:
         """키 존재 여부 확인"""
-        with self._lock:
-            if key not in self._cache:
-                return False
-            
-            entry = self._cache[key]
-            if self._is_expired(entry):
-                del self._cache[key]
-                return False
-            
-            return True
+        return self._get_live(key) is not None
+    
+    async def incr(self, key: str) -> int:
+        """정수 카운터 1 증가 (만료 없음, 증가된 값 반환)"""
+        value = int(self._get_live(key) or 0) + 1
+        await self.set(key, str(value), ttl=float("inf"))
+        return value
     
     async def get_json(self, key: str) -> Optional[dict]:
         """JSON 형식으로 가져오기"""
         value = await self.get(key)
         if value:
             try:
-                return json.loads(value)
-            except json.JSONDecodeError:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
                 logger.error(f"JSON 파싱 오류 ({key})")
                 return None
         return None
@@ -98,41 +128,57 @@ class MemoryCache:
     async def set_json(self, key: str, value: dict, ttl: int = 3600):
         """JSON 형식으로 저장"""
         try:
-            json_str = json.dumps(value, ensure_ascii=False)
+            json_str = orjson.dumps(value, option=JSON_OPTIONS).decode()
             await self.set(key, json_str, ttl)
         except Exception as e:
             logger.error(f"JSON 저장 오류 ({key}): {e}")
     
     async def clear_pattern(self, pattern: str):
         """패턴에 맞는 모든 키 삭제"""
-        with self._lock:
-            # 간단한 패턴 매칭 (와일드카드 지원)
-            pattern_prefix = pattern.rstrip('*')
+        # 간단한 패턴 매칭 (와일드카드 지원)
+        pattern_prefix = pattern.rstrip('*')
+        
+        if pattern_prefix.endswith(':') and '*' not in pattern_prefix:
+            # "prefix:*" 형식은 접두사 인덱스로 해당 키만 조회
+            keys_to_delete = list(self._prefix_index.get(pattern_prefix[:-1], ()))
+        else:
             keys_to_delete = [
                 key for key in self._cache.keys()
                 if key.startswith(pattern_prefix)
             ]
-            for key in keys_to_delete:
-                del self._cache[key]
-            
-            logger.info(f"패턴 삭제 완료: {pattern} ({len(keys_to_delete)}개)")
+        
+        for key in keys_to_delete:
+            self._remove(key)
+        
+        logger.info(f"패턴 삭제 완료: {pattern} ({len(keys_to_delete)}개)")
     
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계"""
-        with self._lock:
-            return {
-                'size': len(self._cache),
-                'max_size': self._max_size,
-                'utilization': f"{len(self._cache) / self._max_size * 100:.1f}%"
-            }
+        return {
+            'size': len(self._cache),
+            'max_size': self._max_size,
+            'utilization': f"{len(self._cache) / self._max_size * 100:.1f}%"
+        }
 
 
 class CacheFacade:
-    """Redis 또는 MemoryCache를 동적으로 사용하는 Facade"""
+    """
+    Redis 또는 MemoryCache를 동적으로 사용하는 Facade
+    
+    Redis 사용 시 프로세스 로컬 L1 캐시(MemoryCache)를 앞에 두어
+    반복 조회는 네트워크 왕복 없이 처리합니다.
+    """
+    
+    L1_MAX_SIZE = 2000  # L1 캐시 최대 항목 수
+    # L1 유지 시간 (초) - 다른 워커 프로세스의 변경/무효화는 L1에 반영되지 않으므로 짧게 유지
+    L1_TTL_SECONDS = 5
+    
+    REDIS_MAX_CONNECTIONS = 50  # Redis 연결 풀 최대 연결 수 (초과 시 반납 대기)
     
     def __init__(self):
         self._backend = None
         self._type = None
+        self._l1 = MemoryCache(max_size=self.L1_MAX_SIZE)
     
     async def connect(self):
         """캐시 백엔드 연결"""
@@ -142,14 +188,18 @@ class CacheFacade:
         try:
             if settings.CACHE_ENABLED:
                 import redis.asyncio as redis
-                self._backend = redis.Redis(
+                # 연결 풀 공유 (hiredis 설치 시 redis-py가 C 파서를 자동 사용)
+                pool = redis.BlockingConnectionPool(
                     host=settings.REDIS_HOST,
                     port=settings.REDIS_PORT,
                     db=settings.REDIS_DB,
                     password=settings.REDIS_PASSWORD if settings.REDIS_PASSWORD else None,
                     decode_responses=True,
-                    socket_connect_timeout=2
+                    socket_connect_timeout=2,
+                    max_connections=self.REDIS_MAX_CONNECTIONS
                 )
+                # from_pool: 클라이언트가 풀을 소유하여 종료 시 풀의 연결까지 정리
+                self._backend = redis.Redis.from_pool(pool)
                 # 연결 테스트
                 await self._backend.ping()
                 self._type = "redis"
@@ -162,7 +212,8 @@ class CacheFacade:
     async def disconnect(self):
         """캐시 연결 종료"""
         if self._type == "redis" and self._backend:
-            await self._backend.close()
+            await self._backend.aclose()
+        self._l1 = MemoryCache(max_size=self.L1_MAX_SIZE)
         self._backend = None
         self._type = None
     
@@ -170,8 +221,22 @@ class CacheFacade:
         """캐시에서 값 가져오기"""
         if not self._backend:
             await self.connect()
+        
+        if self._type == "redis":
+            return await self._get_redis(key)
         return await self._backend.get(key)
     
+    async def _get_redis(self, key: str) -> Optional[str]:
+        """L1 캐시 우선 조회 후 Redis 조회 (Redis HIT은 L1에 저장)"""
+        value = await self._l1.get(key)
+        if value is not None:
+            return value
+        
+        value = await self._backend.get(key)
+        if value is not None:
+            await self._l1.set(key, value, self.L1_TTL_SECONDS)
+        return value
+    
     async def set(self, key: str, value: str, ttl: int = 3600):
         """캐시에 값 저장"""
         if not self._backend:
@@ -179,6 +244,7 @@ class CacheFacade:
         
         if self._type == "redis":
             await self._backend.setex(key, ttl, value)
+            await self._l1.delete(key)  # 다음 조회 시 Redis 값으로 다시 채움
         else:
             await self._backend.set(key, value, ttl)
     
@@ -187,6 +253,56 @@ class CacheFacade:
         if not self._backend:
             await self.connect()
         await self._backend.delete(key)
+        await self._l1.delete(key)
+    
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        여러 키의 값 가져오기 (Redis는 L1 MISS 키만 MGET 1회로 조회)
+        
+        Args:
+            keys: 캐시 키 리스트
+        
+        Returns:
+            키 순서대로의 값 리스트 (없으면 None)
+        """
+        if not self._backend:
+            await self.connect()
+        
+        if self._type != "redis":
+            return await self._backend.get_many(keys)
+        
+        values = [await self._l1.get(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            fetched = await self._backend.mget([keys[i] for i in missing])
+            for i, value in zip(missing, fetched):
+                if value is not None:
+                    values[i] = value
+                    await self._l1.set(keys[i], value, self.L1_TTL_SECONDS)
+        return values
+    
+    async def set_many(self, items: Dict[str, str], ttl: int = 3600):
+        """
+        여러 키-값 저장 (Redis는 파이프라인으로 왕복 1회)
+        
+        Args:
+            items: 키 → 값
+            ttl: 유지 시간 (초)
+        """
+        if not self._backend:
+            await self.connect()
+        
+        if self._type != "redis":
+            await self._backend.set_many(items, ttl)
+            return
+        
+        async with self._backend.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.setex(key, ttl, value)
+            await pipe.execute()
+        
+        for key in items:
+            await self._l1.delete(key)  # 다음 조회 시 Redis 값으로 다시 채움
     
     async def exists(self, key: str) -> bool:
         """키 존재 여부 확인"""
@@ -194,21 +310,54 @@ class CacheFacade:
             await self.connect()
         
         if self._type == "redis":
+            if await self._l1.exists(key):
+                return True
             return await self._backend.exists(key) > 0
         else:
             return await self._backend.exists(key)
     
+    async def incr(self, key: str) -> int:
+        """
+        정수 카운터 1 증가 (Redis는 INCR로 워커 간 원자적으로 증가)
+        
+        Args:
+            key: 카운터 키
+        
+        Returns:
+            증가된 값
+        """
+        if not self._backend:
+            await self.connect()
+        return await self._backend.incr(key)
+    
+    async def get_counter(self, key: str) -> int:
+        """
+        정수 카운터 조회 (다른 워커의 증가가 바로 보이도록 L1 캐시를 거치지 않음)
+        
+        Args:
+            key: 카운터 키
+        
+        Returns:
+            카운터 값 (없으면 0)
+        """
+        if not self._backend:
+            await self.connect()
+        
+        # Redis 사용 시 self._get_redis() 대신 백엔드 직접 조회
+        value = await self._backend.get(key)
+        return int(value or 0)
+    
     async def get_json(self, key: str) -> Optional[dict]:
         """JSON 형식으로 가져오기"""
         if not self._backend:
             await self.connect()
         
         if self._type == "redis":
-            value = await self._backend.get(key)
+            value = await self._get_redis(key)
             if value:
                 try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
+                    return orjson.loads(value)
+                except orjson.JSONDecodeError:
                     return None
             return None
         else:
@@ -220,8 +369,9 @@ class CacheFacade:
             await self.connect()
         
         if self._type == "redis":
-            json_str = json.dumps(value, ensure_ascii=False)
-            await self._backend.setex(key, ttl, json_str)
+            # orjson 결과 bytes를 그대로 전송 (str 디코딩 후 redis-py에서 재인코딩하지 않음)
+            await self._backend.setex(key, ttl, orjson.dumps(value, option=JSON_OPTIONS))
+            await self._l1.delete(key)  # 다음 조회 시 Redis 값으로 다시 채움
         else:
             await self._backend.set_json(key, value, ttl)
     
@@ -233,11 +383,12 @@ class CacheFacade:
         if self._type == "redis":
             cursor = 0
             while True:
-                cursor, keys = await self._backend.scan(cursor, match=pattern, count=100)
+                cursor, keys = await self._backend.scan(cursor, match=pattern, count=1000)
                 if keys:
-                    await self._backend.delete(*keys)
+                    await self._backend.unlink(*keys)  # 메모리 해제는 Redis 백그라운드 스레드에서
                 if cursor == 0:
                     break
+            await self._l1.clear_pattern(pattern)
         else:
             await self._backend.clear_pattern(pattern)
     
@@ -18,9 +18,12 @@ class Settings(BaseSettings):
     
     # 데이터베이스 (필수: .env에서 설정 필요)
     DATABASE_URL: str
+    # PostgreSQL JIT 적용 최소 쿼리 비용 (짧은 OLTP 쿼리는 JIT 컴파일 비용만 추가되므로 높게 설정, -1이면 JIT 비활성화)
+    PG_JIT_ABOVE_COST: int = 500000
     
     # OpenAI (필수: .env에서 설정 필요)
     OPENAI_API_KEY: str
+    LLM_MAX_CONCURRENCY: int = 20  # 컨텍스트 판단 LLM 동시 호출 수 제한
     
     # Redis 캐싱 (.env에서 설정 가능)
     # Windows 환경에서는 Redis 없이 메모리 캐시 자동 사용
@@ -18,6 +18,39 @@ from core.config import settings
 _engine = None
 
 
+def _decode_halfvec(value):
+    """
+    halfvec 바이너리를 float32 numpy 배열로 변환합니다.
+    (FP16 값은 빅엔디안으로 전송되므로 연산용 네이티브 float32로 변환, vector 코덱과 동일한 형태)
+    """
+    import numpy as np
+    from pgvector.asyncpg import HalfVector
+    
+    return HalfVector.from_binary(value).to_numpy().astype(np.float32)
+
+
+async def _register_vector_codec(conn):
+    """
+    asyncpg 연결에 halfvec 타입 코덱만 등록합니다.
+    
+    pgvector.asyncpg.register_vector()는 vector/sparsevec까지 등록하여 새 연결마다
+    타입 조회 왕복이 3회 발생하므로, 임베딩 컬럼 타입(halfvec)만 등록해 1회로 줄입니다.
+    쿼리 임베딩(리스트)은 인코딩 시 FP16으로 변환됩니다.
+    
+    Args:
+        conn: asyncpg 연결
+    """
+    from pgvector.asyncpg import HalfVector
+    
+    await conn.set_type_codec(
+        'halfvec',
+        schema='public',
+        encoder=HalfVector._to_db_binary,
+        decoder=_decode_halfvec,
+        format='binary'
+    )
+
+
 def get_engine():
     """
     엔진을 반환합니다 (지연 생성).
@@ -52,10 +85,17 @@ def get_engine():
                 max_overflow=30,           # 추가 연결 수 (20 → 30)
                 pool_recycle=3600,         # 1시간마다 연결 재생성
                 pool_timeout=30,           # 연결 대기 타임아웃
+                pool_use_lifo=True,        # 최근 사용 연결 우선 재사용 (준비된 statement 캐시 활용)
                 connect_args={
+                    # 연결별 prepared statement 캐시 (반복 검색 쿼리의 parse/plan 생략)
+                    "statement_cache_size": 2048,           # asyncpg
+                    "prepared_statement_cache_size": 2048,  # SQLAlchemy asyncpg 어댑터
                     "server_settings": {
                         "application_name": "ispl_backend",  # 디버깅용
-                        "jit": "off",                        # JIT 비활성화 (성능 향상)
+                        # 대량 후보를 스캔하는 고비용 쿼리에만 JIT 적용 (일반 쿼리는 JIT 컴파일 생략)
+                        "jit_above_cost": str(settings.PG_JIT_ABOVE_COST),
+                        "jit_inline_above_cost": str(settings.PG_JIT_ABOVE_COST),
+                        "jit_optimize_above_cost": str(settings.PG_JIT_ABOVE_COST),
                     }
                 }
             )
@@ -64,10 +104,8 @@ def get_engine():
         @event.listens_for(_engine.sync_engine, "connect")
         def register_vector_types(dbapi_connection, connection_record):
             """asyncpg 연결 시 pgvector 타입을 등록합니다."""
-            from pgvector.asyncpg import register_vector
-            
             # asyncpg 연결은 비동기이므로 run_async로 실행
-            dbapi_connection.run_async(register_vector)
+            dbapi_connection.run_async(_register_vector_codec)
     
     return _engine
 
@@ -104,6 +142,27 @@ def AsyncSessionLocal():
     return factory()
 
 
+def get_pool_status() -> dict:
+    """
+    엔진 연결 풀 사용 현황을 반환합니다.
+    
+    Returns:
+        풀 클래스, 크기, 사용 중/유휴/오버플로 연결 수 (NullPool은 클래스명만)
+    """
+    pool = get_engine().pool
+    status = {"pool_class": type(pool).__name__}
+    
+    if hasattr(pool, "checkedout"):
+        status.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+        })
+    
+    return status
+
+
 class Base(DeclarativeBase):
     """SQLAlchemy Base 클래스"""
     pass
@@ -0,0 +1,35 @@
+"""
+tiktoken 인코딩 캐시
+BPE 어휘 로딩은 비용이 크므로 인코딩별로 프로세스당 1회만 로드합니다.
+"""
+from functools import lru_cache
+
+import tiktoken
+
+
+@lru_cache(maxsize=None)
+def get_encoding(name: str = "cl100k_base") -> tiktoken.Encoding:
+    """
+    tiktoken 인코딩 반환 (인코딩 이름별 1회 로드)
+    
+    Args:
+        name: 인코딩 이름
+    
+    Returns:
+        tiktoken.Encoding
+    """
+    return tiktoken.get_encoding(name)
+
+
+@lru_cache(maxsize=None)
+def get_encoding_for_model(model: str) -> tiktoken.Encoding:
+    """
+    모델에 해당하는 tiktoken 인코딩 반환 (모델별 1회 로드)
+    
+    Args:
+        model: 모델 이름 (예: gpt-4o)
+    
+    Returns:
+        tiktoken.Encoding
+    """
+    return tiktoken.encoding_for_model(model)
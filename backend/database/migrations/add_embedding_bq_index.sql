@@ -0,0 +1,8 @@
+-- Migration: Add binary-quantized embedding index
+-- Date: 2026-10-16
+-- Description: 벡터 검색 1차 후보 추출용 이진 양자화(해밍 거리) HNSW 인덱스 추가
+-- 요구사항: pgvector 0.7 이상, convert_embedding_halfvec.sql 적용 후 실행
+
+-- 1. 표현식 인덱스 생성 (별도 컬럼 없이 binary_quantize() 결과를 인덱싱)
+CREATE INDEX IF NOT EXISTS idx_chunks_embedding_bq ON document_chunks
+USING hnsw ((binary_quantize(embedding)::bit(1536)) bit_hamming_ops);
@@ -0,0 +1,16 @@
+-- Migration: Convert embedding column to halfvec
+-- Date: 2026-10-16
+-- Description: 임베딩을 FP16(halfvec)으로 저장하여 테이블/HNSW 인덱스 크기 절반으로 축소
+-- 요구사항: pgvector 0.7 이상 (halfvec 타입 지원)
+
+-- 1. 기존 HNSW 인덱스 삭제 (컬럼 타입 변경 전)
+DROP INDEX IF EXISTS idx_chunks_embedding;
+
+-- 2. 컬럼 타입 변경 (기존 FP32 벡터를 FP16으로 변환)
+ALTER TABLE document_chunks
+ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536);
+
+-- 3. HNSW 인덱스 재생성 (검색 쿼리가 <=> 코사인 거리를 사용하므로 cosine ops 유지)
+CREATE INDEX IF NOT EXISTS idx_chunks_embedding ON document_chunks
+USING hnsw (embedding halfvec_cosine_ops)
+WITH (m = 32, ef_construction = 200);
@@ -61,7 +61,7 @@ CREATE TABLE IF NOT EXISTS document_chunks (
     content_hash VARCHAR(64), -- SHA-256 해시로 중복 방지
     token_count INTEGER,
     metadata JSONB, -- 구조적 정보 저장
-    embedding VECTOR(1536), -- OpenAI text-embedding-3-large
+    embedding HALFVEC(1536), -- OpenAI text-embedding-3-large (FP16 저장, pgvector 0.7+)
     confidence_score FLOAT DEFAULT 1.0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
@@ -70,9 +70,13 @@ CREATE TABLE IF NOT EXISTS document_chunks (
 
 -- 벡터 검색을 위한 HNSW 인덱스
 CREATE INDEX IF NOT EXISTS idx_chunks_embedding ON document_chunks 
-USING hnsw (embedding vector_cosine_ops) 
+USING hnsw (embedding halfvec_cosine_ops) 
 WITH (m = 32, ef_construction = 200);
 
+-- 이진 양자화 후보 추출용 HNSW 인덱스 (부호 비트 해밍 거리, 이후 halfvec으로 재정렬)
+CREATE INDEX IF NOT EXISTS idx_chunks_embedding_bq ON document_chunks 
+USING hnsw ((binary_quantize(embedding)::bit(1536)) bit_hamming_ops);
+
 -- 일반 인덱스
 CREATE INDEX IF NOT EXISTS idx_chunks_document_id ON document_chunks(document_id);
 CREATE INDEX IF NOT EXISTS idx_chunks_type ON document_chunks(chunk_type);
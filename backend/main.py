@@ -2,9 +2,11 @@
 ISPL Backend 메인 애플리케이션
 보험약관 기반 Agentic AI 시스템
 """
+import asyncio
 import logging
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
@@ -12,6 +14,7 @@ from contextlib import asynccontextmanager
 from core.config import settings
 from core.database import get_engine
 from core.cache import cache  # Redis 또는 메모리 캐시 (자동 선택)
+from services.service_container import service_container
 from api import health
 
 # 로깅 설정 (애플리케이션 시작 시)
@@ -35,6 +38,16 @@ async def lifespan(app: FastAPI):
     logger.info(f"📊 데이터베이스: {settings.DATABASE_URL.split('@')[1] if '@' in settings.DATABASE_URL else 'Not configured'}")
     logger.info("📝 로깅 레벨: INFO")
     
+    # 이벤트 루프 확인 (uvloop 설치 시 uvicorn이 자동 선택, Windows는 기본 asyncio)
+    loop = asyncio.get_running_loop()
+    logger.info(f"⚙️ 이벤트 루프: {type(loop).__module__}.{type(loop).__name__}")
+    
+    # Eager task factory (Python 3.12+): 즉시 완료되는 코루틴은 스케줄링 없이 동기 실행
+    # (캐시 HIT, 검색 결과 없음, 확장 대상 없음 등 조기 반환 경로)
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+        logger.info("⚙️ asyncio eager task factory 활성화")
+    
     # 캐시 연결 (캐싱 활성화 시)
     if settings.CACHE_ENABLED:
         try:
@@ -52,10 +65,18 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("❌ 캐시 비활성화")
     
+    # 검색 서비스 싱글톤 미리 생성 (첫 검색 요청이 OpenAI 클라이언트/토크나이저 지연 초기화를 기다리지 않도록)
+    try:
+        service_container.get_hybrid_search_service()
+        logger.info("✅ 검색 서비스 초기화 완료")
+    except Exception as e:
+        logger.warning(f"⚠️ 검색 서비스 사전 초기화 실패 (첫 요청 시 재시도): {e}")
+    
     yield
     
     # 종료 시
     await get_engine().dispose()
+    await service_container.close()
     if settings.CACHE_ENABLED:
         await cache.disconnect()
     logger.info("👋 ISPL 애플리케이션 종료")
@@ -67,6 +88,7 @@ app = FastAPI(
     description="보험약관 기반 Agentic AI 시스템",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson으로 응답 직렬화 (datetime 등 네이티브 처리)
 )
 
 # CORS 미들웨어 설정
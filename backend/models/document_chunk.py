@@ -2,14 +2,42 @@
 DocumentChunk ORM 모델
 벡터화된 텍스트 청크를 저장합니다.
 """
+import numpy as np
 from sqlalchemy import Column, Integer, String, Text, Float, TIMESTAMP, ForeignKey, JSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC, HalfVector
 
 from core.database import Base
 
 
+class HalfVec(HALFVEC):
+    """
+    halfvec 컬럼 타입 (연결마다 등록되는 halfvec 바이너리 코덱과 함께 사용)
+    
+    pgvector의 HALFVEC는 텍스트 형식 값을 가정하므로, 코덱이 디코딩한 배열을 받으면
+    조회가 실패합니다. FP16 변환은 코덱이 처리하므로 리스트/배열은 그대로 전달하고,
+    조회 결과는 코덱이 만든 float32 배열을 그대로 반환합니다.
+    """
+    
+    cache_ok = True
+    
+    def bind_processor(self, dialect):
+        def process(value):
+            if isinstance(value, str):
+                return HalfVector.from_text(value)
+            return value
+        return process
+    
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            if value is None or isinstance(value, np.ndarray):
+                return value
+            # 코덱이 등록되지 않은 연결 (텍스트 형식)
+            return HalfVector._from_db(value).to_numpy().astype(np.float32)
+        return process
+
+
 class DocumentChunk(Base):
     """문서 청크 모델"""
     
@@ -27,7 +55,7 @@ class DocumentChunk(Base):
     content_hash = Column(String(64))  # SHA-256 해시
     token_count = Column(Integer)
     meta_data = Column("metadata", JSON)  # JSONB in PostgreSQL (컬럼명은 metadata로 유지)
-    embedding = Column(Vector(1536))  # OpenAI text-embedding-3-large
+    embedding = Column(HalfVec(1536))  # OpenAI text-embedding-3-large (FP16 저장)
     confidence_score = Column(Float, default=1.0)
     created_at = Column(TIMESTAMP, server_default=func.now())
     
@@ -0,0 +1,253 @@
+"""
+답변 캐싱 서비스
+- 1단계: 정확 일치 캐시 (model|temperature|system_prompt|context|query 해시)
+- 2단계: 의미 캐시 (동일 컨텍스트 내에서 질의 임베딩 코사인 유사도 비교)
+- 동일하거나 표현만 다른 질문에 대한 GPT-4o 호출 최소화
+"""
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from core.cache import cache
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _cosine_similarity(query_vector: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """
+    정규화된 벡터 간 코사인 유사도를 계산합니다.
+    
+    Args:
+        query_vector: 정규화된 질의 벡터 (dim,)
+        vectors: 정규화된 후보 벡터 행렬 (n, dim)
+    
+    Returns:
+        후보별 코사인 유사도 (n,)
+    """
+    return vectors @ query_vector
+
+
+class _ContextEntries:
+    """
+    컨텍스트별 질의 임베딩 저장소
+    
+    임베딩을 연속된 float32 행렬 하나에 행 단위로 저장하여
+    조회 시 행렬-벡터 곱 한 번(BLAS)으로 유사도를 계산합니다.
+    (조회마다 벡터 목록을 쌓아 새 행렬을 만들지 않음)
+    """
+    
+    INITIAL_CAPACITY = 4
+    
+    def __init__(self, dim: int, max_size: int):
+        self.max_size = max_size
+        self.matrix = np.empty((min(self.INITIAL_CAPACITY, max_size), dim), dtype=np.float32)
+        self.keys: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    @property
+    def vectors(self) -> np.ndarray:
+        """저장된 임베딩 행렬 (n, dim) 뷰"""
+        return self.matrix[:len(self.keys)]
+    
+    def append(self, vector: np.ndarray, key: str):
+        """임베딩 추가 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+        if key in self.keys:
+            return
+        
+        size = len(self.keys)
+        if size == self.max_size:
+            self.remove(0)
+            size -= 1
+        elif size == len(self.matrix):
+            # 용량 부족 시 2배로 확장 (최대 max_size)
+            grown = np.empty((min(size * 2, self.max_size), self.matrix.shape[1]), dtype=np.float32)
+            grown[:size] = self.matrix[:size]
+            self.matrix = grown
+        
+        self.matrix[size] = vector
+        self.keys.append(key)
+    
+    def remove(self, idx: int):
+        """idx번째 항목 제거 (뒤쪽 행을 앞으로 이동)"""
+        size = len(self.keys)
+        self.matrix[idx:size - 1] = self.matrix[idx + 1:size]
+        del self.keys[idx]
+
+
+class AnswerCacheService:
+    """답변 캐시 서비스 (정확 일치 + 의미 유사도)"""
+    
+    SIMILARITY_THRESHOLD = 0.92  # 의미 캐시 적중 기준 (코사인 유사도)
+    MAX_CONTEXTS = 1000  # 의미 인덱스에 유지할 최대 컨텍스트 수 (LRU)
+    MAX_QUERIES_PER_CONTEXT = 50  # 컨텍스트별 최대 질의 수
+    
+    def __init__(self):
+        self.cache_prefix = "answer"
+        self.ttl = settings.CACHE_TTL
+        # 의미 인덱스: context_hash → 정규화된 질의 임베딩 행렬 + 정확 일치 키
+        # 참조 번호([참조 N])가 컨텍스트 순서에 묶여 있으므로
+        # 의미 캐시는 동일한 컨텍스트 안에서만 재사용합니다.
+        self._semantic_index: OrderedDict[str, _ContextEntries] = OrderedDict()
+    
+    @staticmethod
+    def _hash(*parts: Any) -> str:
+        """구분자로 연결한 값들의 sha256 해시"""
+        joined = "|".join(str(part) for part in parts)
+        return hashlib.sha256(joined.encode('utf-8')).hexdigest()
+    
+    def get_cache_key(
+        self,
+        model: str,
+        temperature: float,
+        system_prompt: str,
+        context: str,
+        query: str
+    ) -> str:
+        """정확 일치 캐시 키 생성"""
+        digest = self._hash(model, temperature, system_prompt, context, query)
+        return f"{self.cache_prefix}:{model}:{digest}"
+    
+    def get_context_hash(self, model: str, temperature: float, system_prompt: str, context: str) -> str:
+        """의미 인덱스 버킷 키 생성 (질의 제외)"""
+        return self._hash(model, temperature, system_prompt, context)
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """정확 일치 캐시 조회"""
+        if not settings.CACHE_ENABLED:
+            return None
+        
+        try:
+            cached = await cache.get_json(key)
+            if cached:
+                logger.info(f"답변 캐시 HIT (정확 일치): {key[-12:]}")
+                return cached
+            return None
+        
+        except Exception as e:
+            logger.error(f"답변 캐시 조회 오류: {e}")
+            return None
+    
+    async def get_similar(
+        self,
+        context_hash: str,
+        query_embedding: List[float]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        동일 컨텍스트에서 의미적으로 유사한 질의의 답변을 조회합니다.
+        
+        Args:
+            context_hash: get_context_hash()로 생성한 컨텍스트 해시
+            query_embedding: 질의 임베딩
+        
+        Returns:
+            캐시된 답변 딕셔너리 (없으면 None)
+        """
+        if not settings.CACHE_ENABLED:
+            return None
+        
+        entries = self._semantic_index.get(context_hash)
+        if not entries:
+            return None
+        
+        try:
+            query_vector = self._normalize(query_embedding)
+            if query_vector is None:
+                return None
+            
+            if query_vector.shape[0] != entries.matrix.shape[1]:
+                return None
+            
+            similarities = _cosine_similarity(query_vector, entries.vectors)
+            best_idx = int(np.argmax(similarities))
+            best_similarity = float(similarities[best_idx])
+            
+            if best_similarity < self.SIMILARITY_THRESHOLD:
+                logger.debug(f"답변 캐시 MISS (의미): 최고 유사도 {best_similarity:.3f}")
+                return None
+            
+            self._semantic_index.move_to_end(context_hash)
+            cached = await cache.get_json(entries.keys[best_idx])
+            if cached:
+                logger.info(f"답변 캐시 HIT (의미): 유사도 {best_similarity:.3f}")
+                return cached
+            
+            # 만료된 항목은 인덱스에서 제거
+            entries.remove(best_idx)
+            return None
+        
+        except Exception as e:
+            logger.error(f"의미 캐시 조회 오류: {e}")
+            return None
+    
+    async def set(
+        self,
+        key: str,
+        value: Dict[str, Any],
+        context_hash: Optional[str] = None,
+        query_embedding: Optional[List[float]] = None
+    ):
+        """
+        답변을 캐시에 저장하고, 임베딩이 있으면 의미 인덱스에 등록합니다.
+        
+        Args:
+            key: 정확 일치 캐시 키
+            value: 저장할 답변 딕셔너리
+            context_hash: 의미 인덱스 버킷 키
+            query_embedding: 질의 임베딩
+        """
+        if not settings.CACHE_ENABLED:
+            return
+        
+        try:
+            await cache.set_json(key, value, self.ttl)
+            
+            if context_hash and query_embedding:
+                query_vector = self._normalize(query_embedding)
+                if query_vector is not None:
+                    self._add_to_index(context_hash, query_vector, key)
+            
+            logger.debug(f"답변 캐시 저장: {key[-12:]}")
+        
+        except Exception as e:
+            logger.error(f"답변 캐시 저장 오류: {e}")
+    
+    def _add_to_index(self, context_hash: str, query_vector: np.ndarray, key: str):
+        """의미 인덱스에 질의 임베딩 추가 (LRU 크기 제한)"""
+        entries = self._semantic_index.get(context_hash)
+        if entries is None or entries.matrix.shape[1] != query_vector.shape[0]:
+            entries = _ContextEntries(query_vector.shape[0], self.MAX_QUERIES_PER_CONTEXT)
+            self._semantic_index[context_hash] = entries
+        self._semantic_index.move_to_end(context_hash)
+        
+        entries.append(query_vector, key)
+        
+        while len(self._semantic_index) > self.MAX_CONTEXTS:
+            self._semantic_index.popitem(last=False)
+    
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[np.ndarray]:
+        """L2 정규화 (제로 벡터는 None)"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+    
+    async def clear_cache(self):
+        """답변 캐시 전체 삭제"""
+        try:
+            self._semantic_index.clear()
+            await cache.clear_pattern(f"{self.cache_prefix}:*")
+            logger.info("답변 캐시 전체 삭제 완료")
+        except Exception as e:
+            logger.error(f"답변 캐시 삭제 오류: {e}")
+
+
+# 싱글톤 인스턴스
+answer_cache_service = AnswerCacheService()
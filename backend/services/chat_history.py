@@ -175,22 +175,11 @@ class ChatHistoryService:
         result = await session.execute(stmt)
         sessions = result.scalars().all()
         
-        # 응답 구성
-        sessions_list = []
-        for s in sessions:
-            sessions_list.append({
-                "id": s.id,
-                "thread_id": s.thread_id,
-                "title": s.title,
-                "message_count": s.message_count,
-                "created_at": s.created_at.isoformat() if s.created_at else None,
-                "updated_at": s.updated_at.isoformat() if s.updated_at else None
-            })
-        
-        logger.info(f"세션 목록 조회: count={len(sessions_list)}, total={total}")
+        logger.info(f"세션 목록 조회: count={len(sessions)}, total={total}")
         
+        # ChatSession 객체는 API 응답 모델이 직렬화
         return {
-            "sessions": sessions_list,
+            "sessions": sessions,
             "total": total,
             "offset": offset,
             "limit": limit
@@ -255,4 +244,5 @@ class ChatHistoryService:
         return True
 
 
-
+# 싱글톤 인스턴스 (요청마다 생성하지 않음)
+chat_history_service = ChatHistoryService()
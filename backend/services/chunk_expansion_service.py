@@ -4,12 +4,12 @@
 """
 import logging
 import re
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
-import tiktoken
 
 from services.vector_search import VectorSearchResult
+from core.tokenizer import get_encoding
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +35,7 @@ class ChunkExpansionService:
     def __init__(self):
         """청크 확장 서비스 초기화"""
         # GPT-4 호환 인코딩
-        self.encoding = tiktoken.get_encoding("cl100k_base")
+        self.encoding = get_encoding("cl100k_base")
         logger.info(
             f"ChunkExpansionService 초기화 완료: "
             f"MAX_CONTEXT_TOKENS={self.MAX_CONTEXT_TOKENS}"
@@ -386,7 +386,7 @@ class ChunkExpansionService:
         search_results: List[VectorSearchResult],
         chunks_to_expand: List[Dict[str, Any]],  # ⭐ 딕셔너리 리스트로 변경 (방향 정보 포함)
         max_tokens: int = None
-    ) -> List[VectorSearchResult]:
+    ) -> Tuple[List[VectorSearchResult], List[int]]:
         """
         검색 결과에서 지정된 청크들을 확장합니다.
         
@@ -397,12 +397,13 @@ class ChunkExpansionService:
             max_tokens: 최대 토큰 수
         
         Returns:
-            확장된 검색 결과 목록
+            (확장된 검색 결과 목록, 이번에 확장된 청크 ID 목록)
         """
         if max_tokens is None:
             max_tokens = self.MAX_CONTEXT_TOKENS
         
         expanded_results = []
+        expanded_chunk_ids = []
         total_tokens = 0
         
         # 확장 정보를 딕셔너리로 변환 (chunk_id → direction)
@@ -481,6 +482,7 @@ class ChunkExpansionService:
                 )
                 
                 expanded_results.append(expanded_result)
+                expanded_chunk_ids.append(result.chunk_id)
                 total_tokens += merged["total_tokens"]
             else:
                 # 확장이 필요없는 청크는 그대로 유지
@@ -498,12 +500,14 @@ class ChunkExpansionService:
                 total_tokens += chunk_tokens
         
         logger.info(
-            f"검색 결과 확장 완료: {len(expanded_results)}개, "
-            f"{total_tokens}/{max_tokens} 토큰"
-            # VectorSearchResult 객체에는 model_dump() 메서드가 없습니다.
-            # to_dict() 메서드를 사용해야 합니다.
-            f"검색 결과 expanded_results content: {[result.content for result in expanded_results]} "
+            "검색 결과 확장 완료: %d개, %d/%d 토큰",
+            len(expanded_results), total_tokens, max_tokens
         )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "검색 결과 expanded_results content: %s",
+                [result.content for result in expanded_results]
+            )
         
-        return expanded_results
+        return expanded_results, expanded_chunk_ids
 
@@ -7,7 +7,7 @@ import hashlib
 from typing import List, Dict, Any
 from dataclasses import dataclass
 import logging
-import tiktoken
+from core.tokenizer import get_encoding
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +57,7 @@ class TextChunker:
         """
         self.chunk_size = chunk_size
         self.overlap = overlap
-        self.encoding = tiktoken.get_encoding(encoding_name)
+        self.encoding = get_encoding(encoding_name)
         logger.info(
             f"TextChunker 초기화: chunk_size={chunk_size}, "
             f"overlap={overlap}, encoding={encoding_name}"
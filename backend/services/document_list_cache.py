@@ -0,0 +1,87 @@
+"""
+문서 목록 캐싱 서비스
+- 필터/정렬/페이지 조건별 목록 조회 결과를 짧은 TTL로 캐싱
+- 업로드/삭제 시 무효화하여 UI 폴링 중 반복되는 DB 조회 최소화
+"""
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+from core.cache import cache
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentListCacheService:
+    """문서 목록 캐시 서비스"""
+    
+    TTL_SECONDS = 5  # 목록은 업로드 처리 상태에 따라 바뀌므로 짧게 유지
+    # 문서 변경 버전 키 (추가/삭제/상태 변경마다 증가, 검색 결과 캐시 무효화에 사용)
+    VERSION_KEY = "documents:version"
+    
+    def __init__(self):
+        self.cache_prefix = "documents:list"
+    
+    def get_cache_key(self, **conditions: Any) -> str:
+        """조회 조건(필터/정렬/offset/limit)으로 캐시 키 생성"""
+        joined = "|".join(f"{name}={conditions[name]}" for name in sorted(conditions))
+        digest = hashlib.md5(joined.encode('utf-8')).hexdigest()
+        return f"{self.cache_prefix}:{digest}"
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 목록 조회"""
+        if not settings.CACHE_ENABLED:
+            return None
+        
+        try:
+            cached = await cache.get_json(key)
+            if cached:
+                logger.debug(f"문서 목록 캐시 HIT: {key[-12:]}")
+            return cached
+        
+        except Exception as e:
+            logger.error(f"문서 목록 캐시 조회 오류: {e}")
+            return None
+    
+    async def set(self, key: str, value: Dict[str, Any]):
+        """목록 조회 결과 저장"""
+        if not settings.CACHE_ENABLED:
+            return
+        
+        try:
+            await cache.set_json(key, value, self.TTL_SECONDS)
+        except Exception as e:
+            logger.error(f"문서 목록 캐시 저장 오류: {e}")
+    
+    async def get_version(self) -> Optional[int]:
+        """
+        문서 변경 버전 조회 (Redis 사용 시 워커 프로세스 간 공유)
+        
+        Returns:
+            문서 변경 버전 (조회 실패 시 None)
+        """
+        try:
+            return await cache.get_counter(self.VERSION_KEY)
+        except Exception as e:
+            logger.error(f"문서 변경 버전 조회 오류: {e}")
+            return None
+    
+    async def invalidate(self):
+        """문서 추가/삭제/상태 변경 시 문서 변경 버전 증가 및 목록 캐시 전체 삭제"""
+        try:
+            await cache.incr(self.VERSION_KEY)
+        except Exception as e:
+            logger.error(f"문서 변경 버전 갱신 오류: {e}")
+        
+        if not settings.CACHE_ENABLED:
+            return
+        
+        try:
+            await cache.clear_pattern(f"{self.cache_prefix}:*")
+        except Exception as e:
+            logger.error(f"문서 목록 캐시 무효화 오류: {e}")
+
+
+# 싱글톤 인스턴스
+document_list_cache = DocumentListCacheService()
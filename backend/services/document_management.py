@@ -3,7 +3,9 @@
 약관 목록 조회, 삭제, 다운로드 기능을 제공합니다.
 """
 import logging
-from typing import Optional, Dict, Any
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,9 +15,13 @@ logger = logging.getLogger(__name__)
 class DocumentManagementService:
     """문서 관리 서비스"""
     
+    FILE_PATH_CACHE_SIZE = 512  # 다운로드 경로 캐시 최대 항목 수
+    FILE_PATH_CACHE_TTL = 300.0  # 다운로드 경로 캐시 유지 시간 (초)
+    
     def __init__(self):
         """초기화"""
-        pass
+        # (문서 ID, 파일 유형) → (만료 시각, 파일 경로) - 반복 다운로드 시 DB 조회 생략
+        self._file_path_cache: OrderedDict[Tuple[int, str], Tuple[float, Path]] = OrderedDict()
     
     async def list_documents(
         self,
@@ -202,6 +208,10 @@ class DocumentManagementService:
         await session.commit()
         logger.info(f"DB 레코드 삭제 완료: ID={document_id}")
         
+        # 다운로드 경로 캐시 제거
+        for file_type in ('pdf', 'markdown'):
+            self._file_path_cache.pop((document_id, file_type), None)
+        
         # 4. 파일 삭제 (커밋 후)
         deleted_files = []
         # PDF 삭제
@@ -263,27 +273,36 @@ class DocumentManagementService:
         from fastapi import HTTPException, status
         from models.document import Document
         
-        # 문서 조회
-        document = await session.get(Document, document_id)
-        if not document:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"문서를 찾을 수 없습니다: ID={document_id}"
-            )
-        
-        # 파일 경로 결정
-        pdf_path = Path(document.file_path)
-        if file_type == 'pdf':
-            file_path = pdf_path
-        elif file_type == 'markdown':
-            file_path = pdf_path.with_suffix('.md')
-        else:
+        if file_type not in ('pdf', 'markdown'):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="file_type은 'pdf' 또는 'markdown'이어야 합니다"
             )
         
-        # 파일 존재 확인
+        cache_key = (document_id, file_type)
+        entry = self._file_path_cache.get(cache_key)
+        if entry is not None and time.monotonic() <= entry[0]:
+            self._file_path_cache.move_to_end(cache_key)
+            file_path = entry[1]
+        else:
+            # 문서 조회
+            document = await session.get(Document, document_id)
+            if not document:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"문서를 찾을 수 없습니다: ID={document_id}"
+                )
+            
+            # 파일 경로 결정
+            pdf_path = Path(document.file_path)
+            file_path = pdf_path if file_type == 'pdf' else pdf_path.with_suffix('.md')
+            
+            self._file_path_cache[cache_key] = (time.monotonic() + self.FILE_PATH_CACHE_TTL, file_path)
+            self._file_path_cache.move_to_end(cache_key)
+            if len(self._file_path_cache) > self.FILE_PATH_CACHE_SIZE:
+                self._file_path_cache.popitem(last=False)
+        
+        # 파일 존재 확인 (캐시 HIT여도 매번 확인하여 삭제된 파일은 404)
         if not file_path.exists():
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -378,3 +397,6 @@ class DocumentManagementService:
                 'total_pages': document.total_pages
             }
 
+
+# 싱글톤 인스턴스 (요청마다 생성하지 않음)
+document_management_service = DocumentManagementService()
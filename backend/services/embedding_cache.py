@@ -6,7 +6,8 @@
 import hashlib
 import logging
 from typing import List, Optional
-import json
+
+import orjson
 
 from core.cache import cache
 from core.config import settings
@@ -37,7 +38,7 @@ class EmbeddingCacheService:
             cached_value = await cache.get(key)
             
             if cached_value:
-                embedding = json.loads(cached_value)
+                embedding = orjson.loads(cached_value)
                 logger.debug(f"임베딩 캐시 HIT: {text[:50]}...")
                 return embedding
             
@@ -55,7 +56,7 @@ class EmbeddingCacheService:
         
         try:
             key = self._get_cache_key(text, model)
-            value = json.dumps(embedding)
+            value = orjson.dumps(embedding, option=orjson.OPT_SERIALIZE_NUMPY).decode()
             await cache.set(key, value, self.ttl)
             logger.debug(f"임베딩 캐시 저장: {text[:50]}...")
         
@@ -67,12 +68,18 @@ class EmbeddingCacheService:
         texts: List[str],
         model: str = "text-embedding-3-large"
     ) -> List[Optional[List[float]]]:
-        """배치로 임베딩 가져오기"""
-        results = []
-        for text in texts:
-            embedding = await self.get_embedding(text, model)
-            results.append(embedding)
-        return results
+        """배치로 임베딩 가져오기 (캐시 왕복 1회)"""
+        if not settings.CACHE_ENABLED or not texts:
+            return [None] * len(texts)
+        
+        try:
+            keys = [self._get_cache_key(text, model) for text in texts]
+            cached_values = await cache.get_many(keys)
+            return [orjson.loads(value) if value else None for value in cached_values]
+        
+        except Exception as e:
+            logger.error(f"임베딩 배치 캐시 조회 오류: {e}")
+            return [None] * len(texts)
     
     async def set_batch_embeddings(
         self,
@@ -80,9 +87,19 @@ class EmbeddingCacheService:
         embeddings: List[List[float]],
         model: str = "text-embedding-3-large"
     ):
-        """배치로 임베딩 저장"""
-        for text, embedding in zip(texts, embeddings):
-            await self.set_embedding(text, embedding, model)
+        """배치로 임베딩 저장 (캐시 왕복 1회)"""
+        if not settings.CACHE_ENABLED or not texts:
+            return
+        
+        try:
+            items = {
+                self._get_cache_key(text, model): orjson.dumps(embedding, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+                for text, embedding in zip(texts, embeddings)
+            }
+            await cache.set_many(items, self.ttl)
+        
+        except Exception as e:
+            logger.error(f"임베딩 배치 캐시 저장 오류: {e}")
     
     async def clear_cache(self):
         """임베딩 캐시 전체 삭제"""
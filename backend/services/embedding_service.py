@@ -22,9 +22,19 @@ class EmbeddingService:
     EMBEDDING_DIM = 1536
     BATCH_SIZE = 2048  # OpenAI API 최대 배치 크기 (100 → 2048 최적화)
     
-    def __init__(self):
-        """초기화"""
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    def __init__(self, openai_client=None):
+        """
+        초기화
+        
+        Args:
+            openai_client: AsyncOpenAI 인스턴스 (의존성 주입)
+        """
+        # 의존성 주입: 외부에서 주입되지 않으면 기본 생성 (하위 호환성)
+        if openai_client is None:
+            openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            logger.warning("EmbeddingService: openai_client가 주입되지 않아 기본 인스턴스 생성")
+        
+        self.client = openai_client
         self.semaphore = asyncio.Semaphore(50)  # 동시 요청 제한 (5 → 50 최적화)
         logger.info(
             f"EmbeddingService 초기화: model={self.MODEL_NAME}, "
@@ -9,10 +9,11 @@ import time
 from typing import List, Optional, Tuple
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
-import tiktoken
 
 from services.vector_search import VectorSearchService, VectorSearchResult
 from utils.text_utils import extract_keywords
+from core.tokenizer import get_encoding
+from core.database import AsyncSessionLocal, get_pool_status
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,7 @@ class HybridSearchService:
         """하이브리드 검색 서비스 초기화"""
         self.vector_search_service = VectorSearchService()
         # GPT-4 호환 인코딩
-        self.encoding = tiktoken.get_encoding("cl100k_base")
+        self.encoding = get_encoding("cl100k_base")
         logger.info(
             f"HybridSearchService 초기화 완료: "
             f"RRF_K={self.RRF_K}, MAX_TOKENS={self.MAX_CONTEXT_TOKENS}"
@@ -321,6 +322,51 @@ class HybridSearchService:
         
         return optimized_results, total_tokens
     
+    @staticmethod
+    def _has_spare_connection() -> bool:
+        """
+        키워드 검색용 별도 세션에 쓸 유휴 연결이 풀에 있는지 확인합니다.
+        
+        Returns:
+            풀 크기보다 사용 중인 연결이 적으면 True (NullPool은 항상 True)
+        """
+        pool_status = get_pool_status()
+        if "checked_out" not in pool_status:
+            return True
+        return pool_status["checked_out"] < pool_status["size"]
+    
+    async def _keyword_search_in_new_session(self, **kwargs) -> List[VectorSearchResult]:
+        """
+        풀에서 별도 세션을 받아 키워드 검색을 수행합니다 (벡터 검색과 동시 실행용).
+        
+        Args:
+            **kwargs: keyword_search() 인자 (session 제외)
+        
+        Returns:
+            VectorSearchResult 리스트
+        """
+        async with AsyncSessionLocal() as keyword_session:
+            return await self.keyword_search(session=keyword_session, **kwargs)
+    
+    async def _vector_search(self, **kwargs) -> List[VectorSearchResult]:
+        """
+        하이브리드 검색용 벡터 검색 (실패 시 빈 결과로 키워드 검색 결과만 활용)
+        
+        Args:
+            **kwargs: VectorSearchService.search() 인자
+        
+        Returns:
+            VectorSearchResult 리스트
+        """
+        try:
+            return await self.vector_search_service.search(
+                log_search=False,  # 하이브리드 검색 로그 1건만 기록 (DB 왕복 1회 절감)
+                **kwargs
+            )
+        except Exception as e:
+            logger.error(f"벡터 검색 실패: {e}")
+            return []
+    
     async def hybrid_search(
         self,
         session: AsyncSession,
@@ -358,38 +404,59 @@ class HybridSearchService:
             f"limit={limit}, threshold={threshold}"
         )
         
-        # 1. 벡터 검색과 키워드 검색 순차 실행
-        # SQLAlchemy 비동기 세션은 동시 쿼리를 지원하지 않으므로 순차 실행
-        logger.debug("벡터 검색 실행 중...")
-        try:
-            vector_results = await self.vector_search_service.search(
-                session=session,
-                query=query,
-                threshold=threshold,
-                limit=limit * 2,  # RRF 융합을 위해 더 많이 가져옴
-                document_type=document_type,
-                clause_number=clause_number,
-                user_id=user_id
-            )
-        except Exception as e:
-            logger.error(f"벡터 검색 실패: {e}")
-            vector_results = []
+        keyword_kwargs = dict(
+            query=query,
+            limit=limit * 2,  # RRF 융합을 위해 더 많이 가져옴
+            document_type=document_type,
+            clause_number=clause_number
+        )
+        vector_kwargs = dict(
+            session=session,
+            query=query,
+            threshold=threshold,
+            limit=limit * 2,  # RRF 융합을 위해 더 많이 가져옴
+            document_type=document_type,
+            clause_number=clause_number,
+            user_id=user_id
+        )
         
-        logger.debug("키워드 검색 실행 중...")
-        try:
-            keyword_results = await self.keyword_search(
-                session=session,
-                query=query,
-                limit=limit * 2,  # RRF 융합을 위해 더 많이 가져옴
-                document_type=document_type,
-                clause_number=clause_number
+        if self._has_spare_connection():
+            # 1. 키워드 검색은 풀에서 별도 세션을 받아 실행하고, 벡터 검색(임베딩 → pgvector)은
+            # 공유 세션으로 동시에 실행 (AsyncSession은 태스크 간 동시 사용 불가)
+            logger.debug("벡터 검색 + 키워드 검색(별도 세션) 동시 실행 중...")
+            vector_results, keyword_results = await asyncio.gather(
+                self._vector_search(**vector_kwargs),
+                self._keyword_search_in_new_session(**keyword_kwargs),
+                return_exceptions=True
             )
-        except Exception as e:
-            logger.error(f"키워드 검색 실패: {e}")
+            # return_exceptions=True는 CancelledError 등 Exception이 아닌 예외도 결과로 반환
+            if isinstance(vector_results, BaseException):
+                logger.error(f"벡터 검색 실패: {vector_results}")
+                vector_results = []
+        else:
+            # 1. 풀 여유가 없으면 공유 세션만 사용: 쿼리 임베딩 생성(OpenAI API)과 키워드 검색(DB)을 동시 실행
+            # 세션은 키워드 검색만 사용하므로 비동기 세션 동시 쿼리 제약에 걸리지 않음
+            logger.debug("쿼리 임베딩 생성 + 키워드 검색 실행 중...")
+            query_embedding, keyword_results = await asyncio.gather(
+                self.vector_search_service.embedding_service.create_embedding(query),
+                self.keyword_search(session=session, **keyword_kwargs),
+                return_exceptions=True
+            )
+            
+            # 2. 생성된 임베딩으로 벡터 검색 (세션 사용은 키워드 검색 완료 후)
+            logger.debug("벡터 검색 실행 중...")
+            if isinstance(query_embedding, BaseException):
+                logger.error(f"벡터 검색 실패 (임베딩 생성): {query_embedding}")
+                vector_results = []
+            else:
+                vector_results = await self._vector_search(query_embedding=query_embedding, **vector_kwargs)
+        
+        if isinstance(keyword_results, BaseException):
+            logger.error(f"키워드 검색 실패: {keyword_results}")
             keyword_results = []
         
         logger.info(
-            f"순차 검색 완료: 벡터={len(vector_results)}개, "
+            f"검색 완료: 벡터={len(vector_results)}개, "
             f"키워드={len(keyword_results)}개"
         )
         
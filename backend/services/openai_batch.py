@@ -0,0 +1,150 @@
+"""
+OpenAI Batch API 서비스
+실시간 응답이 필요 없는 요청(관리자 재처리, 오프라인 평가 등)을
+Batch API로 모아서 처리합니다. (24시간 이내 완료, 토큰 비용 50% 절감)
+"""
+import asyncio
+import json
+import logging
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class OpenAIBatchService:
+    """OpenAI Batch API 요청 적재/제출/결과 수집 서비스"""
+    
+    ENDPOINT = "/v1/chat/completions"
+    COMPLETION_WINDOW = "24h"
+    
+    def __init__(self, openai_client=None):
+        """
+        초기화
+        
+        Args:
+            openai_client: AsyncOpenAI 인스턴스 (의존성 주입)
+        """
+        # 의존성 주입: 외부에서 주입되지 않으면 기본 생성 (하위 호환성)
+        if openai_client is None:
+            from openai import AsyncOpenAI
+            openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            logger.warning("OpenAIBatchService: openai_client가 주입되지 않아 기본 인스턴스 생성")
+        
+        self.client = openai_client
+        self.staging_dir = Path(settings.UPLOAD_DIR) / "batch"
+        self.staging_path = self.staging_dir / "pending.jsonl"
+        self._lock = asyncio.Lock()
+        logger.info(f"OpenAIBatchService 초기화: staging={self.staging_path}")
+    
+    async def enqueue(
+        self,
+        body: Dict[str, Any],
+        custom_id: Optional[str] = None
+    ) -> str:
+        """
+        Chat Completions 요청을 스테이징 파일에 적재합니다.
+        
+        Args:
+            body: Chat Completions 요청 본문 (model, temperature, max_tokens, messages)
+            custom_id: 요청 식별자 (없으면 자동 생성)
+        
+        Returns:
+            요청 식별자 (custom_id)
+        """
+        custom_id = custom_id or uuid.uuid4().hex
+        line = json.dumps(
+            {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": self.ENDPOINT,
+                "body": body
+            },
+            ensure_ascii=False
+        )
+        
+        async with self._lock:
+            self.staging_dir.mkdir(parents=True, exist_ok=True)
+            with self.staging_path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        
+        logger.info(f"배치 요청 적재: custom_id={custom_id}")
+        return custom_id
+    
+    async def submit(self) -> Optional[str]:
+        """
+        적재된 요청을 Batch API로 제출합니다.
+        
+        Returns:
+            batch_id (적재된 요청이 없으면 None)
+        """
+        async with self._lock:
+            if not self.staging_path.exists() or self.staging_path.stat().st_size == 0:
+                logger.info("제출할 배치 요청이 없습니다.")
+                return None
+            
+            # 제출 중 새 요청이 같은 파일에 섞이지 않도록 이름 변경 후 업로드
+            submit_path = self.staging_dir / f"submit_{uuid.uuid4().hex}.jsonl"
+            self.staging_path.rename(submit_path)
+        
+        try:
+            with submit_path.open("rb") as f:
+                input_file = await self.client.files.create(file=f, purpose="batch")
+            
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=self.ENDPOINT,
+                completion_window=self.COMPLETION_WINDOW
+            )
+            
+            logger.info(f"배치 제출 완료: batch_id={batch.id}, file={input_file.id}")
+            submit_path.unlink()
+            return batch.id
+        
+        except Exception as e:
+            logger.error(f"배치 제출 실패 (파일 보존: {submit_path}): {e}", exc_info=True)
+            raise
+    
+    async def collect_results(self, batch_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        완료된 배치의 결과를 수집합니다.
+        
+        Args:
+            batch_id: 배치 ID
+        
+        Returns:
+            {custom_id: {"answer": str, "tokens_used": int} 또는 {"error": str}}
+            (아직 완료되지 않았으면 None)
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+        
+        if batch.status != "completed":
+            logger.info(f"배치 진행 중: batch_id={batch_id}, status={batch.status}")
+            return None
+        
+        results = {}
+        if batch.output_file_id:
+            content = await self.client.files.content(batch.output_file_id)
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+                
+                item = json.loads(line)
+                custom_id = item.get("custom_id")
+                response = item.get("response") or {}
+                
+                if item.get("error") or response.get("status_code") != 200:
+                    results[custom_id] = {"error": str(item.get("error") or response)}
+                    continue
+                
+                body = response["body"]
+                results[custom_id] = {
+                    "answer": body["choices"][0]["message"]["content"],
+                    "tokens_used": body.get("usage", {}).get("total_tokens", 0)
+                }
+        
+        logger.info(f"배치 결과 수집 완료: batch_id={batch_id}, {len(results)}건")
+        return results
@@ -85,7 +85,7 @@ class PDFProcessor:
         
         try:
             if method == "pymupdf":
-                result = self._process_with_pymupdf(pdf_path, document_id)
+                result = await asyncio.to_thread(self._process_with_pymupdf, pdf_path, document_id)
             elif method == "vision":
                 result = await self._process_with_vision_async(pdf_path, document_id)
             elif method == "both":
@@ -170,7 +170,7 @@ class PDFProcessor:
         
         # Step 1: PyMuPDF로 텍스트 추출
         logger.info("Step 1: PyMuPDF 텍스트 추출")
-        pymupdf_result = self._process_with_pymupdf(pdf_path, document_id)
+        pymupdf_result = await asyncio.to_thread(self._process_with_pymupdf, pdf_path, document_id)
         
         # Step 2: 페이지별 텍스트 추출 (Vision API에 컨텍스트로 제공)
         logger.info("Step 2: 페이지별 컨텍스트 준비")
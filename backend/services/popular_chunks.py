@@ -0,0 +1,78 @@
+"""
+자주 검색되는 청크 추적 서비스
+- 검색 결과에 등장한 청크 빈도를 집계
+- 상위 청크를 고정된 순서로 컨텍스트 앞쪽에 배치하여
+  OpenAI 프롬프트 캐싱(동일 prefix 재사용) 적중률을 높임
+"""
+import logging
+from collections import Counter
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PopularChunkService:
+    """자주 검색되는 청크(약관 보일러플레이트 등) 집계 서비스"""
+    
+    TOP_K = 20  # 인기 청크로 취급할 상위 개수
+    REFRESH_INTERVAL = 100  # 인기 순위 갱신 주기 (검색 횟수)
+    MAX_TRACKED = 10000  # 집계할 최대 청크 수
+    
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._searches = 0
+        # 인기 순위 스냅샷: chunk_id → 순위
+        # 매 검색마다 바뀌면 prefix가 달라지므로 REFRESH_INTERVAL마다만 갱신합니다.
+        self._ranks: Dict[int, int] = {}
+    
+    def record(self, chunk_ids: List[int]):
+        """
+        검색 결과에 포함된 청크를 집계합니다.
+        
+        Args:
+            chunk_ids: 검색 결과 청크 ID 리스트
+        """
+        self._counts.update(chunk_ids)
+        self._searches += 1
+        
+        if self._searches % self.REFRESH_INTERVAL == 0:
+            self._refresh()
+    
+    def _refresh(self):
+        """인기 순위 스냅샷 갱신 (집계 크기 제한 포함)"""
+        if len(self._counts) > self.MAX_TRACKED:
+            self._counts = Counter(dict(self._counts.most_common(self.MAX_TRACKED // 2)))
+        
+        self._ranks = {
+            chunk_id: rank
+            for rank, (chunk_id, _) in enumerate(self._counts.most_common(self.TOP_K))
+        }
+        logger.debug(f"인기 청크 순위 갱신: {len(self._ranks)}개")
+    
+    def order(self, search_results: list) -> Tuple[list, int]:
+        """
+        인기 청크를 인기 순위 순서로 앞에 배치합니다.
+        나머지 결과는 기존(검색/재순위화) 순서를 유지합니다.
+        
+        Args:
+            search_results: 검색 결과 리스트
+        
+        Returns:
+            (재정렬된 검색 결과, 앞쪽 인기 청크 개수)
+        """
+        if not self._ranks:
+            return search_results, 0
+        
+        popular = sorted(
+            (result for result in search_results if result.get("chunk_id") in self._ranks),
+            key=lambda result: self._ranks[result["chunk_id"]]
+        )
+        if not popular:
+            return search_results, 0
+        
+        rest = [result for result in search_results if result.get("chunk_id") not in self._ranks]
+        return popular + rest, len(popular)
+
+
+# 싱글톤 인스턴스
+popular_chunk_service = PopularChunkService()
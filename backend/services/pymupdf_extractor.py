@@ -10,8 +10,58 @@ import hashlib
 import re
 import logging
 
+from services.service_container import get_pdf_process_pool
+
 logger = logging.getLogger(__name__)
 
+PAGES_PER_TASK = 8  # 프로세스 풀 작업 1건당 페이지 수
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> List[Dict]:
+    """
+    PDF의 [start, end) 페이지를 Markdown으로 변환합니다 (프로세스 풀 작업 단위).
+    
+    문서는 범위당 한 번만 열고, 워커에는 파일 경로와 범위만 전달합니다.
+    
+    Args:
+        pdf_path: PDF 파일 경로
+        start: 시작 페이지 인덱스 (0부터)
+        end: 끝 페이지 인덱스 (미포함)
+    
+    Returns:
+        페이지별 데이터 리스트
+    """
+    pages_data = []
+    doc = fitz.open(pdf_path)
+    try:
+        for page_num in range(start, end):
+            page = doc[page_num]
+            
+            # 페이지별 Markdown 변환
+            # table_strategy=None: Markdown 표 생성 비활성화 (일반 텍스트로 표 추출)
+            page_md = pymupdf4llm.to_markdown(
+                doc,
+                pages=[page_num],
+                table_strategy=None
+            )
+            
+            # 후처리: Markdown 표 패턴 제거
+            page_md = PyMuPDFExtractor._remove_markdown_tables(page_md)
+            
+            # 페이지 데이터 구조화
+            pages_data.append({
+                'page_number': page_num + 1,
+                'content': page_md,
+                'content_hash': hashlib.md5(page_md.encode()).hexdigest(),
+                'char_count': len(page_md),
+                'width': page.rect.width,
+                'height': page.rect.height,
+            })
+    finally:
+        doc.close()
+    
+    return pages_data
+
 
 class PyMuPDFExtractor:
     """PyMuPDF4LLM 기반 PDF 추출기"""
@@ -50,7 +100,8 @@ class PyMuPDFExtractor:
             logger.error(f"PDF 변환 실패: {e}")
             raise
     
-    def _remove_markdown_tables(self, markdown_text: str) -> str:
+    @staticmethod
+    def _remove_markdown_tables(markdown_text: str) -> str:
         """
         Markdown 텍스트에서 표 패턴(| ... |)을 제거합니다.
         
@@ -234,52 +285,42 @@ class PyMuPDFExtractor:
         """
         PDF를 페이지별로 추출 및 구조화
         
+        PAGES_PER_TASK 페이지 단위로 나눠 프로세스 풀에서 병렬 변환합니다.
+        (한 작업 분량 이하의 작은 문서는 현재 프로세스에서 바로 변환)
+        
         Args:
             pdf_path: PDF 파일 경로
             
         Returns:
             페이지별 데이터 리스트
         """
-        pages_data = []
-        
         try:
-            doc = fitz.open(pdf_path)
-            total_pages = len(doc)
+            with fitz.open(pdf_path) as doc:
+                total_pages = len(doc)
             
             logger.info(f"PyMuPDF 페이지별 추출 시작: {total_pages}페이지")
             
-            for page_num in range(total_pages):
-                page = doc[page_num]
-                
-                # 페이지별 Markdown 변환
-                # table_strategy=None: Markdown 표 생성 비활성화 (일반 텍스트로 표 추출)
-                page_md = pymupdf4llm.to_markdown(
-                    pdf_path,
-                    pages=[page_num],
-                    table_strategy=None
-                )
-                
-                # 후처리: Markdown 표 패턴 제거
-                page_md = self._remove_markdown_tables(page_md)
-                
-                # 페이지 데이터 구조화
-                page_data = {
-                    'page_number': page_num + 1,
-                    'content': page_md,
-                    'content_hash': hashlib.md5(page_md.encode()).hexdigest(),
-                    'char_count': len(page_md),
-                    'width': page.rect.width,
-                    'height': page.rect.height,
-                }
-                
-                pages_data.append(page_data)
+            if total_pages <= PAGES_PER_TASK:
+                pages_data = _extract_page_range(pdf_path, 0, total_pages)
+            else:
+                # PDF 추출 전용 프로세스 풀 (CPU 바운드 파싱은 스레드로는 GIL 때문에 병렬화되지 않음,
+                # 채팅 요청 경로와 워커를 공유하지 않음)
+                pool = get_pdf_process_pool()
+                futures = [
+                    pool.submit(_extract_page_range, pdf_path, start, min(start + PAGES_PER_TASK, total_pages))
+                    for start in range(0, total_pages, PAGES_PER_TASK)
+                ]
                 
-                # 100페이지마다 진행 로그 표시
-                if (page_num + 1) % 100 == 0:
-                    progress = ((page_num + 1) / total_pages) * 100
-                    logger.info(f"페이지 추출 진행: {page_num + 1}/{total_pages} ({progress:.1f}%)")
+                # 제출 순서대로 결과를 모아 페이지 순서 유지
+                pages_data = []
+                for future in futures:
+                    pages_data.extend(future.result())
+                    
+                    # 100페이지를 넘을 때마다 진행 로그 표시
+                    if len(pages_data) % 100 < PAGES_PER_TASK:
+                        progress = (len(pages_data) / total_pages) * 100
+                        logger.info(f"페이지 추출 진행: {len(pages_data)}/{total_pages} ({progress:.1f}%)")
             
-            doc.close()
             logger.info(f"페이지별 추출 완료: {len(pages_data)}페이지")
             
         except Exception as e:
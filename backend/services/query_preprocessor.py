@@ -11,6 +11,7 @@ Query Preprocessor 서비스
 import json
 import re
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, List, Tuple
 
@@ -19,6 +20,15 @@ from utils.text_utils import extract_keywords
 
 logger = logging.getLogger(__name__)
 
+# 공백 정규화 패턴
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 조항 번호 패턴: "제 N조", "제N조", "N조" (앞쪽 우선)
+_CLAUSE_PATTERNS = (
+    re.compile(r'제\s*(\d+)\s*조'),  # 제15조, 제 15 조
+    re.compile(r'(\d+)\s*조'),       # 15조
+)
+
 
 class QueryPreprocessor:
     """
@@ -28,6 +38,8 @@ class QueryPreprocessor:
     검색 정확도를 향상시킵니다.
     """
     
+    CACHE_SIZE = 4096  # 전처리 결과 LRU 캐시 크기 (순수 함수이므로 질의 문자열로 캐싱)
+    
     def __init__(self):
         """QueryPreprocessor 초기화"""
         # 전문용어 사전 로딩
@@ -39,6 +51,19 @@ class QueryPreprocessor:
             for p in self.term_dictionary.get('incomplete_patterns', [])
         ]
         
+        # 동의어 사전 용어별 확장 키워드 (용어 + 동의어의 키워드, 질의마다 재추출하지 않도록 미리 계산)
+        self.synonym_keywords = {
+            term: frozenset(
+                keyword
+                for text in (term, *synonyms)
+                for keyword in extract_keywords(text)
+            )
+            for term, synonyms in self.synonym_dict.items()
+        }
+        
+        # 전처리 결과 캐시 (질의 → PreprocessedQuery)
+        self._cache: OrderedDict[str, PreprocessedQuery] = OrderedDict()
+        
         logger.info(
             f"QueryPreprocessor 초기화 완료: "
             f"spacing_rules={len(self.spacing_rules)}개, "
@@ -88,7 +113,7 @@ class QueryPreprocessor:
             정규화된 질의
         """
         # 여러 공백을 하나로
-        normalized = re.sub(r'\s+', ' ', query)
+        normalized = _WHITESPACE_RE.sub(' ', query)
         # 앞뒤 공백 제거
         normalized = normalized.strip()
         
@@ -141,14 +166,8 @@ class QueryPreprocessor:
             "15조 보장 내용" → "제15조"
             "보험금 얼마" → None
         """
-        # 패턴: "제 N조", "제N조", "N조"
-        patterns = [
-            r'제\s*(\d+)\s*조',  # 제15조, 제 15 조
-            r'(\d+)\s*조',       # 15조
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, query)
+        for pattern in _CLAUSE_PATTERNS:
+            match = pattern.search(query)
             if match:
                 clause_num = match.group(1)
                 clause_str = f"제{clause_num}조"
@@ -236,6 +255,13 @@ class QueryPreprocessor:
         Returns:
             PreprocessedQuery 객체
         """
+        cached = self._cache.get(query)
+        if cached is not None:
+            self._cache.move_to_end(query)
+            logger.debug(f"질의 전처리 캐시 HIT: '{query}'")
+            # 호출자가 리스트 필드를 수정해도 캐시가 오염되지 않도록 복사본 반환
+            return cached.model_copy(deep=True)
+        
         try:
             logger.debug(f"질의 전처리 시작: '{query}'")
             
@@ -251,15 +277,9 @@ class QueryPreprocessor:
             # 4. 동의어 키워드 확장
             expanded_keywords = set(base_keywords)  # 중복 제거용
             for keyword in base_keywords:
-                # 동의어 사전에서 찾기
-                for term, synonyms in self.synonym_dict.items():
+                # 동의어 사전에서 찾기 (용어 + 동의어 키워드는 초기화 시 계산됨)
+                for term, term_keywords in self.synonym_keywords.items():
                     if term in keyword or keyword in term:
-                        # 동의어도 키워드로 추가
-                        for synonym in synonyms:
-                            synonym_keywords = extract_keywords(synonym)
-                            expanded_keywords.update(synonym_keywords)
-                        # 원래 용어도 포함
-                        term_keywords = extract_keywords(term)
                         expanded_keywords.update(term_keywords)
             
             expanded_terms = list(expanded_keywords)
@@ -288,6 +308,11 @@ class QueryPreprocessor:
                 f"clause={clause_number}"
             )
             
+            # 성공한 결과만 캐싱 (fallback 결과는 캐싱하지 않음)
+            self._cache[query] = result.model_copy(deep=True)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+            
             return result
         
         except Exception as e:
@@ -5,7 +5,8 @@
 Lost in the Middle 문제를 해결하기 위해 사용합니다.
 """
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from services.vector_search import VectorSearchResult
 from utils.text_utils import extract_keywords
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,29 @@ class RerankerService:
         """RerankerService 초기화"""
         logger.info("RerankerService 초기화 완료")
     
+    @staticmethod
+    def _prepare_keywords(keywords: List[str]) -> List[Tuple[str, Optional[Tuple[str, str]]]]:
+        """
+        키워드를 소문자화하고 부분 매칭용 분할을 미리 계산합니다.
+        (rerank 1회당 한 번만 계산하여 결과마다 반복하지 않음)
+        
+        Args:
+            keywords: 검색 키워드 리스트
+        
+        Returns:
+            (소문자 키워드, 부분 매칭용 (앞절반, 뒷절반) 또는 None) 리스트
+        """
+        prepared = []
+        for keyword in keywords:
+            keyword_lower = keyword.lower()
+            halves = None
+            # 예: "초간편고지" → "간편", "고지" 중 하나라도 (긴 키워드는 반으로 나눠서 체크)
+            if len(keyword) >= 4:
+                mid = len(keyword) // 2
+                halves = (keyword_lower[:mid], keyword_lower[mid:])
+            prepared.append((keyword_lower, halves))
+        return prepared
+    
     def calculate_exact_match_score(
         self,
         content: str,
@@ -41,18 +65,36 @@ class RerankerService:
         if not keywords or not content:
             return 0.0
         
+        return self._score_prepared(content, self._prepare_keywords(keywords))
+    
+    def _score_prepared(
+        self,
+        content: str,
+        prepared_keywords: List[Tuple[str, Optional[Tuple[str, str]]]]
+    ) -> float:
+        """
+        _prepare_keywords()로 준비한 키워드로 매칭 점수를 계산합니다.
+        
+        Args:
+            content: 청크 내용
+            prepared_keywords: 준비된 키워드 리스트
+        
+        Returns:
+            매칭 점수 (0.0 ~ 1.0)
+        """
+        if not prepared_keywords or not content:
+            return 0.0
+        
         content_lower = content.lower()
         
         # 콘텐츠 앞부분 (처음 200자)
-        content_front = content[:200].lower()
+        content_front = content_lower[:200]
         
         exact_matches = 0
         partial_matches = 0
         front_matches = 0
         
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            
+        for keyword_lower, halves in prepared_keywords:
             # 1. 정확한 매칭 (대소문자 무시)
             if keyword_lower in content_lower:
                 exact_matches += 1
@@ -60,20 +102,13 @@ class RerankerService:
                 # 2. 앞부분에 있으면 보너스
                 if keyword_lower in content_front:
                     front_matches += 1
-            else:
+            elif halves is not None:
                 # 3. 부분 매칭 (키워드의 일부라도 있는지)
-                # 예: "초간편고지" → "간편", "고지" 중 하나라도
-                if len(keyword) >= 4:
-                    # 긴 키워드는 반으로 나눠서 체크
-                    mid = len(keyword) // 2
-                    part1 = keyword_lower[:mid]
-                    part2 = keyword_lower[mid:]
-                    
-                    if part1 in content_lower or part2 in content_lower:
-                        partial_matches += 0.5
+                if halves[0] in content_lower or halves[1] in content_lower:
+                    partial_matches += 0.5
         
         # 점수 계산
-        total_keywords = len(keywords)
+        total_keywords = len(prepared_keywords)
         exact_ratio = exact_matches / total_keywords
         partial_ratio = partial_matches / total_keywords
         front_ratio = front_matches / total_keywords if exact_matches > 0 else 0
@@ -86,10 +121,11 @@ class RerankerService:
         )
         
         logger.debug(
-            f"매칭 점수: exact={exact_matches}/{total_keywords}, "
-            f"partial={partial_matches:.1f}/{total_keywords}, "
-            f"front={front_matches}/{total_keywords}, "
-            f"score={score:.4f}"
+            "매칭 점수: exact=%d/%d, partial=%.1f/%d, front=%d/%d, score=%.4f",
+            exact_matches, total_keywords,
+            partial_matches, total_keywords,
+            front_matches, total_keywords,
+            score
         )
         
         return score
@@ -126,7 +162,8 @@ class RerankerService:
             f"키워드={keywords}"
         )
         
-        # 각 결과에 대해 정확도 점수 계산
+        # 각 결과에 대해 정확도 점수 계산 (키워드 전처리는 한 번만)
+        prepared_keywords = self._prepare_keywords(keywords)
         reranked_results = []
         
         for idx, result in enumerate(search_results):
@@ -134,7 +171,7 @@ class RerankerService:
             original_similarity = result.get('similarity', 0.0)
             
             # 정확 매칭 점수 계산
-            exact_score = self.calculate_exact_match_score(content, keywords)
+            exact_score = self._score_prepared(content, prepared_keywords)
             
             # 최종 점수 = 원래 유사도 + 정확도 보너스
             final_score = original_similarity + exact_score
@@ -148,10 +185,9 @@ class RerankerService:
             reranked_results.append(result_copy)
             
             logger.debug(
-                f"[{idx+1}] chunk_id={result.get('chunk_id')}, "
-                f"similarity={original_similarity:.4f}, "
-                f"exact={exact_score:.4f}, "
-                f"final={final_score:.4f}"
+                "[%d] chunk_id=%s, similarity=%.4f, exact=%.4f, final=%.4f",
+                idx + 1, result.get('chunk_id'),
+                original_similarity, exact_score, final_score
             )
         
         # 최종 점수로 재정렬 (높은 순)
@@ -160,7 +196,62 @@ class RerankerService:
             reverse=True
         )
         
-        # 로그 출력
+        self._log_top(reranked_results)
+        return reranked_results
+    
+    def rerank_results(
+        self,
+        query: str,
+        results: List[VectorSearchResult],
+        keywords: List[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        검색 결과 객체를 재정렬하고 딕셔너리로 변환합니다.
+        
+        rerank()와 같은 점수로 정렬하되, 점수 계산은 객체 속성으로 하고
+        딕셔너리는 정렬 후 한 번만 생성합니다 (to_dict() 후 다시 복사하지 않음).
+        
+        Args:
+            query: 원본 질의
+            results: 검색 결과 객체 리스트
+            keywords: 추출된 키워드 (없으면 자동 추출)
+        
+        Returns:
+            재정렬된 검색 결과 리스트 (딕셔너리)
+        """
+        if keywords is None:
+            keywords = extract_keywords(query)
+        
+        logger.info(
+            f"Re-ranking 시작: {len(results)}개 결과, "
+            f"키워드={keywords}"
+        )
+        
+        prepared_keywords = self._prepare_keywords(keywords)
+        
+        # (최종 점수, 원래 순위, 정확도 점수, 결과 객체)
+        scored = []
+        for rank, result in enumerate(results, 1):
+            exact_score = self._score_prepared(result.content, prepared_keywords)
+            scored.append((result.similarity + exact_score, rank, exact_score, result))
+        
+        # 최종 점수로 재정렬 (높은 순, 동점이면 원래 순위 유지)
+        scored.sort(key=lambda item: item[0], reverse=True)
+        
+        reranked_results = []
+        for final_score, rank, exact_score, result in scored:
+            result_dict = result.to_dict()
+            result_dict['rerank_exact_score'] = exact_score
+            result_dict['rerank_final_score'] = final_score
+            result_dict['original_rank'] = rank
+            reranked_results.append(result_dict)
+        
+        self._log_top(reranked_results)
+        return reranked_results
+    
+    @staticmethod
+    def _log_top(reranked_results: List[Dict[str, Any]]):
+        """재정렬 결과 상위 5개를 로그로 출력합니다."""
         logger.info("Re-ranking 완료:")
         for idx, result in enumerate(reranked_results[:5]):  # 상위 5개만
             logger.info(
@@ -170,8 +261,6 @@ class RerankerService:
                 f"(similarity={result.get('similarity'):.4f} + "
                 f"exact={result['rerank_exact_score']:.4f})"
             )
-        
-        return reranked_results
 
 
 # 전역 인스턴스
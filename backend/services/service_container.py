@@ -31,8 +31,11 @@ class ServiceContainer:
         self._query_preprocessor = None
         self._text_chunker = None
         self._pdf_processor = None
+        self._http_client = None
         self._openai_client = None
         self._answer_validator = None
+        self._openai_batch_service = None
+        self._pdf_process_pool = None
         
         self._initialized = True
         logger.info("ServiceContainer 초기화 완료")
@@ -41,7 +44,9 @@ class ServiceContainer:
         """EmbeddingService 싱글톤 인스턴스 반환"""
         if self._embedding_service is None:
             from services.embedding_service import EmbeddingService
-            self._embedding_service = EmbeddingService()
+            # openai_client를 주입
+            openai_client = self.get_openai_client()
+            self._embedding_service = EmbeddingService(openai_client)
             logger.info("EmbeddingService 싱글톤 인스턴스 생성")
         return self._embedding_service
     
@@ -95,15 +100,78 @@ class ServiceContainer:
             logger.info("PDFProcessor 싱글톤 인스턴스 생성")
         return self._pdf_processor
     
+    def get_http_client(self):
+        """
+        OpenAI 호출용 httpx.AsyncClient 싱글톤 인스턴스 반환
+        
+        프로세스 전체가 하나의 연결 풀(HTTP/2 가능 시 다중화)을 공유하여
+        요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록 합니다.
+        """
+        if self._http_client is None:
+            import httpx
+            
+            # HTTP/2는 h2 패키지가 필요 (없으면 HTTP/1.1 keep-alive 풀 사용)
+            try:
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+                logger.warning("h2 패키지가 없어 HTTP/1.1로 OpenAI 연결")
+            
+            self._http_client = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+                timeout=httpx.Timeout(60.0, connect=5.0)
+            )
+            logger.info(f"httpx.AsyncClient 싱글톤 인스턴스 생성 (http2={http2})")
+        return self._http_client
+    
     def get_openai_client(self):
         """AsyncOpenAI 싱글톤 인스턴스 반환"""
         if self._openai_client is None:
             from openai import AsyncOpenAI
             from core.config import settings
-            self._openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            # 공유 http_client를 주입
+            self._openai_client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=self.get_http_client()
+            )
             logger.info("AsyncOpenAI 싱글톤 인스턴스 생성")
         return self._openai_client
     
+    def get_pdf_process_pool(self):
+        """
+        PDF 추출 전용 ProcessPoolExecutor 싱글톤 인스턴스 반환
+        
+        PDF 파싱은 순수 Python CPU 작업이라 스레드로는 GIL 때문에 병렬화되지 않으므로
+        별도 프로세스에서 실행합니다. 대용량 업로드가 워커를 수 초간 점유할 수 있어
+        채팅 요청 등 지연에 민감한 경로와는 공유하지 않습니다.
+        (이벤트 루프/DB 연결 풀을 가진 프로세스를 fork하지 않도록 spawn 방식 사용)
+        """
+        if self._pdf_process_pool is None:
+            import multiprocessing
+            import os
+            from concurrent.futures import ProcessPoolExecutor
+            
+            max_workers = min(4, os.cpu_count() or 1)
+            self._pdf_process_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"PDF 추출용 ProcessPoolExecutor 싱글톤 인스턴스 생성 (max_workers={max_workers})")
+        return self._pdf_process_pool
+    
+    async def close(self):
+        """공유 HTTP 연결 풀 및 프로세스 풀 종료 (애플리케이션 종료 시 호출)"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._openai_client = None
+        
+        if self._pdf_process_pool is not None:
+            self._pdf_process_pool.shutdown(wait=False, cancel_futures=True)
+            self._pdf_process_pool = None
+    
     def get_answer_validator(self):
         """AnswerValidator 싱글톤 인스턴스 반환"""
         if self._answer_validator is None:
@@ -113,6 +181,16 @@ class ServiceContainer:
             self._answer_validator = AnswerValidator(openai_client)
             logger.info("AnswerValidator 싱글톤 인스턴스 생성")
         return self._answer_validator
+    
+    def get_openai_batch_service(self):
+        """OpenAIBatchService 싱글톤 인스턴스 반환"""
+        if self._openai_batch_service is None:
+            from services.openai_batch import OpenAIBatchService
+            # openai_client를 주입
+            openai_client = self.get_openai_client()
+            self._openai_batch_service = OpenAIBatchService(openai_client)
+            logger.info("OpenAIBatchService 싱글톤 인스턴스 생성")
+        return self._openai_batch_service
 
 
 # 전역 서비스 컨테이너 인스턴스
@@ -149,6 +227,11 @@ def get_pdf_processor():
     return service_container.get_pdf_processor()
 
 
+def get_http_client():
+    """httpx.AsyncClient 인스턴스 가져오기"""
+    return service_container.get_http_client()
+
+
 def get_openai_client():
     """AsyncOpenAI 인스턴스 가져오기"""
     return service_container.get_openai_client()
@@ -158,3 +241,12 @@ def get_answer_validator():
     """AnswerValidator 인스턴스 가져오기"""
     return service_container.get_answer_validator()
 
+
+def get_openai_batch_service():
+    """OpenAIBatchService 인스턴스 가져오기"""
+    return service_container.get_openai_batch_service()
+
+
+def get_pdf_process_pool():
+    """PDF 추출 전용 ProcessPoolExecutor 인스턴스 가져오기"""
+    return service_container.get_pdf_process_pool()
@@ -357,3 +357,19 @@ class DocumentStructureAnalyzer:
         
         return result
 
+
+# 프로세스 풀 작업용 기본 인스턴스 (작업 함수는 모듈 최상위에 있어야 pickle 가능)
+_default_analyzer = DocumentStructureAnalyzer()
+
+
+def check_completeness(content: str) -> Dict[str, Any]:
+    """
+    기본 분석기로 구조 기반 완결성을 체크합니다 (분석기 인스턴스를 매번 만들지 않도록 재사용).
+    
+    Args:
+        content: 청크 내용
+    
+    Returns:
+        완결성 정보 (front_issues, back_issues 포함)
+    """
+    return _default_analyzer.check_completeness_with_structure(content)
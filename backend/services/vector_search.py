@@ -47,6 +47,25 @@ class VectorSearchResult:
         self.document_type = document_type
         self.company_name = company_name
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VectorSearchResult":
+        """to_dict() 결과로부터 객체 복원"""
+        document = data.get("document") or {}
+        return cls(
+            chunk_id=data["chunk_id"],
+            document_id=data["document_id"],
+            content=data["content"],
+            similarity=data["similarity"],
+            chunk_type=data["chunk_type"],
+            page_number=data.get("page_number"),
+            section_title=data.get("section_title"),
+            clause_number=data.get("clause_number"),
+            metadata=data.get("metadata", {}),
+            document_filename=document.get("filename"),
+            document_type=document.get("type"),
+            company_name=document.get("company_name")
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
         return {
@@ -72,6 +91,8 @@ class VectorSearchService:
     
     DEFAULT_THRESHOLD = 0.7  # 유사도 임계값
     DEFAULT_LIMIT = 10  # 기본 검색 결과 수
+    BQ_CANDIDATES = 1000  # 이진 양자화(해밍 거리) 1차 후보 수 (이후 halfvec 코사인 거리로 재정렬)
+    HNSW_EF_SEARCH_MAX = 1000  # pgvector hnsw.ef_search 허용 최대값
     
     def __init__(self, embedding_service=None):
         """
@@ -100,7 +121,9 @@ class VectorSearchService:
         limit: Optional[int] = None,
         document_type: Optional[str] = None,
         clause_number: Optional[str] = None,
-        user_id: Optional[int] = None
+        user_id: Optional[int] = None,
+        query_embedding: Optional[List[float]] = None,
+        log_search: bool = True
     ) -> List[VectorSearchResult]:
         """
         벡터 검색을 수행합니다.
@@ -113,6 +136,8 @@ class VectorSearchService:
             document_type: 문서 타입 필터 (선택사항)
             clause_number: 조항 번호 필터 (예: "제15조")
             user_id: 사용자 ID (로그 기록용)
+            query_embedding: 미리 생성한 쿼리 임베딩 (없으면 생성)
+            log_search: 검색 로그 기록 여부 (하이브리드 검색은 자체 로그만 기록)
         
         Returns:
             VectorSearchResult 리스트
@@ -129,8 +154,9 @@ class VectorSearchService:
         )
         
         try:
-            # 1. 쿼리 임베딩 생성
-            query_embedding = await self.embedding_service.create_embedding(query)
+            # 1. 쿼리 임베딩 생성 (호출자가 미리 생성한 경우 재사용)
+            if query_embedding is None:
+                query_embedding = await self.embedding_service.create_embedding(query)
             
             if not self.embedding_service.validate_embedding(query_embedding):
                 logger.error("쿼리 임베딩 생성 실패")
@@ -148,19 +174,20 @@ class VectorSearchService:
                 clause_number=clause_number
             )
             
-            # 3. 검색 로그 기록
+            # 3. 검색 로그 기록 (INSERT + commit 왕복이므로 필요할 때만)
             response_time_ms = int((time.time() - start_time) * 1000)
             top_similarity = results[0].similarity if results else 0.0
             
-            await self._log_search(
-                session=session,
-                query=query,
-                search_type="vector",
-                results_count=len(results),
-                top_similarity=top_similarity,
-                response_time_ms=response_time_ms,
-                user_id=user_id
-            )
+            if log_search:
+                await self._log_search(
+                    session=session,
+                    query=query,
+                    search_type="vector",
+                    results_count=len(results),
+                    top_similarity=top_similarity,
+                    response_time_ms=response_time_ms,
+                    user_id=user_id
+                )
             
             logger.info(
                 f"벡터 검색 완료: {len(results)}개 결과, "
@@ -208,11 +235,28 @@ class VectorSearchService:
             clause_filter = "AND c.clause_number = :clause_number"
             logger.info(f"조항 번호 필터 적용: {clause_number}")
         
-        # pgvector 코사인 유사도 검색 쿼리
+        # 1차 후보 추출: 부호 비트로 양자화한 임베딩의 해밍 거리(<~>) 기준 상위 후보만 선택
+        # (idx_chunks_embedding_bq 표현식 인덱스 사용, 차원당 비교 비용이 코사인 거리보다 훨씬 작음)
+        # 후보도 활성 문서/문서 타입 필터를 적용한 범위에서 뽑아야 필터 검색 결과가 비지 않음
+        # 조항 번호 필터는 대상 청크가 적어 후보 밖으로 밀려날 수 있으므로 전체 정밀 검색 유지
+        candidate_filter = ""
+        if not clause_number:
+            candidate_filter = f"""AND c.id IN (
+                    SELECT c.id
+                    FROM document_chunks c
+                    INNER JOIN documents d ON c.document_id = d.id
+                    WHERE d.status = 'active'
+                        {document_filter}
+                    ORDER BY binary_quantize(c.embedding)::bit(1536)
+                        <~> binary_quantize(CAST(:query_embedding AS halfvec(1536)))
+                    LIMIT :candidate_limit
+                )"""
+        
+        # pgvector 코사인 유사도 검색 쿼리 (후보 내에서 halfvec으로 정밀 재정렬)
         # <=> 연산자: 코사인 거리 (0: 동일, 2: 완전 반대)
         # 코사인 유사도 = 1 - 코사인 거리
-        # pgvector.asyncpg.register_vector()로 타입이 등록되어 있으면
-        # Python 리스트를 직접 전달 가능
+        # 연결마다 halfvec 코덱이 등록되어 있으므로 Python 리스트를 직접 전달 가능
+        # (embedding 컬럼이 halfvec이라 파라미터도 halfvec으로 추론되어 FP16으로 인코딩)
         query_sql = text(f"""
             SELECT 
                 c.id as chunk_id,
@@ -233,6 +277,7 @@ class VectorSearchService:
                 AND d.status = 'active'
                 {document_filter}
                 {clause_filter}
+                {candidate_filter}
             ORDER BY c.embedding <=> :query_embedding
             LIMIT :limit
         """)
@@ -250,8 +295,14 @@ class VectorSearchService:
         
         if clause_number:
             params["clause_number"] = clause_number
+        else:
+            params["candidate_limit"] = max(self.BQ_CANDIDATES, limit)
+            # HNSW 인덱스 스캔은 최대 hnsw.ef_search(기본 40)개만 반환하므로
+            # 후보 수만큼 탐색하도록 현재 트랜잭션에서만 상향 (SET은 바인드 파라미터 불가, 정수만 사용)
+            ef_search = min(params["candidate_limit"], self.HNSW_EF_SEARCH_MAX)
+            await session.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
         
-        # 쿼리 실행
+        # 쿼리 실행 (SET LOCAL과 같은 트랜잭션)
         result = await session.execute(query_sql, params)
         rows = result.fetchall()
         
@@ -0,0 +1,204 @@
+"""
+AnswerCacheService 테스트
+
+정확 일치 캐시와 동일 컨텍스트 내 의미 캐시 동작을 검증합니다.
+"""
+import sys
+import os
+import asyncio
+import logging
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# 테스트 환경 설정
+os.environ["TESTING"] = "true"
+
+import numpy as np
+
+from core.cache import cache, MemoryCache
+from services.answer_cache import AnswerCacheService
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(levelname)s - %(name)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def _use_memory_cache():
+    """Redis 없이 MemoryCache 백엔드 사용"""
+    cache._backend = MemoryCache()
+    cache._type = "memory"
+
+
+CACHED_VALUE = {
+    "answer": "**📌 답변**\n암 진단비는 3,000만원입니다 [참조 1, 제5조].",
+    "validation": {"confidence_score": 0.9, "is_reliable": True}
+}
+
+
+async def test_cache_key():
+    """정확 일치 키 생성 테스트"""
+    print("=" * 60)
+    print("Test 1: 정확 일치 키 생성")
+    print("=" * 60)
+    
+    service = AnswerCacheService()
+    
+    key1 = service.get_cache_key("gpt-4o", 0.1, "prompt", "context", "암 진단비는?")
+    key2 = service.get_cache_key("gpt-4o", 0.1, "prompt", "context", "암 진단비는?")
+    key3 = service.get_cache_key("gpt-4o", 0.1, "prompt", "other context", "암 진단비는?")
+    
+    assert key1 == key2, "동일 입력의 키가 다름"
+    assert key1 != key3, "컨텍스트가 다른데 키가 같음"
+    assert key1.startswith("answer:gpt-4o:")
+    
+    print(f"✅ 키 생성 확인: {key1[:30]}...")
+    print()
+
+
+async def test_exact_match():
+    """정확 일치 캐시 저장/조회 테스트"""
+    print("=" * 60)
+    print("Test 2: 정확 일치 캐시")
+    print("=" * 60)
+    
+    _use_memory_cache()
+    service = AnswerCacheService()
+    key = service.get_cache_key("gpt-4o", 0.1, "prompt", "context", "암 진단비는?")
+    
+    assert await service.get(key) is None, "저장 전인데 HIT"
+    
+    await service.set(key, CACHED_VALUE)
+    cached = await service.get(key)
+    
+    assert cached == CACHED_VALUE, "저장한 값과 다름"
+    
+    print("✅ 정확 일치 캐시 HIT 확인")
+    print()
+
+
+async def test_semantic_match():
+    """의미 캐시 테스트 (동일 컨텍스트 내 유사 질의)"""
+    print("=" * 60)
+    print("Test 3: 의미 캐시")
+    print("=" * 60)
+    
+    _use_memory_cache()
+    service = AnswerCacheService()
+    key = service.get_cache_key("gpt-4o", 0.1, "prompt", "context", "암 진단비는?")
+    context_hash = service.get_context_hash("gpt-4o", 0.1, "prompt", "context")
+    other_context_hash = service.get_context_hash("gpt-4o", 0.1, "prompt", "other")
+    
+    await service.set(
+        key,
+        CACHED_VALUE,
+        context_hash=context_hash,
+        query_embedding=[1.0, 0.0, 0.0]
+    )
+    
+    # 유사한 질의 (코사인 유사도 ≈ 0.995)
+    similar = await service.get_similar(context_hash, [1.0, 0.1, 0.0])
+    assert similar == CACHED_VALUE, "유사 질의인데 MISS"
+    
+    # 다른 질의 (코사인 유사도 ≈ 0.707)
+    different = await service.get_similar(context_hash, [1.0, 1.0, 0.0])
+    assert different is None, "다른 질의인데 HIT"
+    
+    # 다른 컨텍스트 (참조 번호가 달라지므로 재사용 금지)
+    other = await service.get_similar(other_context_hash, [1.0, 0.1, 0.0])
+    assert other is None, "다른 컨텍스트인데 HIT"
+    
+    print("✅ 의미 캐시 HIT/MISS 확인")
+    print()
+
+
+async def test_index_limit():
+    """의미 인덱스 크기 제한 테스트"""
+    print("=" * 60)
+    print("Test 4: 의미 인덱스 크기 제한")
+    print("=" * 60)
+    
+    service = AnswerCacheService()
+    service.MAX_CONTEXTS = 2
+    service.MAX_QUERIES_PER_CONTEXT = 2
+    
+    for i in range(3):
+        service._add_to_index("ctx", service._normalize([1.0, float(i)]), f"key{i}")
+    assert len(service._semantic_index["ctx"]) == 2, "컨텍스트별 제한 초과"
+    
+    service._add_to_index("ctx2", service._normalize([1.0, 0.0]), "key")
+    service._add_to_index("ctx3", service._normalize([1.0, 0.0]), "key")
+    assert "ctx" not in service._semantic_index, "LRU 제거 실패"
+    assert len(service._semantic_index) == 2
+    
+    print("✅ 의미 인덱스 크기 제한 확인")
+    print()
+
+
+async def test_entries_matrix():
+    """컨텍스트별 임베딩 행렬 저장소 테스트 (확장/제거 시 행-키 정합성)"""
+    print("=" * 60)
+    print("Test 5: 임베딩 행렬 저장소")
+    print("=" * 60)
+    
+    service = AnswerCacheService()
+    service.MAX_QUERIES_PER_CONTEXT = 6
+    
+    for i in range(8):
+        service._add_to_index("ctx", service._normalize([1.0, float(i)]), f"key{i}")
+    
+    entries = service._semantic_index["ctx"]
+    assert entries.keys == [f"key{i}" for i in range(2, 8)], "오래된 항목 제거 순서 오류"
+    
+    entries.remove(1)  # key3 제거
+    assert entries.keys == ["key2", "key4", "key5", "key6", "key7"]
+    
+    expected = np.stack([service._normalize([1.0, float(i)]) for i in (2, 4, 5, 6, 7)])
+    assert np.allclose(entries.vectors, expected), "행렬 행과 키가 어긋남"
+    
+    print("✅ 임베딩 행렬 저장소 확인")
+    print()
+
+
+def main():
+    """모든 테스트 실행"""
+    tests = [
+        ("정확 일치 키 생성", test_cache_key),
+        ("정확 일치 캐시", test_exact_match),
+        ("의미 캐시", test_semantic_match),
+        ("의미 인덱스 크기 제한", test_index_limit),
+        ("임베딩 행렬 저장소", test_entries_matrix),
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test_name, test_func in tests:
+        try:
+            asyncio.run(test_func())
+            passed += 1
+        except Exception as e:
+            print(f"❌ {test_name} 실패: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+    
+    print("=" * 60)
+    print(f"테스트 결과: {passed}개 통과, {failed}개 실패")
+    print("=" * 60)
+    
+    if failed == 0:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    else:
+        print(f"❌ {failed}개 테스트 실패")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
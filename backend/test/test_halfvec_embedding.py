@@ -0,0 +1,131 @@
+"""
+halfvec 임베딩 코덱/ORM 타입 테스트
+
+asyncpg halfvec 코덱이 디코딩한 값이 DocumentChunk ORM 조회를 거쳐
+네이티브 float32 배열로 반환되는지 검증합니다.
+"""
+import sys
+import os
+import sqlite3
+import logging
+from pathlib import Path
+
+import numpy as np
+from pgvector.asyncpg import HalfVector
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# 테스트 환경 설정
+os.environ["TESTING"] = "true"
+
+from core.database import _decode_halfvec
+from models.document import Document  # noqa: F401 (relationship 대상 매핑)
+from models.document_chunk import DocumentChunk
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(levelname)s - %(name)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def _sqlite_engine_with_halfvec_codec():
+    """
+    halfvec 코덱을 흉내 낸 SQLite 엔진 생성
+    (HALFVEC로 선언된 컬럼을 조회하면 asyncpg 코덱과 같은 _decode_halfvec 결과 반환)
+    """
+    sqlite3.register_converter("HALFVEC", _decode_halfvec)
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"detect_types": sqlite3.PARSE_DECLTYPES}
+    )
+    # 선언 타입으로 변환기가 적용되므로 embedding만 HALFVEC로 선언
+    # (TIMESTAMP는 sqlite3 기본 변환기가 적용되지 않도록 TEXT로 선언)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE document_chunks ("
+            "id INTEGER PRIMARY KEY, document_id INTEGER NOT NULL, chunk_index INTEGER NOT NULL, "
+            "chunk_type TEXT NOT NULL, page_number INTEGER, pdf_page_number INTEGER, "
+            "section_title TEXT, clause_number TEXT, content TEXT NOT NULL, content_hash TEXT, "
+            "token_count INTEGER, metadata TEXT, embedding HALFVEC, confidence_score REAL, "
+            "created_at TEXT)"
+        ))
+    return engine
+
+
+def test_decode_halfvec_native_float32():
+    """halfvec 바이너리 디코딩 결과가 네이티브 float32인지 테스트"""
+    print("=" * 60)
+    print("Test 1: halfvec 디코딩 (네이티브 float32)")
+    print("=" * 60)
+    
+    decoded = _decode_halfvec(HalfVector._to_db_binary([0.5, -1.25, 2.0]))
+    
+    assert isinstance(decoded, np.ndarray)
+    assert decoded.dtype == np.float32
+    assert decoded.dtype.isnative
+    assert decoded.tolist() == [0.5, -1.25, 2.0]
+    
+    print(f"✅ 디코딩 결과: {decoded.tolist()} ({decoded.dtype})")
+    print()
+
+
+def test_document_chunk_orm_load():
+    """코덱이 디코딩한 임베딩으로 DocumentChunk ORM 조회 테스트"""
+    print("=" * 60)
+    print("Test 2: DocumentChunk ORM 조회")
+    print("=" * 60)
+    
+    engine = _sqlite_engine_with_halfvec_codec()
+    embedding = [0.1 * i for i in range(8)]
+    
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO document_chunks (id, document_id, chunk_index, chunk_type, content, embedding) "
+                "VALUES (1, 1, 0, 'text', '제1조 목적', :embedding)"
+            ),
+            {"embedding": HalfVector._to_db_binary(embedding)}
+        )
+    
+    with Session(engine) as session:
+        chunk = session.get(DocumentChunk, 1)
+    
+    assert isinstance(chunk.embedding, np.ndarray)
+    assert chunk.embedding.dtype == np.float32
+    assert chunk.embedding.dtype.isnative
+    # FP16 저장이므로 근사값 비교
+    assert np.allclose(chunk.embedding, embedding, atol=1e-3)
+    
+    print(f"✅ 조회된 임베딩: dim={len(chunk.embedding)}, dtype={chunk.embedding.dtype}")
+    print()
+
+
+def test_document_chunk_text_value():
+    """코덱이 없는 연결(텍스트 형식) 결과 처리 테스트"""
+    print("=" * 60)
+    print("Test 3: 텍스트 형식 halfvec 결과 처리")
+    print("=" * 60)
+    
+    column_type = DocumentChunk.__table__.c.embedding.type
+    process = column_type.result_processor(None, None)
+    
+    value = process("[1,2.5,-3]")
+    
+    assert value.dtype == np.float32
+    assert value.tolist() == [1.0, 2.5, -3.0]
+    assert process(None) is None
+    
+    print(f"✅ 텍스트 결과 변환: {value.tolist()}")
+    print()
+
+
+if __name__ == "__main__":
+    test_decode_halfvec_native_float32()
+    test_document_chunk_orm_load()
+    test_document_chunk_text_value()
@@ -0,0 +1,137 @@
+"""
+PopularChunkService 테스트
+
+자주 검색되는 청크 집계와 컨텍스트 순서 재배치를 검증합니다.
+"""
+import sys
+import os
+import asyncio
+import logging
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# 테스트 환경 설정
+os.environ["TESTING"] = "true"
+
+from services.popular_chunks import PopularChunkService
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(levelname)s - %(name)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def _results(*chunk_ids):
+    """테스트용 검색 결과 생성"""
+    return [{"chunk_id": chunk_id, "content": f"chunk {chunk_id}"} for chunk_id in chunk_ids]
+
+
+async def test_no_snapshot():
+    """순위 스냅샷 전에는 순서 유지 테스트"""
+    print("=" * 60)
+    print("Test 1: 스냅샷 전 순서 유지")
+    print("=" * 60)
+    
+    service = PopularChunkService()
+    service.record([1, 2, 3])
+    
+    results = _results(3, 1, 2)
+    ordered, popular_count = service.order(results)
+    
+    assert ordered is results, "스냅샷 전인데 순서 변경"
+    assert popular_count == 0
+    
+    print("✅ 스냅샷 전 순서 유지 확인")
+    print()
+
+
+async def test_popular_first():
+    """인기 청크를 순위 순서로 앞에 배치 테스트"""
+    print("=" * 60)
+    print("Test 2: 인기 청크 우선 배치")
+    print("=" * 60)
+    
+    service = PopularChunkService()
+    service.TOP_K = 2
+    service.REFRESH_INTERVAL = 3
+    
+    service.record([10, 20])
+    service.record([10, 20])
+    service.record([10, 30])
+    
+    ordered, popular_count = service.order(_results(5, 20, 6, 10))
+    
+    assert [r["chunk_id"] for r in ordered] == [10, 20, 5, 6], "인기 순위 순서가 아님"
+    assert popular_count == 2
+    
+    print(f"✅ 재배치 결과: {[r['chunk_id'] for r in ordered]}")
+    print()
+
+
+async def test_snapshot_stable():
+    """순위 스냅샷은 갱신 주기에만 변경 테스트"""
+    print("=" * 60)
+    print("Test 3: 스냅샷 안정성")
+    print("=" * 60)
+    
+    service = PopularChunkService()
+    service.TOP_K = 1
+    service.REFRESH_INTERVAL = 2
+    
+    service.record([1])
+    service.record([1])
+    assert service.order(_results(2, 1))[1] == 1
+    
+    # 갱신 주기 전에는 집계가 바뀌어도 순위 유지 (prefix 고정)
+    service.record([2, 2, 2])
+    ordered, _ = service.order(_results(2, 1))
+    assert ordered[0]["chunk_id"] == 1, "갱신 주기 전에 순위 변경"
+    
+    service.record([2, 2, 2])
+    ordered, _ = service.order(_results(1, 2))
+    assert ordered[0]["chunk_id"] == 2, "갱신 주기 후 순위 미반영"
+    
+    print("✅ 스냅샷 안정성 확인")
+    print()
+
+
+def main():
+    """모든 테스트 실행"""
+    tests = [
+        ("스냅샷 전 순서 유지", test_no_snapshot),
+        ("인기 청크 우선 배치", test_popular_first),
+        ("스냅샷 안정성", test_snapshot_stable),
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test_name, test_func in tests:
+        try:
+            asyncio.run(test_func())
+            passed += 1
+        except Exception as e:
+            print(f"❌ {test_name} 실패: {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+    
+    print("=" * 60)
+    print(f"테스트 결과: {passed}개 통과, {failed}개 실패")
+    print("=" * 60)
+    
+    if failed == 0:
+        print("✅ 모든 테스트 통과!")
+        return 0
+    else:
+        print(f"❌ {failed}개 테스트 실패")
+        return 1
+
+
+if __name__ == "__main__":
+    exit(main())
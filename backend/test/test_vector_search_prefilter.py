@@ -0,0 +1,201 @@
+"""
+벡터 검색 이진 양자화 후보 추출 테스트
+
+해밍 거리 1차 후보 추출 서브쿼리에 활성 문서/문서 타입 필터가
+함께 적용되는지 (필터 검색 시 결과가 비지 않도록) 검증합니다.
+"""
+import sys
+import os
+import re
+import asyncio
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# 테스트 환경 설정
+os.environ["TESTING"] = "true"
+
+from services.vector_search import VectorSearchService
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(levelname)s - %(name)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class _RecordingSession:
+    """실행된 SQL과 파라미터를 기록하는 테스트용 세션"""
+    
+    def __init__(self):
+        self.sql = None
+        self.params = None
+        self.settings = []
+    
+    async def execute(self, statement, params=None):
+        if str(statement).startswith("SET LOCAL"):
+            self.settings.append(str(statement))
+            return self
+        self.sql = str(statement)
+        self.params = params
+        return self
+    
+    def fetchall(self):
+        return []
+
+
+class _HnswSession:
+    """
+    HNSW 인덱스 스캔을 흉내 내는 테스트용 세션
+    
+    해밍 거리 순으로 정렬된 청크 중 hnsw.ef_search개만 인덱스 스캔 결과로 반환한 뒤
+    필터를 적용합니다 (pgvector 인덱스 스캔 후 필터링 동작).
+    """
+    
+    DEFAULT_EF_SEARCH = 40
+    
+    def __init__(self, total_chunks: int, policy_every: int):
+        self.ef_search = self.DEFAULT_EF_SEARCH
+        # 해밍 거리 순서의 청크 (policy_every개마다 policy 문서)
+        self.chunks = [
+            {"id": idx, "document_type": "policy" if idx % policy_every == 0 else "faq"}
+            for idx in range(total_chunks)
+        ]
+        self.rows = []
+    
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        if sql.startswith("SET LOCAL hnsw.ef_search"):
+            self.ef_search = int(re.search(r"\d+", sql).group())
+            return self
+        
+        scanned = self.chunks[:self.ef_search]
+        candidates = [
+            chunk for chunk in scanned
+            if "document_type" not in params or chunk["document_type"] == params["document_type"]
+        ][:params["candidate_limit"]]
+        
+        self.rows = [
+            SimpleNamespace(
+                chunk_id=chunk["id"], document_id=1, content="", similarity=0.9,
+                chunk_type="text", page_number=None, section_title=None, clause_number=None,
+                metadata={}, document_filename="a.pdf", document_type=chunk["document_type"],
+                company_name=None
+            )
+            for chunk in candidates[:params["limit"]]
+        ]
+        return self
+    
+    def fetchall(self):
+        return self.rows
+
+
+def _search(**filters) -> _RecordingSession:
+    """_search_vectors를 실행하고 기록된 세션 반환"""
+    service = VectorSearchService(embedding_service=object())
+    session = _RecordingSession()
+    asyncio.run(service._search_vectors(
+        session,
+        query_embedding=[0.1, 0.2, 0.3],
+        threshold=0.7,
+        limit=5,
+        **filters
+    ))
+    return session
+
+
+def _candidate_subquery(sql: str) -> str:
+    """후보 추출 서브쿼리 부분만 추출"""
+    start = sql.index("AND c.id IN (")
+    end = sql.index("LIMIT :candidate_limit", start)
+    return sql[start:end]
+
+
+def test_prefilter_applies_document_type_filter():
+    """문서 타입 필터 검색 시 후보 추출에도 필터 적용 테스트"""
+    print("=" * 60)
+    print("Test 1: 문서 타입 필터 + 후보 추출")
+    print("=" * 60)
+    
+    session = _search(document_type="policy")
+    subquery = _candidate_subquery(session.sql)
+    
+    assert "binary_quantize" in subquery
+    assert "d.status = 'active'" in subquery
+    assert "d.document_type = :document_type" in subquery
+    assert session.params["document_type"] == "policy"
+    assert session.params["candidate_limit"] == VectorSearchService.BQ_CANDIDATES
+    assert session.settings == [f"SET LOCAL hnsw.ef_search = {VectorSearchService.BQ_CANDIDATES}"]
+    
+    print("✅ 후보 서브쿼리에 활성 문서/문서 타입 필터 적용")
+    print()
+
+
+def test_prefilter_applies_active_status_without_filters():
+    """필터 없는 검색도 활성 문서에서만 후보 추출 테스트"""
+    print("=" * 60)
+    print("Test 2: 필터 없음 + 후보 추출")
+    print("=" * 60)
+    
+    session = _search()
+    subquery = _candidate_subquery(session.sql)
+    
+    assert "d.status = 'active'" in subquery
+    assert "document_type" not in subquery
+    
+    print("✅ 후보 서브쿼리에 활성 문서 필터 적용")
+    print()
+
+
+def test_clause_filter_skips_prefilter():
+    """조항 번호 필터 검색은 후보 추출 없이 정밀 검색 테스트"""
+    print("=" * 60)
+    print("Test 3: 조항 번호 필터 (후보 추출 생략)")
+    print("=" * 60)
+    
+    session = _search(clause_number="제15조")
+    
+    assert "binary_quantize" not in session.sql
+    assert "candidate_limit" not in session.params
+    assert session.settings == []
+    assert session.params["clause_number"] == "제15조"
+    
+    print("✅ 조항 번호 필터 검색은 전체 정밀 검색")
+    print()
+
+
+def test_filtered_search_returns_limit_rows():
+    """필터 검색도 후보 부족 없이 limit개 결과 반환 테스트"""
+    print("=" * 60)
+    print("Test 4: 필터 검색 결과 수 (hnsw.ef_search 상향)")
+    print("=" * 60)
+    
+    # 200개 중 20개마다 policy → 기본 ef_search(40)로는 policy 2개만 후보에 포함
+    session = _HnswSession(total_chunks=200, policy_every=20)
+    service = VectorSearchService(embedding_service=object())
+    
+    results = asyncio.run(service._search_vectors(
+        session,
+        query_embedding=[0.1, 0.2, 0.3],
+        threshold=0.7,
+        limit=5,
+        document_type="policy"
+    ))
+    
+    assert len(results) == 5
+    assert all(result.document_type == "policy" for result in results)
+    
+    print(f"✅ 필터 검색 결과: {len(results)}개 (ef_search={session.ef_search})")
+    print()
+
+
+if __name__ == "__main__":
+    test_prefilter_applies_document_type_filter()
+    test_prefilter_applies_active_status_without_filters()
+    test_clause_filter_skips_prefilter()
+    test_filtered_search_returns_limit_rows()